@@ -6,7 +6,7 @@ from app.auth.schemas.request import LoginInput, RegisterInput
 from app.database import get_db
 from app.user.models import User
 from lib.jwt.manager import JWTManager
-from lib.utils import PWD_CONTEXT
+from lib.utils import PASSWORD_HASHER
 
 AUTH_ROUTER: APIRouter = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -22,12 +22,20 @@ async def login(body: LoginInput, db: AsyncSession = Depends(get_db)) -> dict:
             detail="Incorrect email or password",
         )
 
-    if not PWD_CONTEXT.verify(body.password, persisted_user.password):
+    verified, new_hash = await PASSWORD_HASHER.verify_and_update(
+        body.password, persisted_user.password
+    )
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password",
         )
 
+    if new_hash is not None:
+        persisted_user.password = new_hash
+        await db.commit()
+
     access_token: str = JWTManager.generate_token(data={"sub": str(persisted_user.id)})
 
     return {"access_token": access_token}
@@ -45,7 +53,9 @@ async def register(body: RegisterInput, db: AsyncSession = Depends(get_db)) -> d
         )
 
     user: User = User(
-        name=body.name, email=body.email, password=PWD_CONTEXT.hash(body.password)
+        name=body.name,
+        email=body.email,
+        password=await PASSWORD_HASHER.hash(body.password),
     )
     db.add(user)
     await db.commit()
@@ -8,3 +8,55 @@ ALGORITHM: str = os.getenv(key="ALGORITHM", default="HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES: str = os.getenv(
     key="ACCESS_TOKEN_EXPIRE_MINUTES", default="30"
 )
+MATCH_FEED_ENABLED: str = os.getenv(key="MATCH_FEED_ENABLED", default="true")
+MATCH_FEED_MAX_USERS: str = os.getenv(key="MATCH_FEED_MAX_USERS", default="1000")
+MATCH_FEED_TTL_SECONDS: str = os.getenv(key="MATCH_FEED_TTL_SECONDS", default="60")
+MATCH_FEED_WINDOW: str = os.getenv(key="MATCH_FEED_WINDOW", default="200")
+BCRYPT_ROUNDS: str = os.getenv(key="BCRYPT_ROUNDS", default="12")
+PASSWORD_HASH_WORKERS: str = os.getenv(key="PASSWORD_HASH_WORKERS", default="4")
+TOKEN_CACHE_MAX_SIZE: str = os.getenv(key="TOKEN_CACHE_MAX_SIZE", default="10000")
+TOKEN_CACHE_TTL_SECONDS: str = os.getenv(key="TOKEN_CACHE_TTL_SECONDS", default="300")
+DB_POOL_SIZE: str = os.getenv(key="DB_POOL_SIZE", default="10")
+DB_MAX_OVERFLOW: str = os.getenv(key="DB_MAX_OVERFLOW", default="20")
+DB_POOL_TIMEOUT: str = os.getenv(key="DB_POOL_TIMEOUT", default="30")
+DB_POOL_RECYCLE: str = os.getenv(key="DB_POOL_RECYCLE", default="1800")
+DB_POOL_PRE_PING: str = os.getenv(key="DB_POOL_PRE_PING", default="true")
+DB_STATEMENT_CACHE_SIZE: str = os.getenv(key="DB_STATEMENT_CACHE_SIZE", default="100")
+DB_JIT: str = os.getenv(key="DB_JIT", default="off")
+DB_APPLICATION_NAME: str = os.getenv(key="DB_APPLICATION_NAME", default="vee")
+DB_PGBOUNCER: str = os.getenv(key="DB_PGBOUNCER", default="false")
+DATABASE_REPLICA_URLS: str = os.getenv(key="DATABASE_REPLICA_URLS", default="")
+DB_REPLICA_STRATEGY: str = os.getenv(key="DB_REPLICA_STRATEGY", default="round_robin")
+READ_YOUR_WRITES_SECONDS: str = os.getenv(key="READ_YOUR_WRITES_SECONDS", default="5")
+READ_YOUR_WRITES_MAX_USERS: str = os.getenv(
+    key="READ_YOUR_WRITES_MAX_USERS", default="10000"
+)
+RESPONSE_CACHE_BACKEND: str = os.getenv(key="RESPONSE_CACHE_BACKEND", default="memory")
+RESPONSE_CACHE_MAX_SIZE: str = os.getenv(key="RESPONSE_CACHE_MAX_SIZE", default="1000")
+RESPONSE_CACHE_TTL_SECONDS: str = os.getenv(
+    key="RESPONSE_CACHE_TTL_SECONDS", default="30"
+)
+REDIS_URL: str = os.getenv(key="REDIS_URL", default="redis://cache:6379/0")
+GRAPHQL_DOCUMENT_CACHE_SIZE: str = os.getenv(
+    key="GRAPHQL_DOCUMENT_CACHE_SIZE", default="1000"
+)
+PERSISTED_QUERIES_MODE: str = os.getenv(key="PERSISTED_QUERIES_MODE", default="apq")
+PERSISTED_QUERIES_DIR: str = os.getenv(key="PERSISTED_QUERIES_DIR", default="")
+PERSISTED_QUERIES_MAX_SIZE: str = os.getenv(
+    key="PERSISTED_QUERIES_MAX_SIZE", default="1000"
+)
+GRAPHQL_MAX_DEPTH: str = os.getenv(key="GRAPHQL_MAX_DEPTH", default="8")
+GRAPHQL_MAX_COST: str = os.getenv(key="GRAPHQL_MAX_COST", default="10000")
+MAX_PAGE_SIZE: str = os.getenv(key="MAX_PAGE_SIZE", default="100")
+MAX_BATCH_SIZE: str = os.getenv(key="MAX_BATCH_SIZE", default="1000")
+EXPORT_BATCH_SIZE: str = os.getenv(key="EXPORT_BATCH_SIZE", default="1000")
+GRAPHQL_PROFILING: str = os.getenv(key="GRAPHQL_PROFILING", default="false")
+GRAPHQL_PROFILE_HEADER: str = os.getenv(
+    key="GRAPHQL_PROFILE_HEADER", default="x-debug-profile"
+)
+N_PLUS_ONE_THRESHOLD: str = os.getenv(key="N_PLUS_ONE_THRESHOLD", default="5")
+# The schema is owned by the migrations, create_all is for throwaway databases.
+DB_CREATE_ALL: str = os.getenv(key="DB_CREATE_ALL", default="false")
+PROMETHEUS_MULTIPROC_DIR: str = os.getenv(key="PROMETHEUS_MULTIPROC_DIR", default="")
+METRICS_MAX_OPERATIONS: str = os.getenv(key="METRICS_MAX_OPERATIONS", default="100")
+METRICS_REFRESH_SECONDS: str = os.getenv(key="METRICS_REFRESH_SECONDS", default="5")
@@ -1,11 +1,105 @@
-from typing import AsyncGenerator
+from itertools import cycle
+from typing import Any, AsyncGenerator, Iterator
+from uuid import UUID, uuid4
+
+from fastapi.requests import Request
+from sqlalchemy import DDL, Engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base
+
+from app.config import (
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+    DB_APPLICATION_NAME,
+    DB_JIT,
+    DB_MAX_OVERFLOW,
+    DB_PGBOUNCER,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_REPLICA_STRATEGY,
+    DB_STATEMENT_CACHE_SIZE,
+    READ_YOUR_WRITES_MAX_USERS,
+    READ_YOUR_WRITES_SECONDS,
+)
+from lib.jwt.bearer import authenticate
+from lib.pool import InstrumentedPool
+from lib.response_cache import CacheBackend, get_cache_backend
+
+
+def connect_args() -> dict[str, Any]:
+    if DB_PGBOUNCER == "true":
+        # Transaction pooling hands each transaction a different server
+        # connection, so named prepared statements cannot be reused. PgBouncer
+        # also rejects unknown startup parameters such as jit.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            "server_settings": {"application_name": DB_APPLICATION_NAME},
+        }
+
+    return {
+        "statement_cache_size": int(DB_STATEMENT_CACHE_SIZE),
+        "prepared_statement_cache_size": int(DB_STATEMENT_CACHE_SIZE),
+        "server_settings": {"application_name": DB_APPLICATION_NAME, "jit": DB_JIT},
+    }
+
+
+def create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedPool,
+        pool_size=int(DB_POOL_SIZE),
+        max_overflow=int(DB_MAX_OVERFLOW),
+        pool_timeout=float(DB_POOL_TIMEOUT),
+        pool_recycle=int(DB_POOL_RECYCLE),
+        pool_pre_ping=DB_POOL_PRE_PING == "true",
+        connect_args=connect_args(),
+    )
+
+
+engine: AsyncEngine = create_engine(DATABASE_URL)
+replica_engines: list[AsyncEngine] = [
+    create_engine(url.strip())
+    for url in DATABASE_REPLICA_URLS.split(",")
+    if url.strip()
+]
+_replica_cycle: Iterator[AsyncEngine] = cycle(replica_engines)
+# Users who wrote within READ_YOUR_WRITES_SECONDS. Kept apart from the response
+# cache so cached responses never evict a mark, in redis when the cache is.
+RECENT_WRITERS: CacheBackend = get_cache_backend(
+    maxsize=int(READ_YOUR_WRITES_MAX_USERS), prefix="recent_writer:"
+)
+
+
+async def mark_write(user_id: UUID) -> None:
+    """Keeps the user's reads on the primary for READ_YOUR_WRITES_SECONDS."""
+    await RECENT_WRITERS.set(str(user_id), b"1", ttl=float(READ_YOUR_WRITES_SECONDS))
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
 
-from app.config import DATABASE_URL
+async def choose_read_engine(user_id: UUID | None) -> AsyncEngine:
+    if not replica_engines:
+        return engine
+    if user_id is not None and await RECENT_WRITERS.get(str(user_id)) is not None:
+        return engine
+    if DB_REPLICA_STRATEGY == "least_connections":
+        return min(replica_engines, key=lambda replica: replica.pool.checkedout())
+    return next(_replica_cycle)
+
+
+class ReadSession(Session):
+    """Reads through the engine get_read_db picked for the request."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        return self.info["bind"]
 
-engine = create_async_engine(DATABASE_URL)
 
 async_session = async_sessionmaker(  # type: ignore
     bind=engine,
@@ -14,8 +108,26 @@ async_session = async_sessionmaker(  # type: ignore
     autocommit=False,
     autoflush=False,
 )
+# Query fields only read, BEGIN READ ONLY lets Postgres skip write bookkeeping.
+async_read_session = async_sessionmaker(  # type: ignore
+    class_=AsyncSession,
+    sync_session_class=ReadSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
 
 Base = declarative_base()
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
+def pool_stats() -> dict:
+    return {
+        "primary": engine.pool.stats(),
+        "replicas": [replica.pool.stats() for replica in replica_engines],
+    }
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -27,3 +139,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    read_engine: AsyncEngine = engine
+    if replica_engines:
+        read_engine = await choose_read_engine(authenticate(request))
+    # Sessions only check out a connection and BEGIN on their first statement,
+    # requests that never reach a resolver do not touch the pool.
+    bind: Engine = read_engine.sync_engine.execution_options(postgresql_readonly=True)
+    async with async_read_session(info={"bind": bind}) as session:
+        yield session
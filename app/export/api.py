@@ -0,0 +1,86 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import EXPORT_BATCH_SIZE
+from app.database import get_read_db
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from lib.export import MEDIA_TYPES, ExportFormatEnum, stream_rows
+from lib.graphql import QueryInput, SearchModeEnum
+from lib.jwt.bearer import require_user
+from lib.search import search
+
+SearchMode = Literal["CONTAINS", "SIMILAR"]
+
+EXPORT_ROUTER: APIRouter = APIRouter(
+    prefix="/export", tags=["Export"], dependencies=[Depends(require_user)]
+)
+
+
+def export_response(
+    db: AsyncSession, query: Select, export_format: ExportFormatEnum, name: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(
+            db=db,
+            query=query,
+            export_format=export_format,
+            batch_size=int(EXPORT_BATCH_SIZE),
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'
+        },
+    )
+
+
+@EXPORT_ROUTER.get("/grants", response_class=StreamingResponse)
+async def export_grants(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format"),
+    search_term: str | None = Query(None, alias="search"),
+    search_mode: SearchMode = "CONTAINS",
+    ignore_case: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    query: Select = search(
+        query=select(*Grant.__table__.columns).order_by(Grant.created_at, Grant.id),
+        columns=[Grant.name, Grant.location, Grant.area],
+        query_input=QueryInput(
+            search=search_term,
+            search_mode=SearchModeEnum[search_mode],
+            ignore_case=ignore_case,
+        ),
+    )
+
+    return export_response(
+        db=db, query=query, export_format=export_format, name="grants"
+    )
+
+
+@EXPORT_ROUTER.get("/grant_feedbacks", response_class=StreamingResponse)
+async def export_grant_feedbacks(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format"),
+    search_term: str | None = Query(None, alias="search"),
+    search_mode: SearchMode = "CONTAINS",
+    ignore_case: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    query: Select = search(
+        query=select(*GrantFeedback.__table__.columns).order_by(
+            GrantFeedback.created_at, GrantFeedback.id
+        ),
+        columns=[GrantFeedback.comment],
+        query_input=QueryInput(
+            search=search_term,
+            search_mode=SearchModeEnum[search_mode],
+            ignore_case=ignore_case,
+        ),
+    )
+
+    return export_response(
+        db=db, query=query, export_format=export_format, name="grant_feedbacks"
+    )
@@ -0,0 +1,157 @@
+from typing import AsyncIterator
+from uuid import UUID
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    print_ast,
+)
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from app.database import mark_write
+from app.loaders import get_loaders
+from lib.jwt.bearer import authenticate
+from lib.response_cache import RESPONSE_CACHE
+
+GRANT_TAGS: frozenset[str] = frozenset({"grant"})
+FOUNDATION_TAGS: frozenset[str] = frozenset({"foundation", "grant"})
+GRANT_FEEDBACK_TAGS: frozenset[str] = frozenset({"grant_feedback"})
+# The user's feedback decides which grants the feeds return.
+GRANT_FEED_TAGS: frozenset[str] = frozenset({"grant", "grant_feedback"})
+
+# Root query field -> (entity tags its result can expose, scoped per user). A
+# selection reaching Grant.feedbacks exposes grant_feedback as well.
+CACHED_FIELDS: dict[str, tuple[frozenset[str], bool]] = {
+    "grants": (GRANT_TAGS, False),
+    "grantById": (GRANT_TAGS, False),
+    "grantMatches": (GRANT_FEED_TAGS, True),
+    "grantOpportunities": (GRANT_FEED_TAGS, True),
+    "foundations": (FOUNDATION_TAGS, False),
+    "foundationById": (FOUNDATION_TAGS, False),
+    "grantFeedbacks": (GRANT_FEEDBACK_TAGS, False),
+    "grantFeedbackById": (GRANT_FEEDBACK_TAGS, False),
+}
+
+
+def _selects(
+    node: FieldNode | FragmentDefinitionNode | InlineFragmentNode,
+    name: str,
+    fragments: dict[str, FragmentDefinitionNode],
+) -> bool:
+    """Whether a field named `name` appears anywhere under `node`."""
+    if node.selection_set is None:
+        return False
+
+    for selection in node.selection_set.selections:
+        if isinstance(selection, FragmentSpreadNode):
+            fragment: FragmentDefinitionNode | None = fragments.get(
+                selection.name.value
+            )
+            if fragment is not None and _selects(fragment, name, fragments):
+                return True
+        elif (
+            isinstance(selection, FieldNode) and selection.name.value == name
+        ) or _selects(selection, name, fragments):
+            return True
+
+    return False
+
+
+class ReadYourWrites(SchemaExtension):
+    """
+    Keeps a user's reads on the primary for a short window after a mutation.
+
+    The user is marked before resolving, so a read racing the commit already goes
+    to the primary, and again afterwards so the window starts at the commit. The
+    mutation's own nested fields load through its session on the primary.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        user_id: UUID | None = None
+        if self.execution_context.operation_type == OperationType.MUTATION:
+            context: dict = self.execution_context.context
+            context["loaders"] = get_loaders(context["db"])
+            user_id = authenticate(context["request"])
+            if user_id is not None:
+                await mark_write(user_id)
+
+        yield
+
+        if user_id is not None:
+            await mark_write(user_id)
+
+
+class ResponseCaching(SchemaExtension):
+    """
+    Serves repeated query documents from RESPONSE_CACHE without running resolvers.
+
+    Only operations made of CACHED_FIELDS are cached, and only for authenticated
+    requests since every one of those fields requires it.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        key: str | None = await self._key()
+        data: dict | None = None
+        if key is not None:
+            data = await RESPONSE_CACHE.get(key)
+            if data is not None:
+                self.execution_context.result = ExecutionResult(data=data)
+
+        yield
+
+        result = self.execution_context.result
+        if key is not None and data is None and result and not result.errors:
+            await RESPONSE_CACHE.set(key, result.data)
+
+    async def _key(self) -> str | None:
+        execution_context = self.execution_context
+        if (
+            not RESPONSE_CACHE.enabled
+            or execution_context.result is not None
+            or execution_context.operation_type != OperationType.QUERY
+            or execution_context.graphql_document is None
+        ):
+            return None
+
+        operation: OperationDefinitionNode | None = get_operation_ast(
+            execution_context.graphql_document, execution_context.operation_name
+        )
+        if operation is None:
+            return None
+
+        fragments: dict[str, FragmentDefinitionNode] = {
+            definition.name.value: definition
+            for definition in execution_context.graphql_document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        tags: set[str] = set()
+        per_user: bool = False
+        for selection in operation.selection_set.selections:
+            if (
+                not isinstance(selection, FieldNode)
+                or selection.name.value not in CACHED_FIELDS
+            ):
+                return None
+            field_tags, field_per_user = CACHED_FIELDS[selection.name.value]
+            tags |= field_tags
+            if _selects(selection, "feedbacks", fragments):
+                tags.add("grant_feedback")
+            per_user = per_user or field_per_user
+
+        user_id: UUID | None = authenticate(execution_context.context["request"])
+        if user_id is None:
+            return None
+
+        return await RESPONSE_CACHE.key(
+            document=print_ast(execution_context.graphql_document),
+            variables=execution_context.variables,
+            operation_name=execution_context.operation_name,
+            tags=tags,
+            scope=str(user_id) if per_user else None,
+        )
@@ -1,7 +0,0 @@
-from app.foundation.mutations import FoundationMutation
-from app.foundation.queries import FoundationQuery
-
-__all__ = [
-    "FoundationQuery",
-    "FoundationMutation",
-]
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.foundation.types import FoundationInput
-from lib.sqlalchemy import BaseModel
+from lib.sqlalchemy import BaseModel, trigram_index
 
 if TYPE_CHECKING:
     from app.grant.models import Grant
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 
 class Foundation(Base, BaseModel):
     __tablename__ = "foundations"
+    __table_args__ = (trigram_index("foundations", "name"),)
 
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     logo_url: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -24,8 +25,6 @@ class Foundation(Base, BaseModel):
         overlaps="foundations",
     )
 
-    def merge(self, foundation: FoundationInput) -> Foundation:
-        self.name = foundation.name
-        self.logo_url = foundation.logo_url
-
-        return self
+    @staticmethod
+    def update_values(foundation: FoundationInput) -> dict:
+        return {"name": foundation.name, "logo_url": foundation.logo_url}
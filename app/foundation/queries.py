@@ -1,15 +1,15 @@
 import strawberry
-from fastapi_pagination import Page
 
 from app.foundation.models import Foundation
 from app.foundation.resolvers import QueryResolver
-from app.foundation.types import FoundationType, PageType
+from app.foundation.types import FoundationType
+from lib.graphql import PageType
 from lib.jwt.bearer import Authenticate
 
 
 @strawberry.type
 class FoundationQuery:
-    foundations: Page = strawberry.field(
+    foundations: PageType = strawberry.field(
         permission_classes=[Authenticate],
         graphql_type=PageType[FoundationType],
         resolver=QueryResolver.get_foundations,
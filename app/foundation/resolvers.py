@@ -1,56 +1,60 @@
 from uuid import UUID
 
 import strawberry
-from fastapi_pagination import Page, Params
-from fastapi_pagination.ext.sqlalchemy import apaginate
-from sqlalchemy import Select, or_, select
+from sqlalchemy import (
+    CTE,
+    Delete,
+    Row,
+    Select,
+    Update,
+    delete,
+    func,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 from strawberry.exceptions import GraphQLError
 
 from app.foundation.models import Foundation
 from app.foundation.types import FoundationInput
+from app.grant.feed import GRANT_MATCH_FEED
 from app.grant.models import Grant
-from lib.graphql import QueryInput
+from lib.graphql import PageType, QueryInput
+from lib.pagination import paginate
+from lib.query_planner import plan_options
+from lib.response_cache import RESPONSE_CACHE
+from lib.search import search
 
 
 class QueryResolver:
     @staticmethod
-    async def get_foundations(info: strawberry.Info, query_input: QueryInput) -> Page:
-        db: AsyncSession = info.context["db"]
-
-        filters: list = []
-        if query_input.search:
-            filters += [or_(Foundation.name.contains(query_input.search))]
-
-        query: Select = (
-            select(Foundation)
-            .filter(*filters)
-            .options(joinedload(Foundation.grants).joinedload(Grant.feedbacks))
-        )
-
-        page: Page = await apaginate(
-            conn=db,
-            query=query,
-            params=Params(
-                page=query_input.pagination.page, size=query_input.pagination.size
+    async def get_foundations(
+        info: strawberry.Info, query_input: QueryInput
+    ) -> PageType:
+        db: AsyncSession = info.context["read_db"]
+
+        query: Select = search(
+            query=select(Foundation).options(
+                *plan_options(info, Foundation, path=["items"])
             ),
+            columns=[Foundation.name],
+            query_input=query_input,
         )
 
-        return page
+        return await paginate(
+            db=db, query=query, query_input=query_input, model=Foundation
+        )
 
     @staticmethod
     async def get_foundation_by_id(info: strawberry.Info, id: UUID) -> Foundation:
-        db: AsyncSession = info.context["db"]
+        db: AsyncSession = info.context["read_db"]
 
         query: Select = (
             select(Foundation)
             .filter(Foundation.id == id)
-            .options(joinedload(Foundation.grants).joinedload(Grant.feedbacks))
-        )
-        foundation: Foundation | None = (
-            (await db.execute(query)).unique().scalar_one_or_none()
+            .options(*plan_options(info, Foundation))
         )
+        foundation: Foundation | None = (await db.execute(query)).scalar_one_or_none()
 
         if foundation is None:
             raise GraphQLError("Foundation ID Not found!")
@@ -70,6 +74,7 @@ class MutationResolver:
         )
         db.add(foundation)
         await db.commit()
+        await RESPONSE_CACHE.invalidate("foundation")
 
         return foundation
 
@@ -79,14 +84,20 @@ class MutationResolver:
     ) -> Foundation:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(Foundation).where(Foundation.id == foundation_id)
-        foundation: Foundation | None = (await db.execute(query)).scalar_one_or_none()
+        query: Update = (
+            update(Foundation)
+            .where(Foundation.id == foundation_id)
+            .values(**Foundation.update_values(foundation=foundation_input))
+            .returning(Foundation)
+            .execution_options(populate_existing=True)
+        )
+        foundation: Foundation | None = (await db.scalars(query)).one_or_none()
 
         if foundation is None:
             raise GraphQLError("Foundation ID Not found!")
 
-        foundation.merge(foundation=foundation_input)
         await db.commit()
+        await RESPONSE_CACHE.invalidate("foundation")
 
         return foundation
 
@@ -94,11 +105,29 @@ class MutationResolver:
     async def delete_foundation(info: strawberry.Info, foundation_id: UUID) -> None:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(Foundation).where(Foundation.id == foundation_id)
-        foundation: Foundation | None = (await db.execute(query)).scalar_one_or_none()
+        # Feedback goes with the grants through the ON DELETE CASCADE foreign
+        # key, the session never loads or tracks any of them. The grants are
+        # deleted in a CTE of the same statement to return their ids.
+        deleted_grants: CTE = (
+            delete(Grant)
+            .where(Grant.foundation_id == foundation_id)
+            .returning(Grant.id)
+            .cte("deleted_grants")
+        )
+        delete_query: Delete = (
+            delete(Foundation)
+            .where(Foundation.id == foundation_id)
+            .returning(
+                Foundation.id,
+                select(func.array_agg(deleted_grants.c.id)).scalar_subquery(),
+            )
+            .add_cte(deleted_grants)
+        )
+        deleted: Row | None = (await db.execute(delete_query)).one_or_none()
 
-        if foundation is None:
+        if deleted is None:
             return
 
-        await db.delete(foundation)
         await db.commit()
+        GRANT_MATCH_FEED.remove_grants(grant_ids=deleted[1] or [])
+        await RESPONSE_CACHE.invalidate("foundation", "grant", "grant_feedback")
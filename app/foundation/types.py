@@ -1,21 +1,14 @@
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import List, Optional
 from uuid import UUID
 
 import strawberry
 
+from app.config import MAX_PAGE_SIZE
+from app.grant.models import Grant
 from app.grant.types import GrantType
-
-T = TypeVar("T")
-
-
-@strawberry.type
-class PageType(Generic[T]):
-    items: List[T]
-    total: int
-    page: int
-    size: int
-    pages: int
+from lib.pagination import check_page_size
+from lib.query_planner import plan_columns
 
 
 @strawberry.type(name="Foundation")
@@ -25,7 +18,18 @@ class FoundationType:
     updated_at: datetime
     name: str
     logo_url: Optional[str] = None
-    grants: List[GrantType] = strawberry.field(default_factory=list)
+
+    @strawberry.field
+    async def grants(
+        self, info: strawberry.Info, first: Optional[int] = None
+    ) -> List[GrantType]:
+        # Without `first` the list holds up to MAX_PAGE_SIZE rows, which is what
+        # the query cost charges for it.
+        first = int(MAX_PAGE_SIZE) if first is None else first
+        check_page_size(first)
+        return await info.context["loaders"]["grants"].load(
+            (self.id, first, plan_columns(info, Grant))
+        )
 
 
 @strawberry.input
@@ -1,7 +0,0 @@
-from app.grant.mutations import GrantMutation
-from app.grant.queries import GrantQuery
-
-__all__ = [
-    "GrantQuery",
-    "GrantMutation",
-]
@@ -0,0 +1,336 @@
+import math
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any, Iterable, Iterator
+from uuid import UUID
+
+from sqlalchemy import Exists, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.exceptions import GraphQLError
+
+from app.config import (
+    MATCH_FEED_MAX_USERS,
+    MATCH_FEED_TTL_SECONDS,
+    MATCH_FEED_WINDOW,
+)
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from lib.cache import LRUCache
+from lib.graphql import PageType, PaginationInput, QueryInput
+from lib.pagination import (
+    check_page,
+    check_page_size,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+from lib.sqlalchemy import any_of
+
+Key = tuple[datetime, UUID]
+
+
+def unseen_grants_query(user_id: UUID) -> Select:
+    """Anti-join served by the unique (user_id, grant_id) feedback index."""
+    seen: Exists = (
+        select(GrantFeedback.id)
+        .where(GrantFeedback.user_id == user_id, GrantFeedback.grant_id == Grant.id)
+        .exists()
+    )
+
+    return select(Grant).where(~seen).order_by(Grant.created_at, Grant.id)
+
+
+def grant_key(created_at: datetime, id: UUID) -> Key:
+    # Naive datetimes are stored as local time by asyncpg, normalize to UTC.
+    return created_at.astimezone(UTC), id
+
+
+class UserFeed:
+    """
+    The first unseen keys of one user, at most `window` of them.
+
+    `complete` means no unseen grant sorts after the last key, `total` is the
+    number of unseen grants once counted and None while unknown.
+    """
+
+    def __init__(self, keys: list[Key], complete: bool, window: int) -> None:
+        self.keys: list[Key] = keys
+        self.keys_by_id: dict[UUID, Key] = {key[1]: key for key in keys}
+        self.complete: bool = complete
+        self.window: int = window
+        self.total: int | None = len(keys) if complete else None
+
+    def extend(self, keys: list[Key], complete: bool) -> None:
+        for key in keys:
+            if key[1] not in self.keys_by_id and (not self.keys or key > self.keys[-1]):
+                self.keys.append(key)
+                self.keys_by_id[key[1]] = key
+        self.complete = complete
+
+    def add(self, key: Key) -> None:
+        """A new grant, unseen by everyone."""
+        if key[1] in self.keys_by_id:
+            return
+        if self.total is not None:
+            self.total += 1
+        if self.complete or (self.keys and key < self.keys[-1]):
+            insort(self.keys, key)
+            self.keys_by_id[key[1]] = key
+            if len(self.keys) > self.window:
+                del self.keys_by_id[self.keys.pop()[1]]
+                self.complete = False
+
+    def remove(self, grant_id: UUID, seen: bool = False) -> None:
+        """Drops a grant the user has `seen`, or that no longer exists."""
+        key: Key | None = self.keys_by_id.pop(grant_id, None)
+        if key is not None:
+            del self.keys[bisect_left(self.keys, key)]
+        if self.total is not None:
+            if key is not None or seen:
+                self.total -= 1
+            elif not self.complete:
+                # Past the window, it may or may not have been unseen.
+                self.total = None
+
+    def remove_all(self, grant_ids: set[UUID]) -> None:
+        """Drops grants that no longer exist, in one pass over the window."""
+        removed: int = 0
+        if not self.keys_by_id.keys().isdisjoint(grant_ids):
+            self.keys = [key for key in self.keys if key[1] not in grant_ids]
+            removed = len(self.keys_by_id) - len(self.keys)
+            self.keys_by_id = {key[1]: key for key in self.keys}
+        if self.total is not None:
+            if self.complete or removed == len(grant_ids):
+                self.total -= removed
+            else:
+                # Some are past the window, they may or may not have been unseen.
+                self.total = None
+
+
+class _Loading:
+    """Writes to a user's feed that land while its keys are being queried."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.seen: set[UUID] = set()
+        self.stale: bool = False
+
+
+class GrantMatchFeed:
+    """
+    A window over the ordered (created_at, id) keys of the grants each user has
+    not reacted to yet.
+
+    Windows are filled with the keyset anti-join on a miss, refilled from their
+    last key once swipes drain them below half, and kept in sync by the grant
+    and grant feedback mutations, so a page inside the window costs O(page
+    size) and memory is bounded by MATCH_FEED_MAX_USERS * MATCH_FEED_WINDOW.
+    Pages past the window and backward cursors go to the anti-join directly.
+
+    Feeds are per process. The grants of a page are fetched through the
+    anti-join, so one swiped on another worker is dropped from the window on
+    the next read. Grants created on another worker show up on the next refill
+    or after MATCH_FEED_TTL_SECONDS.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, window: int) -> None:
+        self.window: int = window
+        self._feeds: LRUCache[UUID, UserFeed] = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._loading: dict[UUID, _Loading] = {}
+
+    async def page(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        query_input: QueryInput,
+        options: list[Any],
+    ) -> PageType:
+        cursor = query_input.cursor
+        pagination: PaginationInput = query_input.pagination or PaginationInput()
+        if cursor is not None:
+            if cursor.after and cursor.before:
+                raise GraphQLError("Only one of after/before can be set!")
+            size: int = cursor.size
+        else:
+            size = pagination.size
+            check_page(pagination.page)
+        check_page_size(size)
+
+        feed: UserFeed | None = None
+        if cursor is None or not cursor.before:
+            feed = await self._get(db=db, user_id=user_id)
+            start: int = (pagination.page - 1) * size
+            if cursor is not None:
+                start = (
+                    bisect_right(feed.keys, grant_key(*decode_cursor(cursor.after)))
+                    if cursor.after
+                    else 0
+                )
+            end: int = start + size
+        if feed is None or (end > len(feed.keys) and not feed.complete):
+            query: Select = unseen_grants_query(user_id=user_id).options(*options)
+            return await paginate(
+                db=db, query=query, query_input=query_input, model=Grant
+            )
+
+        window: list[Key] = feed.keys[start:end]
+        has_more: bool = end < len(feed.keys) or not feed.complete
+        grants_by_id: dict[UUID, Grant] = {}
+        if window:
+            query = (
+                unseen_grants_query(user_id=user_id)
+                .where(any_of(Grant.id, [id for _, id in window]))
+                .options(*options)
+            )
+            grants_by_id = {
+                grant.id: grant for grant in (await db.execute(query)).scalars()
+            }
+            missing: list[UUID] = [id for _, id in window if id not in grants_by_id]
+            if missing:
+                # Seen or deleted through another worker, the count may or may
+                # not include them already.
+                for id in missing:
+                    feed.remove(id)
+                feed.total = len(feed.keys) if feed.complete else None
+
+        after: str | None = None
+        before: str | None = None
+        total: int | None = None
+        page: int | None = None
+        if cursor is not None:
+            if window and has_more:
+                after = encode_cursor(*window[-1])
+            if window and start > 0:
+                before = encode_cursor(*window[0])
+            if cursor.include_total:
+                total = await self._total(db=db, user_id=user_id, feed=feed)
+        else:
+            page = pagination.page
+            total = await self._total(db=db, user_id=user_id, feed=feed)
+
+        return PageType(
+            items=[grants_by_id[id] for _, id in window if id in grants_by_id],
+            total=total,
+            page=page,
+            size=size,
+            pages=math.ceil(total / size) if total is not None else None,
+            after=after,
+            before=before,
+        )
+
+    def add_grant(self, created_at: datetime, grant_id: UUID) -> None:
+        key: Key = grant_key(created_at, grant_id)
+        for feed in self._feeds.values():
+            feed.add(key)
+        for loading in self._loading.values():
+            loading.stale = True
+
+    def remove_grant(self, grant_id: UUID) -> None:
+        for feed in self._feeds.values():
+            feed.remove(grant_id)
+        for loading in self._loading.values():
+            loading.stale = True
+
+    def remove_grants(self, grant_ids: Iterable[UUID]) -> None:
+        ids: set[UUID] = set(grant_ids)
+        if not ids:
+            return
+        for feed in self._feeds.values():
+            feed.remove_all(ids)
+        for loading in self._loading.values():
+            loading.stale = True
+
+    def mark_seen(self, user_id: UUID, grant_id: UUID) -> None:
+        feed: UserFeed | None = self._feeds.get(user_id)
+        if feed is not None:
+            feed.remove(grant_id, seen=True)
+        loading: _Loading | None = self._loading.get(user_id)
+        if loading is not None:
+            loading.seen.add(grant_id)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._feeds.delete(user_id)
+        loading: _Loading | None = self._loading.get(user_id)
+        if loading is not None:
+            loading.stale = True
+
+    def clear(self) -> None:
+        self._feeds.clear()
+
+    def stats(self) -> dict:
+        return self._feeds.stats()
+
+    async def _get(self, db: AsyncSession, user_id: UUID) -> UserFeed:
+        feed: UserFeed | None = self._feeds.get(user_id)
+        if feed is None or (not feed.keys and not feed.complete):
+            keys, complete, stale = await self._load(
+                db=db, user_id=user_id, after=None, limit=self.window
+            )
+            feed = UserFeed(keys=keys, complete=complete, window=self.window)
+            if not stale:
+                self._feeds.set(user_id, feed)
+        elif not feed.complete and len(feed.keys) < self.window // 2:
+            keys, complete, stale = await self._load(
+                db=db,
+                user_id=user_id,
+                after=feed.keys[-1],
+                limit=self.window - len(feed.keys),
+            )
+            if not stale:
+                feed.extend(keys=keys, complete=complete)
+
+        return feed
+
+    async def _load(
+        self, db: AsyncSession, user_id: UUID, after: Key | None, limit: int
+    ) -> tuple[list[Key], bool, bool]:
+        """(keys, complete, stale) of the next `limit` unseen keys after `after`."""
+        query: Select = (
+            unseen_grants_query(user_id=user_id)
+            .with_only_columns(Grant.created_at, Grant.id)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(tuple_(Grant.created_at, Grant.id) > after)
+
+        with self._track(user_id) as loading:
+            rows = (await db.execute(query)).all()
+
+        keys: list[Key] = [
+            grant_key(created_at, id)
+            for created_at, id in rows[:limit]
+            if id not in loading.seen
+        ]
+        return keys, len(rows) <= limit, loading.stale
+
+    async def _total(self, db: AsyncSession, user_id: UUID, feed: UserFeed) -> int:
+        if feed.total is None:
+            query: Select = select(func.count()).select_from(
+                unseen_grants_query(user_id=user_id).order_by(None).subquery()
+            )
+            with self._track(user_id) as loading:
+                total: int = (await db.execute(query)).scalar_one()
+            if loading.seen or loading.stale:
+                return total
+            feed.total = total
+
+        return feed.total
+
+    @contextmanager
+    def _track(self, user_id: UUID) -> Iterator[_Loading]:
+        loading: _Loading = self._loading.setdefault(user_id, _Loading())
+        loading.count += 1
+        try:
+            yield loading
+        finally:
+            loading.count -= 1
+            if not loading.count:
+                del self._loading[user_id]
+
+
+GRANT_MATCH_FEED: GrantMatchFeed = GrantMatchFeed(
+    maxsize=int(MATCH_FEED_MAX_USERS),
+    ttl=float(MATCH_FEED_TTL_SECONDS),
+    window=int(MATCH_FEED_WINDOW),
+)
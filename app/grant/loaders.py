@@ -0,0 +1,37 @@
+from collections import defaultdict
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.grant.models import Grant
+from lib.sqlalchemy import first_per
+
+Key = tuple[UUID, int, tuple[str, ...]]
+
+
+async def load_grants(db: AsyncSession, keys: List[Key]) -> List[List[Grant]]:
+    """
+    Keys are (foundation_id, first, columns), `first` caps grants per foundation
+    and `columns` are the attributes the selection reads.
+    """
+    foundation_ids_by_batch: dict[tuple[int, tuple[str, ...]], list[UUID]] = (
+        defaultdict(list)
+    )
+    for foundation_id, first, columns in keys:
+        foundation_ids_by_batch[(first, columns)].append(foundation_id)
+
+    grants: dict[Key, List[Grant]] = defaultdict(list)
+    for (first, columns), foundation_ids in foundation_ids_by_batch.items():
+        query: Select = first_per(
+            model=Grant,
+            column=Grant.foundation_id,
+            values=foundation_ids,
+            first=first,
+            columns=columns,
+        )
+        for grant in (await db.execute(query)).scalars():
+            grants[(grant.foundation_id, first, columns)].append(grant)
+
+    return [grants[key] for key in keys]
@@ -2,22 +2,32 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import UUID, DateTime, ForeignKey, Integer, String
+from sqlalchemy import UUID, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.grant.types import GrantInput
 from app.grant_feedback.models import GrantFeedback
-from lib.sqlalchemy import BaseModel
+from lib.sqlalchemy import BaseModel, trigram_index
 
 
 class Grant(Base, BaseModel):
     __tablename__ = "grants"
+    __table_args__ = (
+        Index(
+            "ix_grants_foundation_id_created_at_id",
+            "foundation_id",
+            "created_at",
+            "id",
+        ),
+        trigram_index("grants", "name"),
+        trigram_index("grants", "location"),
+        trigram_index("grants", "area"),
+    )
 
     foundation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("foundations.id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
@@ -33,12 +43,13 @@ class Grant(Base, BaseModel):
         overlaps="grants",
     )
 
-    def merge(self, grant_input: GrantInput) -> Grant:
-        self.foundation_id = grant_input.foundation_id
-        self.name = grant_input.name
-        self.amount = grant_input.amount
-        self.deadline = grant_input.deadline
-        self.location = grant_input.location
-        self.area = grant_input.area
-
-        return self
+    @staticmethod
+    def update_values(grant_input: GrantInput) -> dict:
+        return {
+            "foundation_id": grant_input.foundation_id,
+            "name": grant_input.name,
+            "amount": grant_input.amount,
+            "deadline": grant_input.deadline,
+            "location": grant_input.location,
+            "area": grant_input.area,
+        }
@@ -1,8 +1,11 @@
+from uuid import UUID
+
 import strawberry
 
 from app.grant.models import Grant
 from app.grant.resolvers import MutationResolver
 from app.grant.types import GrantType
+from lib.graphql import BulkResultType
 from lib.jwt.bearer import Authenticate
 
 
@@ -21,3 +24,18 @@ class GrantMutation:
     delete_grant = strawberry.mutation(
         permission_classes=[Authenticate], resolver=MutationResolver.delete_grant
     )
+    create_grants: BulkResultType[Grant] = strawberry.mutation(
+        permission_classes=[Authenticate],
+        graphql_type=BulkResultType[GrantType],
+        resolver=MutationResolver.create_grants,
+    )
+    upsert_grants: BulkResultType[Grant] = strawberry.mutation(
+        permission_classes=[Authenticate],
+        graphql_type=BulkResultType[GrantType],
+        resolver=MutationResolver.upsert_grants,
+    )
+    delete_grants: BulkResultType[UUID] = strawberry.mutation(
+        permission_classes=[Authenticate],
+        graphql_type=BulkResultType[UUID],
+        resolver=MutationResolver.delete_grants,
+    )
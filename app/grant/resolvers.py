@@ -1,57 +1,57 @@
+from typing import List
 from uuid import UUID
 
 import strawberry
-from fastapi_pagination import Page, Params
-from fastapi_pagination.ext.sqlalchemy import apaginate
-from sqlalchemy import Select, or_, select
+from sqlalchemy import (
+    Delete,
+    Row,
+    Select,
+    Update,
+    delete,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 from strawberry.exceptions import GraphQLError
 
+from app.config import MATCH_FEED_ENABLED
+from app.grant.feed import GRANT_MATCH_FEED, unseen_grants_query
 from app.grant.models import Grant
 from app.grant.types import GrantInput
 from app.grant_feedback.enums import ReactionEnum
 from app.grant_feedback.models import GrantFeedback
-from lib.graphql import QueryInput
+from lib.bulk import bulk_result, check_batch_size, duplicate_indexes, existing_ids
+from lib.graphql import BulkResultType, PageType, QueryInput
+from lib.pagination import paginate
+from lib.query_planner import plan_options
+from lib.response_cache import RESPONSE_CACHE
+from lib.search import search
+from lib.sqlalchemy import any_of
 
 
 class QueryResolver:
     @staticmethod
-    async def get_grants(info: strawberry.Info, query_input: QueryInput) -> Page:
-        db: AsyncSession = info.context["db"]
-
-        filters: list = []
-        if query_input.search:
-            filters += [
-                or_(
-                    Grant.name.contains(query_input.search),
-                    Grant.location.contains(query_input.search),
-                    Grant.area.contains(query_input.search),
-                )
-            ]
-
-        query: Select = (
-            select(Grant).filter(*filters).options(joinedload(Grant.feedbacks))
-        )
+    async def get_grants(info: strawberry.Info, query_input: QueryInput) -> PageType:
+        db: AsyncSession = info.context["read_db"]
 
-        page: Page = await apaginate(
-            conn=db,
-            query=query,
-            params=Params(
-                page=query_input.pagination.page, size=query_input.pagination.size
-            ),
+        query: Select = search(
+            query=select(Grant).options(*plan_options(info, Grant, path=["items"])),
+            columns=[Grant.name, Grant.location, Grant.area],
+            query_input=query_input,
         )
 
-        return page
+        return await paginate(db=db, query=query, query_input=query_input, model=Grant)
 
     @staticmethod
     async def get_grant_by_id(info: strawberry.Info, id: UUID) -> Grant:
-        db: AsyncSession = info.context["db"]
+        db: AsyncSession = info.context["read_db"]
 
         query: Select = (
-            select(Grant).filter(Grant.id == id).options(joinedload(Grant.feedbacks))
+            select(Grant).filter(Grant.id == id).options(*plan_options(info, Grant))
         )
-        grant: Grant | None = (await db.execute(query)).unique().scalar_one_or_none()
+        grant: Grant | None = (await db.execute(query)).scalar_one_or_none()
 
         if grant is None:
             raise GraphQLError("Grant ID Not found!")
@@ -59,32 +59,31 @@ class QueryResolver:
         return grant
 
     @staticmethod
-    async def get_grant_matches(info: strawberry.Info, query_input: QueryInput) -> Page:
-        db: AsyncSession = info.context["db"]
+    async def get_grant_matches(
+        info: strawberry.Info, query_input: QueryInput
+    ) -> PageType:
+        db: AsyncSession = info.context["read_db"]
         user_id: UUID = info.context["user_id"]
 
-        query: Select = (
-            select(Grant)
-            .outerjoin(Grant.feedbacks)
-            .filter(~Grant.feedbacks.any(GrantFeedback.user_id == user_id))
-            .options(joinedload(Grant.feedbacks))
-        )
+        if MATCH_FEED_ENABLED == "true":
+            return await GRANT_MATCH_FEED.page(
+                db=db,
+                user_id=user_id,
+                query_input=query_input,
+                options=plan_options(info, Grant, path=["items"]),
+            )
 
-        page: Page = await apaginate(
-            conn=db,
-            query=query,
-            params=Params(
-                page=query_input.pagination.page, size=query_input.pagination.size
-            ),
+        query: Select = unseen_grants_query(user_id=user_id).options(
+            *plan_options(info, Grant, path=["items"])
         )
 
-        return page
+        return await paginate(db=db, query=query, query_input=query_input, model=Grant)
 
     @staticmethod
     async def get_grant_opportunities(
         info: strawberry.Info, query_input: QueryInput
-    ) -> Page:
-        db: AsyncSession = info.context["db"]
+    ) -> PageType:
+        db: AsyncSession = info.context["read_db"]
         user_id: UUID = info.context["user_id"]
 
         query: Select = (
@@ -94,18 +93,10 @@ class QueryResolver:
                 GrantFeedback.user_id == user_id,
                 GrantFeedback.reaction == ReactionEnum.LIKE,
             )
-            .options(joinedload(Grant.feedbacks))
+            .options(*plan_options(info, Grant, path=["items"]))
         )
 
-        page: Page = await apaginate(
-            conn=db,
-            query=query,
-            params=Params(
-                page=query_input.pagination.page, size=query_input.pagination.size
-            ),
-        )
-
-        return page
+        return await paginate(db=db, query=query, query_input=query_input, model=Grant)
 
 
 class MutationResolver:
@@ -123,6 +114,8 @@ class MutationResolver:
         )
         db.add(grant)
         await db.commit()
+        GRANT_MATCH_FEED.add_grant(created_at=grant.created_at, grant_id=grant.id)
+        await RESPONSE_CACHE.invalidate("grant")
 
         return grant
 
@@ -132,14 +125,20 @@ class MutationResolver:
     ) -> Grant:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(Grant).where(Grant.id == grant_id)
-        grant: Grant | None = (await db.execute(query)).scalar_one_or_none()
+        query: Update = (
+            update(Grant)
+            .where(Grant.id == grant_id)
+            .values(**Grant.update_values(grant_input=grant_input))
+            .returning(Grant)
+            .execution_options(populate_existing=True)
+        )
+        grant: Grant | None = (await db.scalars(query)).one_or_none()
 
         if grant is None:
             raise GraphQLError("Grant Not found!")
 
-        grant.merge(grant_input=grant_input)
         await db.commit()
+        await RESPONSE_CACHE.invalidate("grant")
 
         return grant
 
@@ -147,11 +146,170 @@ class MutationResolver:
     async def delete_grant(info: strawberry.Info, grant_id: UUID) -> None:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(Grant).where(Grant.id == grant_id)
-        foundation: Grant | None = (await db.execute(query)).scalar_one_or_none()
+        query: Delete = delete(Grant).where(Grant.id == grant_id).returning(Grant.id)
+        deleted: UUID | None = (await db.scalars(query)).one_or_none()
 
-        if foundation is None:
+        if deleted is None:
             return
 
-        await db.delete(foundation)
         await db.commit()
+        GRANT_MATCH_FEED.remove_grant(grant_id=grant_id)
+        await RESPONSE_CACHE.invalidate("grant", "grant_feedback")
+
+    @staticmethod
+    async def create_grants(
+        info: strawberry.Info, grant_inputs: List[GrantInput]
+    ) -> BulkResultType:
+        db: AsyncSession = info.context["db"]
+        check_batch_size(len(grant_inputs))
+
+        errors: dict[int, str] = await _check_grant_inputs(db, grant_inputs)
+        query: Insert = (
+            insert(Grant)
+            .on_conflict_do_nothing(index_elements=[Grant.name])
+            .returning(Grant)
+        )
+        rows_by_name: dict[str, Row] = await _insert_grants(
+            db, query, grant_inputs, errors
+        )
+        await db.commit()
+
+        grants: list[Grant] = []
+        for index, grant_input in enumerate(grant_inputs):
+            if index in errors:
+                continue
+            row: Row | None = rows_by_name.get(grant_input.name)
+            if row is None:
+                errors[index] = "Grant name already exists!"
+                continue
+            grant: Grant = row.Grant
+            grants.append(grant)
+            GRANT_MATCH_FEED.add_grant(created_at=grant.created_at, grant_id=grant.id)
+        if grants:
+            await RESPONSE_CACHE.invalidate("grant")
+
+        return bulk_result(items=grants, errors=errors)
+
+    @staticmethod
+    async def upsert_grants(
+        info: strawberry.Info, grant_inputs: List[GrantInput]
+    ) -> BulkResultType:
+        """Creates grants by name, or updates the grant already holding it."""
+        db: AsyncSession = info.context["db"]
+        check_batch_size(len(grant_inputs))
+
+        errors: dict[int, str] = await _check_grant_inputs(db, grant_inputs)
+        query: Insert = insert(Grant)
+        query = query.on_conflict_do_update(
+            index_elements=[Grant.name],
+            set_={
+                column: query.excluded[column]
+                for column in (
+                    "foundation_id",
+                    "amount",
+                    "deadline",
+                    "location",
+                    "area",
+                    "updated_at",
+                )
+            },
+        ).returning(
+            # xmax is only set on the row version an update produced, so it tells
+            # the inserted grants from the updated ones.
+            Grant,
+            literal_column("xmax = 0").label("inserted"),
+        )
+        rows_by_name: dict[str, Row] = await _insert_grants(
+            db, query, grant_inputs, errors
+        )
+        await db.commit()
+
+        rows: list[Row] = [
+            rows_by_name[grant_input.name]
+            for index, grant_input in enumerate(grant_inputs)
+            if index not in errors
+        ]
+        grants: list[Grant] = [row.Grant for row in rows]
+        for row in rows:
+            # Updated grants keep their place, and stay out of the feeds of the
+            # users who already reacted to them.
+            if row.inserted:
+                GRANT_MATCH_FEED.add_grant(
+                    created_at=row.Grant.created_at, grant_id=row.Grant.id
+                )
+        if grants:
+            await RESPONSE_CACHE.invalidate("grant")
+
+        return bulk_result(items=grants, errors=errors)
+
+    @staticmethod
+    async def delete_grants(
+        info: strawberry.Info, grant_ids: List[UUID]
+    ) -> BulkResultType:
+        db: AsyncSession = info.context["db"]
+        check_batch_size(len(grant_ids))
+
+        query: Delete = (
+            delete(Grant)
+            .where(any_of(Grant.id, set(grant_ids)))
+            .returning(Grant.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted: set[UUID] = set((await db.scalars(query)).all())
+        await db.commit()
+
+        errors: dict[int, str] = {}
+        for index, grant_id in enumerate(grant_ids):
+            if grant_id not in deleted:
+                errors[index] = "Grant Not found!"
+        for grant_id in deleted:
+            GRANT_MATCH_FEED.remove_grant(grant_id=grant_id)
+        if deleted:
+            await RESPONSE_CACHE.invalidate("grant", "grant_feedback")
+
+        return bulk_result(
+            items=[grant_id for grant_id in grant_ids if grant_id in deleted],
+            errors=errors,
+        )
+
+
+async def _check_grant_inputs(
+    db: AsyncSession, grant_inputs: List[GrantInput]
+) -> dict[int, str]:
+    # app.foundation.models imports this package, the model is resolved here.
+    from app.foundation.models import Foundation
+
+    foundation_ids: set[UUID] = await existing_ids(
+        db, Foundation.id, [grant_input.foundation_id for grant_input in grant_inputs]
+    )
+    duplicates: set[int] = duplicate_indexes(
+        [grant_input.name for grant_input in grant_inputs]
+    )
+
+    errors: dict[int, str] = {}
+    for index, grant_input in enumerate(grant_inputs):
+        if grant_input.foundation_id not in foundation_ids:
+            errors[index] = "Foundation ID Not found!"
+        elif index in duplicates:
+            errors[index] = "Grant name is repeated in the batch!"
+
+    return errors
+
+
+async def _insert_grants(
+    db: AsyncSession,
+    query: Insert,
+    grant_inputs: List[GrantInput],
+    errors: dict[int, str],
+) -> dict[str, Row]:
+    """Runs the multi-row insert for the valid inputs, returns the rows by name."""
+    values: list[dict] = [
+        strawberry.asdict(grant_input)
+        for index, grant_input in enumerate(grant_inputs)
+        if index not in errors
+    ]
+    if not values:
+        return {}
+
+    rows = await db.execute(query.execution_options(populate_existing=True), values)
+    return {row.Grant.name: row for row in rows}
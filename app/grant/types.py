@@ -1,21 +1,14 @@
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import List, Optional
 from uuid import UUID
 
 import strawberry
 
+from app.config import MAX_PAGE_SIZE
+from app.grant_feedback.models import GrantFeedback
 from app.grant_feedback.types import GrantFeedbackType
-
-T = TypeVar("T")
-
-
-@strawberry.type
-class PageType(Generic[T]):
-    items: List[T]
-    total: int
-    page: int
-    size: int
-    pages: int
+from lib.pagination import check_page_size
+from lib.query_planner import plan_columns
 
 
 @strawberry.type(name="Grant")
@@ -29,7 +22,18 @@ class GrantType:
     deadline: datetime
     location: str
     area: Optional[str] = None
-    feedbacks: List[GrantFeedbackType] = strawberry.field(default_factory=list)
+
+    @strawberry.field
+    async def feedbacks(
+        self, info: strawberry.Info, first: Optional[int] = None
+    ) -> List[GrantFeedbackType]:
+        # Without `first` the list holds up to MAX_PAGE_SIZE rows, which is what
+        # the query cost charges for it.
+        first = int(MAX_PAGE_SIZE) if first is None else first
+        check_page_size(first)
+        return await info.context["loaders"]["grant_feedbacks"].load(
+            (self.id, first, plan_columns(info, GrantFeedback))
+        )
 
 
 @strawberry.input
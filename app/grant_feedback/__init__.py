@@ -1,4 +0,0 @@
-from app.grant_feedback.mutations import GrantFeedbackMutation
-from app.grant_feedback.queries import GrantFeedbackQuery
-
-__all__ = ["GrantFeedbackQuery", "GrantFeedbackMutation"]
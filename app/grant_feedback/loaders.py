@@ -0,0 +1,41 @@
+from collections import defaultdict
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.grant_feedback.models import GrantFeedback
+from lib.sqlalchemy import first_per
+
+Key = tuple[UUID, int, tuple[str, ...]]
+
+
+async def load_grant_feedbacks(
+    db: AsyncSession, keys: List[Key]
+) -> List[List[GrantFeedback]]:
+    """
+    Keys are (grant_id, first, columns), `first` caps feedback per grant and
+    `columns` are the attributes the selection reads.
+    """
+    grant_ids_by_batch: dict[tuple[int, tuple[str, ...]], list[UUID]] = defaultdict(
+        list
+    )
+    for grant_id, first, columns in keys:
+        grant_ids_by_batch[(first, columns)].append(grant_id)
+
+    grant_feedbacks: dict[Key, List[GrantFeedback]] = defaultdict(list)
+    for (first, columns), grant_ids in grant_ids_by_batch.items():
+        query: Select = first_per(
+            model=GrantFeedback,
+            column=GrantFeedback.grant_id,
+            values=grant_ids,
+            first=first,
+            columns=columns,
+        )
+        for grant_feedback in (await db.execute(query)).scalars():
+            grant_feedbacks[(grant_feedback.grant_id, first, columns)].append(
+                grant_feedback
+            )
+
+    return [grant_feedbacks[key] for key in keys]
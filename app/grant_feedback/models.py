@@ -1,17 +1,23 @@
 import uuid
 
-from sqlalchemy import UUID, ForeignKey, String
+from sqlalchemy import UUID, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import Enum
 
 from app.database import Base
 from app.grant_feedback.enums import ReactionEnum
 from app.grant_feedback.types import GrantFeedbackInput
-from lib.sqlalchemy import BaseModel
+from lib.sqlalchemy import BaseModel, trigram_index
 
 
 class GrantFeedback(Base, BaseModel):
     __tablename__ = "grant_feedbacks"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "grant_id", name="uq_grant_feedbacks_user_id_grant_id"
+        ),
+        trigram_index("grant_feedbacks", "comment"),
+    )
 
     grant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -22,14 +28,14 @@ class GrantFeedback(Base, BaseModel):
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
     reaction: Mapped[ReactionEnum] = mapped_column(Enum(ReactionEnum), nullable=False)
     comment: Mapped[str | None] = mapped_column(String, nullable=True)
 
-    def merge(self, grant_feedback_input: GrantFeedbackInput) -> GrantFeedback:
-        self.reaction = grant_feedback_input.reaction
-        self.comment = grant_feedback_input.comment
-
-        return self
+    @staticmethod
+    def update_values(grant_feedback_input: GrantFeedbackInput) -> dict:
+        return {
+            "reaction": grant_feedback_input.reaction,
+            "comment": grant_feedback_input.comment,
+        }
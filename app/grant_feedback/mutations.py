@@ -2,6 +2,7 @@ import strawberry
 
 from app.grant_feedback.models import GrantFeedback
 from app.grant_feedback.types import GrantFeedbackType
+from lib.graphql import BulkResultType
 from lib.jwt.bearer import Authenticate
 from app.grant_feedback.resolvers import MutationResolver
 
@@ -14,6 +15,12 @@ class GrantFeedbackMutation:
         resolver=MutationResolver.create_grant_feedback,
     )
 
+    create_grant_feedbacks: BulkResultType[GrantFeedback] = strawberry.mutation(
+        permission_classes=[Authenticate],
+        graphql_type=BulkResultType[GrantFeedbackType],
+        resolver=MutationResolver.create_grant_feedbacks,
+    )
+
     update_grant_feedback: GrantFeedback = strawberry.mutation(
         permission_classes=[Authenticate],
         graphql_type=GrantFeedbackType,
@@ -1,13 +1,19 @@
+from typing import List
 from uuid import UUID
 import strawberry
-from fastapi_pagination import Page, Params
-from fastapi_pagination.ext.sqlalchemy import apaginate
-from sqlalchemy import Select, or_, select
+from sqlalchemy import Delete, Select, Update, delete, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.exceptions import GraphQLError
 
 from app.grant_feedback.models import GrantFeedback
-from lib.graphql import QueryInput
+from lib.bulk import bulk_result, check_batch_size, duplicate_indexes, existing_ids
+from lib.graphql import BulkResultType, PageType, QueryInput
+from lib.pagination import paginate
+from lib.query_planner import plan_options
+from lib.response_cache import RESPONSE_CACHE
+from lib.search import search
 from app.grant_feedback.types import GrantFeedbackInput
 
 
@@ -15,32 +21,32 @@ class QueryResolver:
     @staticmethod
     async def get_grant_feedbacks(
         info: strawberry.Info, query_input: QueryInput
-    ) -> Page:
-        db: AsyncSession = info.context["db"]
-
-        filters: list = []
-        if query_input.search:
-            filters += [or_(GrantFeedback.comment.contains(query_input.search))]
-
-        query: Select = select(GrantFeedback).filter(*filters)
+    ) -> PageType:
+        db: AsyncSession = info.context["read_db"]
 
-        page: Page = await apaginate(
-            conn=db,
-            query=query,
-            params=Params(
-                page=query_input.pagination.page, size=query_input.pagination.size
+        query: Select = search(
+            query=select(GrantFeedback).options(
+                *plan_options(info, GrantFeedback, path=["items"])
             ),
+            columns=[GrantFeedback.comment],
+            query_input=query_input,
         )
 
-        return page
+        return await paginate(
+            db=db, query=query, query_input=query_input, model=GrantFeedback
+        )
 
     @staticmethod
     async def get_grant_feedback_by_id(
         info: strawberry.Info, id: UUID
     ) -> GrantFeedback:
-        db: AsyncSession = info.context["db"]
+        db: AsyncSession = info.context["read_db"]
 
-        query: Select = select(GrantFeedback).filter(GrantFeedback.id == id)
+        query: Select = (
+            select(GrantFeedback)
+            .filter(GrantFeedback.id == id)
+            .options(*plan_options(info, GrantFeedback))
+        )
         grant_feedback: GrantFeedback | None = (
             (await db.execute(query)).unique().scalar_one_or_none()
         )
@@ -65,10 +71,93 @@ class MutationResolver:
             comment=grant_feedback_input.comment,
         )
         db.add(grant_feedback)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError as error:
+            await db.rollback()
+            if "uq_grant_feedbacks_user_id_grant_id" in str(error):
+                raise GraphQLError("Grant feedback already exists!")
+            raise
+        # app.grant.models imports this package, the feed is resolved at call time.
+        from app.grant.feed import GRANT_MATCH_FEED
+
+        GRANT_MATCH_FEED.mark_seen(
+            user_id=grant_feedback.user_id, grant_id=grant_feedback.grant_id
+        )
+        await RESPONSE_CACHE.invalidate("grant_feedback")
 
         return grant_feedback
 
+    @staticmethod
+    async def create_grant_feedbacks(
+        info: strawberry.Info, grant_feedback_inputs: List[GrantFeedbackInput]
+    ) -> BulkResultType:
+        db: AsyncSession = info.context["db"]
+        check_batch_size(len(grant_feedback_inputs))
+
+        # app.grant.models and app.user.models import this package.
+        from app.grant.feed import GRANT_MATCH_FEED
+        from app.grant.models import Grant
+        from app.user.models import User
+
+        grant_ids: set[UUID] = await existing_ids(
+            db, Grant.id, [item.grant_id for item in grant_feedback_inputs]
+        )
+        user_ids: set[UUID] = await existing_ids(
+            db, User.id, [item.user_id for item in grant_feedback_inputs]
+        )
+        duplicates: set[int] = duplicate_indexes(
+            [(item.user_id, item.grant_id) for item in grant_feedback_inputs]
+        )
+
+        errors: dict[int, str] = {}
+        for index, grant_feedback_input in enumerate(grant_feedback_inputs):
+            if grant_feedback_input.grant_id not in grant_ids:
+                errors[index] = "Grant ID Not found!"
+            elif grant_feedback_input.user_id not in user_ids:
+                errors[index] = "User ID Not found!"
+            elif index in duplicates:
+                errors[index] = "Grant feedback is repeated in the batch!"
+
+        values: list[dict] = [
+            strawberry.asdict(grant_feedback_input)
+            for index, grant_feedback_input in enumerate(grant_feedback_inputs)
+            if index not in errors
+        ]
+        grant_feedbacks_by_key: dict[tuple[UUID, UUID], GrantFeedback] = {}
+        if values:
+            query: Insert = (
+                insert(GrantFeedback)
+                .on_conflict_do_nothing(
+                    constraint="uq_grant_feedbacks_user_id_grant_id"
+                )
+                .returning(GrantFeedback)
+            )
+            grant_feedbacks_by_key = {
+                (grant_feedback.user_id, grant_feedback.grant_id): grant_feedback
+                for grant_feedback in await db.scalars(query, values)
+            }
+        await db.commit()
+
+        grant_feedbacks: list[GrantFeedback] = []
+        for index, grant_feedback_input in enumerate(grant_feedback_inputs):
+            if index in errors:
+                continue
+            grant_feedback: GrantFeedback | None = grant_feedbacks_by_key.get(
+                (grant_feedback_input.user_id, grant_feedback_input.grant_id)
+            )
+            if grant_feedback is None:
+                errors[index] = "Grant feedback already exists!"
+                continue
+            grant_feedbacks.append(grant_feedback)
+            GRANT_MATCH_FEED.mark_seen(
+                user_id=grant_feedback.user_id, grant_id=grant_feedback.grant_id
+            )
+        if grant_feedbacks:
+            await RESPONSE_CACHE.invalidate("grant_feedback")
+
+        return bulk_result(items=grant_feedbacks, errors=errors)
+
     @staticmethod
     async def update_grant_feedback(
         info: strawberry.Info,
@@ -77,18 +166,22 @@ class MutationResolver:
     ) -> GrantFeedback:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(GrantFeedback).where(
-            GrantFeedback.id == grant_feedback_id
+        query: Update = (
+            update(GrantFeedback)
+            .where(GrantFeedback.id == grant_feedback_id)
+            .values(
+                **GrantFeedback.update_values(grant_feedback_input=grant_feedback_input)
+            )
+            .returning(GrantFeedback)
+            .execution_options(populate_existing=True)
         )
-        grant_feedback: GrantFeedback | None = (
-            await db.execute(query)
-        ).scalar_one_or_none()
+        grant_feedback: GrantFeedback | None = (await db.scalars(query)).one_or_none()
 
         if grant_feedback is None:
             raise GraphQLError("Grant Not found!")
 
-        grant_feedback.merge(grant_feedback_input=grant_feedback_input)
         await db.commit()
+        await RESPONSE_CACHE.invalidate("grant_feedback")
 
         return grant_feedback
 
@@ -98,15 +191,19 @@ class MutationResolver:
     ) -> None:
         db: AsyncSession = info.context["db"]
 
-        query: Select = select(GrantFeedback).where(
-            GrantFeedback.id == grant_feedback_id
+        query: Delete = (
+            delete(GrantFeedback)
+            .where(GrantFeedback.id == grant_feedback_id)
+            .returning(GrantFeedback.user_id)
         )
-        grant_feedback: GrantFeedback | None = (
-            await db.execute(query)
-        ).scalar_one_or_none()
+        user_id: UUID | None = (await db.scalars(query)).one_or_none()
 
-        if grant_feedback is None:
+        if user_id is None:
             return
 
-        await db.delete(grant_feedback)
         await db.commit()
+
+        from app.grant.feed import GRANT_MATCH_FEED
+
+        GRANT_MATCH_FEED.invalidate(user_id=user_id)
+        await RESPONSE_CACHE.invalidate("grant_feedback")
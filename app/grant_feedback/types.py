@@ -1,22 +1,11 @@
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import Optional
 from uuid import UUID
 
 import strawberry
 
 from app.grant_feedback.enums import ReactionEnum
 
-T = TypeVar("T")
-
-
-@strawberry.type
-class PageType(Generic[T]):
-    items: List[T]
-    total: int
-    page: int
-    size: int
-    pages: int
-
 
 @strawberry.type(name="GrantFeedback")
 class GrantFeedbackType:
@@ -1,8 +1,23 @@
 import strawberry
+from fastapi import Depends
 
-from app.foundation import FoundationMutation, FoundationQuery
-from app.grant import GrantMutation, GrantQuery
-from app.grant_feedback import GrantFeedbackMutation, GrantFeedbackQuery
+from app.database import get_db, get_read_db
+from app.extensions import ReadYourWrites, ResponseCaching
+from app.foundation.mutations import FoundationMutation
+from app.foundation.queries import FoundationQuery
+from app.grant.mutations import GrantMutation
+from app.grant.queries import GrantQuery
+from app.grant_feedback.mutations import GrantFeedbackMutation
+from app.grant_feedback.queries import GrantFeedbackQuery
+from app.loaders import get_loaders
+from lib.complexity import QueryCost
+from lib.metrics import OperationMetrics
+from lib.persisted_queries import DocumentCache
+from lib.profiling import QueryProfiler
+
+
+async def get_context(db=Depends(get_db), read_db=Depends(get_read_db)):
+    return {"db": db, "read_db": read_db, "loaders": get_loaders(read_db)}
 
 
 @strawberry.type
@@ -13,4 +28,15 @@ class Query(FoundationQuery, GrantQuery, GrantFeedbackQuery): ...
 class Mutation(FoundationMutation, GrantMutation, GrantFeedbackMutation): ...
 
 
-GRAPHQL_SCHEMA: strawberry.Schema = strawberry.Schema(query=Query, mutation=Mutation)
+GRAPHQL_SCHEMA: strawberry.Schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        OperationMetrics,
+        DocumentCache,
+        QueryCost,
+        ReadYourWrites,
+        ResponseCaching,
+        QueryProfiler,
+    ],
+)
@@ -0,0 +1,14 @@
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.grant.loaders import load_grants
+from app.grant_feedback.loaders import load_grant_feedbacks
+
+
+def get_loaders(db: AsyncSession) -> dict[str, DataLoader]:
+    return {
+        "grants": DataLoader(load_fn=partial(load_grants, db)),
+        "grant_feedbacks": DataLoader(load_fn=partial(load_grant_feedbacks, db)),
+    }
@@ -1,29 +1,86 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import Depends, FastAPI
-from fastapi_pagination import add_pagination
-from strawberry.fastapi import GraphQLRouter
+from fastapi import APIRouter, FastAPI
 
 from app.auth.api import AUTH_ROUTER
-from app.database import Base, engine, get_db
-from app.graphql import GRAPHQL_SCHEMA
+from app.config import (
+    DB_CREATE_ALL,
+    PERSISTED_QUERIES_DIR,
+    PERSISTED_QUERIES_MAX_SIZE,
+    PERSISTED_QUERIES_MODE,
+    PROMETHEUS_MULTIPROC_DIR,
+)
+from app.database import Base, engine
+from app.export.api import EXPORT_ROUTER
+from app.metrics import CACHE_STATS, METRICS_ROUTER, refresh_periodically
+from lib.lazy import LazyApp
+from lib.metrics import MetricsMiddleware
 
 
-async def get_context(db=Depends(get_db)):
-    return {"db": db}
+def graphql_router() -> APIRouter:
+    """The schema, its resolvers and extensions load with the first operation."""
+    from strawberry.fastapi import GraphQLRouter
+
+    from app.graphql import GRAPHQL_SCHEMA, get_context
+    from lib.persisted_queries import (
+        PersistedQueryRegistry,
+        PersistedQueryRouter,
+        document_cache_stats,
+    )
+
+    CACHE_STATS["documents"] = document_cache_stats
+    if PERSISTED_QUERIES_MODE == "off":
+        return GraphQLRouter(
+            schema=GRAPHQL_SCHEMA,
+            path="/graphql",
+            context_getter=get_context,
+            dependency_overrides_provider=app,
+        )
+
+    registry: PersistedQueryRegistry = PersistedQueryRegistry(
+        maxsize=int(PERSISTED_QUERIES_MAX_SIZE)
+    )
+    if PERSISTED_QUERIES_DIR:
+        registry.load(PERSISTED_QUERIES_DIR)
+        registry.precompile(GRAPHQL_SCHEMA)
+    CACHE_STATS["persisted_queries"] = registry.stats
+
+    return PersistedQueryRouter(
+        schema=GRAPHQL_SCHEMA,
+        path="/graphql",
+        context_getter=get_context,
+        dependency_overrides_provider=app,
+        registry=registry,
+        allow_list=PERSISTED_QUERIES_MODE == "allowlist",
+    )
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if DB_CREATE_ALL == "true":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    if PERSISTED_QUERIES_DIR:
+        # Parses and validates the allow-list before the first request.
+        GRAPHQL_APP.load()
+
+    refresh: asyncio.Task | None = None
+    if PROMETHEUS_MULTIPROC_DIR:
+        refresh = asyncio.create_task(refresh_periodically())
     yield
+    if refresh is not None:
+        refresh.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresh
 
 
-GRAPHQL_ROUTE = GraphQLRouter(schema=GRAPHQL_SCHEMA, context_getter=get_context)
+GRAPHQL_APP: LazyApp = LazyApp(graphql_router)
 
 app = FastAPI(lifespan=lifespan)
 
-app.include_router(router=GRAPHQL_ROUTE, prefix="/graphql")
+app.add_route("/graphql", GRAPHQL_APP, include_in_schema=False)
 app.include_router(router=AUTH_ROUTER)
-add_pagination(app)
+app.include_router(router=EXPORT_ROUTER)
+app.include_router(router=METRICS_ROUTER)
+app.add_middleware(MetricsMiddleware)
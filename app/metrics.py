@@ -0,0 +1,112 @@
+import asyncio
+from typing import Callable
+
+from fastapi import APIRouter, Response
+from prometheus_client import Gauge
+
+from app.config import METRICS_REFRESH_SECONDS
+from app.database import pool_stats
+from app.grant.feed import GRANT_MATCH_FEED
+from lib.jwt.manager import JWTManager
+from lib.metrics import render
+from lib.response_cache import RESPONSE_CACHE
+from lib.utils import PASSWORD_HASHER
+
+METRICS_ROUTER: APIRouter = APIRouter(tags=["Metrics"])
+
+# Sampled from the stats() of each component when scraped, or every
+# METRICS_REFRESH_SECONDS in multiprocess mode, the hot paths are not touched.
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Connections held by the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections in use.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUTS = Gauge(
+    "db_pool_checkouts", "Checkouts so far.", ["pool"], multiprocess_mode="livesum"
+)
+DB_POOL_TIMEOUTS = Gauge(
+    "db_pool_timeouts",
+    "Checkouts that timed out so far.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT_SECONDS = Gauge(
+    "db_pool_checkout_wait_seconds",
+    "Checkout wait over the recent checkouts.",
+    ["pool", "quantile"],
+    multiprocess_mode="livemax",
+)
+PASSWORD_HASHER_QUEUE_DEPTH = Gauge(
+    "password_hasher_queue_depth",
+    "bcrypt calls waiting for a worker thread.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHER_IN_FLIGHT = Gauge(
+    "password_hasher_in_flight",
+    "bcrypt calls running on a worker thread.",
+    multiprocess_mode="livesum",
+)
+CACHE_HITS = Gauge("cache_hits", "Cache hits.", ["cache"], multiprocess_mode="livesum")
+CACHE_MISSES = Gauge(
+    "cache_misses", "Cache misses.", ["cache"], multiprocess_mode="livesum"
+)
+CACHE_HIT_RATIO = Gauge(
+    "cache_hit_ratio", "Hits over lookups.", ["cache"], multiprocess_mode="liveall"
+)
+CACHE_SIZE = Gauge(
+    "cache_size", "Entries in the cache.", ["cache"], multiprocess_mode="livesum"
+)
+
+CACHE_STATS: dict[str, Callable[[], dict]] = {
+    "match_feed": GRANT_MATCH_FEED.stats,
+    "token": JWTManager.cache_stats,
+    "response": RESPONSE_CACHE.stats,
+}
+
+
+def refresh_metrics() -> None:
+    pools: dict = pool_stats()
+    for name, stats in [
+        ("primary", pools["primary"]),
+        *((f"replica{index}", stats) for index, stats in enumerate(pools["replicas"])),
+    ]:
+        DB_POOL_SIZE.labels(name).set(stats["size"])
+        DB_POOL_CHECKED_OUT.labels(name).set(stats["checked_out"])
+        DB_POOL_CHECKOUTS.labels(name).set(stats["checkouts"])
+        DB_POOL_TIMEOUTS.labels(name).set(stats["timeouts"])
+        for quantile, key in (("0.5", "wait_p50_ms"), ("0.95", "wait_p95_ms")):
+            DB_POOL_WAIT_SECONDS.labels(name, quantile).set(stats[key] / 1000)
+        DB_POOL_WAIT_SECONDS.labels(name, "1").set(stats["wait_max_ms"] / 1000)
+
+    hasher: dict = PASSWORD_HASHER.stats()
+    PASSWORD_HASHER_QUEUE_DEPTH.set(hasher["queue_depth"])
+    PASSWORD_HASHER_IN_FLIGHT.set(hasher["in_flight"])
+
+    for name, get_stats in CACHE_STATS.items():
+        stats = get_stats()
+        CACHE_HITS.labels(name).set(stats["hits"])
+        CACHE_MISSES.labels(name).set(stats["misses"])
+        CACHE_HIT_RATIO.labels(name).set(stats["hit_rate"])
+        if "size" in stats:
+            CACHE_SIZE.labels(name).set(stats["size"])
+
+
+async def refresh_periodically() -> None:
+    """Other workers cannot be asked at scrape time, each one publishes its own."""
+    while True:
+        refresh_metrics()
+        await asyncio.sleep(float(METRICS_REFRESH_SECONDS))
+
+
+@METRICS_ROUTER.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    refresh_metrics()
+    body, content_type = render()
+    return Response(content=body, media_type=content_type)
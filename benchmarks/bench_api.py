@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Latency and throughput of the GraphQL operations and `/auth/login` under load.
+
+Seeds `--scale` users with `scripts.db_seed --scale`, then every scenario sends
+`--requests` requests from `--concurrency` concurrent clients, in-process through
+ASGI or against a running server with `--base-url`. Seeding drops every table of
+BENCHMARK_DATABASE_URL, the compose test_db by default. In-process runs refuse to
+start unless the app's DATABASE_URL is the same database, a `--base-url` server
+has to read it as well.
+
+    python -m benchmarks.bench_api --scale 10000 --output api.json
+    python -m benchmarks.compare baseline.json api.json
+"""
+
+import argparse
+import asyncio
+import subprocess
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database import engine as app_engine
+from app.foundation.models import Foundation
+from app.grant.feed import GRANT_MATCH_FEED
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from app.main import app
+from app.user.models import User
+from benchmarks.utils import get_engine, reset_schema, summarize, write_report
+from lib.jwt.manager import JWTManager
+from lib.response_cache import RESPONSE_CACHE
+from scripts.db_seed import seed_scale
+
+PASSWORD: str = "demo123"
+
+Request = dict[str, Any]
+Scenario = tuple[str, Callable[[int], Request]]
+
+GRANT_FIELDS: str = "id name amount deadline location area"
+
+GRANTS_QUERY: str = f"""query Grants($page: Int!) {{
+    grants(queryInput: {{ pagination: {{ page: $page, size: 10 }} }}) {{
+        total
+        items {{ {GRANT_FIELDS} }}
+    }}
+}}"""
+GRANT_MATCHES_QUERY: str = f"""query GrantMatches {{
+    grantMatches(queryInput: {{ cursor: {{ size: 10 }} }}) {{
+        after
+        items {{ {GRANT_FIELDS} }}
+    }}
+}}"""
+GRANT_OPPORTUNITIES_QUERY: str = f"""query GrantOpportunities($page: Int!) {{
+    grantOpportunities(queryInput: {{ pagination: {{ page: $page, size: 10 }} }}) {{
+        total
+        items {{ {GRANT_FIELDS} }}
+    }}
+}}"""
+FOUNDATIONS_QUERY: str = f"""query Foundations($page: Int!) {{
+    foundations(queryInput: {{ pagination: {{ page: $page, size: 10 }} }}) {{
+        total
+        items {{
+            id
+            name
+            grants(first: 5) {{ {GRANT_FIELDS} }}
+        }}
+    }}
+}}"""
+CREATE_GRANT_MUTATION: str = """mutation CreateGrant($input: GrantInput!) {
+    createGrant(grantInput: $input) { id }
+}"""
+UPDATE_GRANT_MUTATION: str = """mutation UpdateGrant($id: UUID!, $input: GrantInput!) {
+    updateGrant(grantId: $id, grantInput: $input) { id }
+}"""
+DELETE_GRANT_MUTATION: str = """mutation DeleteGrant($id: UUID!) {
+    deleteGrant(grantId: $id)
+}"""
+CREATE_GRANTS_MUTATION: str = """mutation CreateGrants($inputs: [GrantInput!]!) {
+    createGrants(grantInputs: $inputs) { items { id } errors { index message } }
+}"""
+UPSERT_GRANTS_MUTATION: str = """mutation UpsertGrants($inputs: [GrantInput!]!) {
+    upsertGrants(grantInputs: $inputs) { items { id } errors { index message } }
+}"""
+DELETE_GRANTS_MUTATION: str = """mutation DeleteGrants($ids: [UUID!]!) {
+    deleteGrants(grantIds: $ids) { items errors { index message } }
+}"""
+CREATE_FOUNDATION_MUTATION: str = """mutation CreateFoundation($input: FoundationInput!) {
+    createFoundation(foundationInput: $input) { id }
+}"""
+UPDATE_FOUNDATION_MUTATION: str = """mutation UpdateFoundation(
+    $id: UUID!, $input: FoundationInput!
+) {
+    updateFoundation(foundationId: $id, foundationInput: $input) { id }
+}"""
+DELETE_FOUNDATION_MUTATION: str = """mutation DeleteFoundation($id: UUID!) {
+    deleteFoundation(foundationId: $id)
+}"""
+CREATE_GRANT_FEEDBACK_MUTATION: str = """mutation CreateGrantFeedback(
+    $input: GrantFeedbackInput!
+) {
+    createGrantFeedback(grantFeedbackInput: $input) { id }
+}"""
+CREATE_GRANT_FEEDBACKS_MUTATION: str = """mutation CreateGrantFeedbacks(
+    $inputs: [GrantFeedbackInput!]!
+) {
+    createGrantFeedbacks(grantFeedbackInputs: $inputs) {
+        items { id }
+        errors { index message }
+    }
+}"""
+UPDATE_GRANT_FEEDBACK_MUTATION: str = """mutation UpdateGrantFeedback(
+    $id: UUID!, $input: GrantFeedbackInput!
+) {
+    updateGrantFeedback(grantFeedbackId: $id, grantFeedbackInput: $input) { id }
+}"""
+DELETE_GRANT_FEEDBACK_MUTATION: str = """mutation DeleteGrantFeedback($id: UUID!) {
+    deleteGrantFeedback(grantFeedbackId: $id)
+}"""
+
+
+async def sample(engine: AsyncEngine, query: Select, size: int) -> list[Any]:
+    """Rows for destructive scenarios, each request consumes its own."""
+    async with engine.connect() as conn:
+        rows = (await conn.execute(query.limit(size))).all()
+
+    if len(rows) < size:
+        raise RuntimeError(f"Only {len(rows)} of {size} rows, increase --scale")
+    return [row if len(row) > 1 else row[0] for row in rows]
+
+
+def graphql(query: str, token: str, **variables: Any) -> Request:
+    return {
+        "method": "POST",
+        "url": "/graphql",
+        "json": {"query": query, "variables": variables},
+        "headers": {"Authorization": f"Bearer {token}"},
+    }
+
+
+def grant_input(foundation_id: uuid.UUID, name: str, amount: int = 10000) -> dict:
+    return {
+        "foundationId": str(foundation_id),
+        "name": name,
+        "amount": amount,
+        "deadline": (datetime.now(UTC) + timedelta(days=90)).isoformat(),
+        "location": "Benchmark City",
+        "area": "Benchmark",
+    }
+
+
+async def scenarios(engine: AsyncEngine, size: int, batch_size: int) -> list[Scenario]:
+    """Queries first, then mutations, the cascading deletes last."""
+    user_id, email = (
+        await sample(engine, select(User.id, User.email).order_by(User.email), 1)
+    )[0]
+    token: str = JWTManager.generate_token(data={"sub": str(user_id)})
+    foundation_id: uuid.UUID = (
+        await sample(engine, select(Foundation.id).order_by(Foundation.name), 1)
+    )[0]
+    run: str = uuid.uuid4().hex[:8]
+
+    seen: Select = select(GrantFeedback.grant_id).where(
+        GrantFeedback.user_id == user_id
+    )
+    unseen_grant_ids: list[uuid.UUID] = await sample(
+        engine,
+        select(Grant.id).where(Grant.id.not_in(seen)).order_by(Grant.id),
+        size * (1 + batch_size),
+    )
+    grant_ids: list[uuid.UUID] = await sample(
+        engine, select(Grant.id).order_by(Grant.created_at), size
+    )
+    # Deleted grants and foundations come from the end of the long tail.
+    deleted_grant_ids: list[uuid.UUID] = await sample(
+        engine,
+        select(Grant.id).order_by(Grant.created_at.desc()),
+        size * (1 + batch_size),
+    )
+    deleted_foundation_ids: list[uuid.UUID] = await sample(
+        engine,
+        select(Foundation.id)
+        .outerjoin(Grant)
+        .group_by(Foundation.id)
+        .order_by(func.count(Grant.id), Foundation.id),
+        size,
+    )
+    feedback_ids: list[uuid.UUID] = await sample(
+        engine, select(GrantFeedback.id).order_by(GrantFeedback.id), size
+    )
+    updated_feedbacks: list = await sample(
+        engine,
+        select(GrantFeedback.id, GrantFeedback.grant_id, GrantFeedback.user_id)
+        .where(GrantFeedback.id.not_in(feedback_ids))
+        .order_by(GrantFeedback.id),
+        size,
+    )
+
+    def feedback_input(grant_id: uuid.UUID, feedback_user_id: uuid.UUID) -> dict:
+        return {
+            "grantId": str(grant_id),
+            "userId": str(feedback_user_id),
+            "reaction": "LIKE",
+        }
+
+    def batch(ids: list[uuid.UUID], index: int) -> list[uuid.UUID]:
+        return ids[size + index * batch_size : size + (index + 1) * batch_size]
+
+    return [
+        ("grants", lambda i: graphql(GRANTS_QUERY, token, page=i % 50 + 1)),
+        ("grantMatches", lambda i: graphql(GRANT_MATCHES_QUERY, token)),
+        (
+            "grantOpportunities",
+            lambda i: graphql(GRANT_OPPORTUNITIES_QUERY, token, page=i % 5 + 1),
+        ),
+        ("foundations", lambda i: graphql(FOUNDATIONS_QUERY, token, page=i % 10 + 1)),
+        (
+            "login",
+            lambda i: {
+                "method": "POST",
+                "url": "/auth/login",
+                "json": {"email": email, "password": PASSWORD},
+            },
+        ),
+        (
+            "createGrant",
+            lambda i: graphql(
+                CREATE_GRANT_MUTATION,
+                token,
+                input=grant_input(foundation_id, f"Created {run} {i}"),
+            ),
+        ),
+        (
+            "updateGrant",
+            lambda i: graphql(
+                UPDATE_GRANT_MUTATION,
+                token,
+                id=str(grant_ids[i]),
+                input=grant_input(foundation_id, f"Updated {run} {i}"),
+            ),
+        ),
+        (
+            "createGrants",
+            lambda i: graphql(
+                CREATE_GRANTS_MUTATION,
+                token,
+                inputs=[
+                    grant_input(foundation_id, f"Bulk {run} {i} {index}")
+                    for index in range(batch_size)
+                ],
+            ),
+        ),
+        (
+            "upsertGrants",
+            lambda i: graphql(
+                UPSERT_GRANTS_MUTATION,
+                token,
+                inputs=[
+                    grant_input(foundation_id, f"Bulk {run} {i} {index}", amount=20000)
+                    for index in range(batch_size)
+                ],
+            ),
+        ),
+        (
+            "createFoundation",
+            lambda i: graphql(
+                CREATE_FOUNDATION_MUTATION,
+                token,
+                input={"name": f"Created {run} {i}"},
+            ),
+        ),
+        (
+            "updateFoundation",
+            lambda i: graphql(
+                UPDATE_FOUNDATION_MUTATION,
+                token,
+                id=str(foundation_id),
+                input={"name": f"Updated {run} {i}"},
+            ),
+        ),
+        (
+            "createGrantFeedback",
+            lambda i: graphql(
+                CREATE_GRANT_FEEDBACK_MUTATION,
+                token,
+                input=feedback_input(unseen_grant_ids[i], user_id),
+            ),
+        ),
+        (
+            "createGrantFeedbacks",
+            lambda i: graphql(
+                CREATE_GRANT_FEEDBACKS_MUTATION,
+                token,
+                inputs=[
+                    feedback_input(grant_id, user_id)
+                    for grant_id in batch(unseen_grant_ids, i)
+                ],
+            ),
+        ),
+        (
+            "updateGrantFeedback",
+            lambda i: graphql(
+                UPDATE_GRANT_FEEDBACK_MUTATION,
+                token,
+                id=str(updated_feedbacks[i][0]),
+                input={
+                    **feedback_input(updated_feedbacks[i][1], updated_feedbacks[i][2]),
+                    "reaction": "DISLIKE",
+                },
+            ),
+        ),
+        (
+            "deleteGrantFeedback",
+            lambda i: graphql(
+                DELETE_GRANT_FEEDBACK_MUTATION, token, id=str(feedback_ids[i])
+            ),
+        ),
+        (
+            "deleteGrant",
+            lambda i: graphql(
+                DELETE_GRANT_MUTATION, token, id=str(deleted_grant_ids[i])
+            ),
+        ),
+        (
+            "deleteGrants",
+            lambda i: graphql(
+                DELETE_GRANTS_MUTATION,
+                token,
+                ids=[str(id) for id in batch(deleted_grant_ids, i)],
+            ),
+        ),
+        (
+            "deleteFoundation",
+            lambda i: graphql(
+                DELETE_FOUNDATION_MUTATION, token, id=str(deleted_foundation_ids[i])
+            ),
+        ),
+    ]
+
+
+def failed(response: Any) -> bool:
+    return response.status_code >= 400 or (
+        response.headers.get("content-type", "").startswith("application/json")
+        and bool(response.json().get("errors"))
+    )
+
+
+async def load(
+    client: AsyncClient,
+    build: Callable[[int], Request],
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """Closed-loop load: `concurrency` clients each send their next request when
+    the previous one answered, like locust users without wait time."""
+    indexes = iter(range(requests))
+    samples: list[float] = []
+    errors: list[str] = []
+
+    async def user() -> None:
+        for index in indexes:
+            request: Request = build(index)
+            start: float = time.perf_counter()
+            response = await client.request(**request)
+            samples.append((time.perf_counter() - start) * 1000)
+            if failed(response):
+                errors.append(response.text[:200])
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*[user() for _ in range(concurrency)])
+    elapsed: float = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "throughput_rps": round(requests / elapsed, 2),
+        "latency": summarize(samples),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(
+    scale: int,
+    requests: int,
+    concurrency: int,
+    batch_size: int,
+    base_url: str | None,
+    only: list[str] | None,
+    seed: bool,
+) -> dict:
+    engine: AsyncEngine = get_engine()
+    if not base_url and engine.url != app_engine.url:
+        raise SystemExit(
+            "In-process runs read DATABASE_URL, set it to BENCHMARK_DATABASE_URL"
+        )
+    if seed:
+        await reset_schema(engine)
+        await seed_scale(scale=scale, seed=42, engine=engine)
+
+    client: AsyncClient = (
+        AsyncClient(base_url=base_url, timeout=60)
+        if base_url
+        else AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+    )
+    results: list[dict] = []
+    async with client:
+        for name, build in await scenarios(engine, requests, batch_size):
+            if only and name not in only:
+                continue
+
+            GRANT_MATCH_FEED.clear()
+            await RESPONSE_CACHE.clear()
+            results.append(
+                {"scenario": name, **await load(client, build, requests, concurrency)}
+            )
+            print(f"{name}: {results[-1]['latency']}", flush=True)
+
+    await engine.dispose()
+    await app_engine.dispose()
+    return {
+        "benchmark": "api",
+        "commit": git_commit(),
+        "scale": scale,
+        "concurrency": concurrency,
+        "batch_size": batch_size,
+        "target": base_url or "asgi",
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--only", default=None, help="comma separated scenarios")
+    parser.add_argument("--no-seed", action="store_true", help="reuse seeded data")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report: dict = asyncio.run(
+        run(
+            scale=args.scale,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            base_url=args.base_url,
+            only=args.only.split(",") if args.only else None,
+            seed=not args.no_seed,
+        )
+    )
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Latency of deleting a foundation together with its grants and their feedback.
+
+Compares the previous `session.delete()` through the ORM cascade with the single
+DELETE that removes the grants in a CTE, returning their ids, and leaves the
+feedback to the ON DELETE CASCADE foreign keys.
+
+    python -m benchmarks.bench_foundation_delete --scales 1000,10000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import CTE, delete, event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.enums import ReactionEnum
+from app.grant_feedback.models import GrantFeedback
+from app.user.models import User
+from benchmarks.utils import (
+    get_engine,
+    insert_rows,
+    reset_schema,
+    summarize,
+    write_report,
+)
+
+USERS: int = 5
+
+
+async def seed(
+    engine: AsyncEngine, grants: int, feedback_ratio: float, rng: random.Random
+) -> uuid.UUID:
+    await reset_schema(engine)
+    now: datetime = datetime.now(UTC)
+
+    users: list[dict] = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"User {index}",
+            "email": f"user{index}@example.com",
+            "password": "-",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(USERS)
+    ]
+    foundation: dict = {
+        "id": uuid.uuid4(),
+        "name": "Benchmark Foundation",
+        "created_at": now,
+        "updated_at": now,
+    }
+    grant_rows: list[dict] = [
+        {
+            "id": uuid.uuid4(),
+            "foundation_id": foundation["id"],
+            "name": f"Grant {index}",
+            "amount": rng.randint(1_000, 100_000),
+            "deadline": now + timedelta(days=rng.randint(1, 365)),
+            "location": "Benchmark City",
+            "area": "Benchmark",
+            "created_at": now + timedelta(seconds=index),
+            "updated_at": now,
+        }
+        for index in range(grants)
+    ]
+    feedback_rows: list[dict] = [
+        {
+            "id": uuid.uuid4(),
+            "grant_id": grant["id"],
+            "user_id": user["id"],
+            "reaction": rng.choice(list(ReactionEnum)).name,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for user in users
+        for grant in rng.sample(grant_rows, int(grants * feedback_ratio))
+    ]
+
+    async with engine.begin() as conn:
+        await insert_rows(conn, User.__table__, users)
+        await insert_rows(conn, Foundation.__table__, [foundation])
+        await insert_rows(conn, Grant.__table__, grant_rows)
+        await insert_rows(conn, GrantFeedback.__table__, feedback_rows)
+        await conn.exec_driver_sql("ANALYZE")
+
+    return foundation["id"]
+
+
+async def orm_delete(session: AsyncSession, foundation_id: uuid.UUID) -> None:
+    foundation: Foundation | None = await session.get(Foundation, foundation_id)
+    await session.delete(foundation)
+    await session.commit()
+
+
+async def cascade_delete(session: AsyncSession, foundation_id: uuid.UUID) -> None:
+    deleted_grants: CTE = (
+        delete(Grant)
+        .where(Grant.foundation_id == foundation_id)
+        .returning(Grant.id)
+        .cte("deleted_grants")
+    )
+    await session.execute(
+        delete(Foundation)
+        .where(Foundation.id == foundation_id)
+        .returning(
+            Foundation.id,
+            select(func.array_agg(deleted_grants.c.id)).scalar_subquery(),
+        )
+        .add_cte(deleted_grants)
+    )
+    await session.commit()
+
+
+async def run(scales: list[int], feedback_ratio: float, repeat: int) -> dict:
+    engine: AsyncEngine = get_engine()
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    rng: random.Random = random.Random(42)
+    plans: dict[str, Callable[[AsyncSession, uuid.UUID], Awaitable[None]]] = {
+        "orm": orm_delete,
+        "cascade": cascade_delete,
+    }
+
+    statements: list[Any] = []
+
+    def count_statement(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    results: list[dict] = []
+    for grants in scales:
+        for plan, delete_foundation in plans.items():
+            samples: list[float] = []
+            for _ in range(repeat):
+                foundation_id: uuid.UUID = await seed(
+                    engine, grants, feedback_ratio, rng
+                )
+                statements.clear()
+                async with session_maker() as session:
+                    start: float = time.perf_counter()
+                    await delete_foundation(session, foundation_id)
+                    samples.append((time.perf_counter() - start) * 1000)
+
+                async with engine.connect() as conn:
+                    left: int = len((await conn.execute(select(Grant.id))).all())
+                assert left == 0, f"{plan} left {left} grants behind"
+
+            results.append(
+                {
+                    "plan": plan,
+                    "grants": grants,
+                    "feedbacks": int(grants * feedback_ratio) * USERS,
+                    "statements": len(statements),
+                    "delete": summarize(samples),
+                }
+            )
+
+    await engine.dispose()
+    return {"benchmark": "foundation_delete", "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", default="1000,10000")
+    parser.add_argument("--feedback-ratio", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report: dict = asyncio.run(
+        run(
+            scales=[int(scale) for scale in args.scales.split(",")],
+            feedback_ratio=args.feedback_ratio,
+            repeat=args.repeat,
+        )
+    )
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
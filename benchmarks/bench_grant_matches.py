@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Latency of the grant matches ("swipe deck") query as grants and feedback grow.
+
+Compares the previous outer join + joinedload plan with the NOT EXISTS anti-join.
+
+    python -m benchmarks.bench_grant_matches --scales 1000,10000,100000
+"""
+
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import joinedload
+
+from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant.feed import unseen_grants_query
+from app.grant_feedback.enums import ReactionEnum
+from app.grant_feedback.models import GrantFeedback
+from app.user.models import User
+from benchmarks.utils import (
+    get_engine,
+    insert_rows,
+    measure,
+    reset_schema,
+    summarize,
+    write_report,
+)
+
+OTHER_USERS: int = 20
+OTHER_USERS_SEEN_RATIO: float = 0.1
+
+
+def legacy_matches_query(user_id: uuid.UUID) -> Select:
+    return (
+        select(Grant)
+        .outerjoin(Grant.feedbacks)
+        .filter(~Grant.feedbacks.any(GrantFeedback.user_id == user_id))
+        .options(joinedload(Grant.feedbacks))
+    )
+
+
+async def seed(
+    engine: AsyncEngine, grants: int, seen_ratio: float, rng: random.Random
+) -> uuid.UUID:
+    await reset_schema(engine)
+    now: datetime = datetime.now(UTC)
+
+    users: list[dict] = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"User {index}",
+            "email": f"user{index}@example.com",
+            "password": "-",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(OTHER_USERS + 1)
+    ]
+    foundation: dict = {
+        "id": uuid.uuid4(),
+        "name": "Benchmark Foundation",
+        "created_at": now,
+        "updated_at": now,
+    }
+    grant_rows: list[dict] = [
+        {
+            "id": uuid.uuid4(),
+            "foundation_id": foundation["id"],
+            "name": f"Grant {index}",
+            "amount": rng.randint(1_000, 100_000),
+            "deadline": now + timedelta(days=rng.randint(1, 365)),
+            "location": "Benchmark City",
+            "area": "Benchmark",
+            "created_at": now + timedelta(seconds=index),
+            "updated_at": now,
+        }
+        for index in range(grants)
+    ]
+
+    feedback_rows: list[dict] = []
+    for index, user in enumerate(users):
+        ratio: float = seen_ratio if index == 0 else OTHER_USERS_SEEN_RATIO
+        for grant in rng.sample(grant_rows, int(grants * ratio)):
+            feedback_rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "grant_id": grant["id"],
+                    "user_id": user["id"],
+                    "reaction": rng.choice(list(ReactionEnum)).name,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+    async with engine.begin() as conn:
+        await insert_rows(conn, User.__table__, users)
+        await insert_rows(conn, Foundation.__table__, [foundation])
+        await insert_rows(conn, Grant.__table__, grant_rows)
+        await insert_rows(conn, GrantFeedback.__table__, feedback_rows)
+        await conn.exec_driver_sql("ANALYZE")
+
+    return users[0]["id"]
+
+
+async def run(
+    scales: list[int], seen_ratio: float, page_size: int, repeat: int
+) -> dict:
+    engine: AsyncEngine = get_engine()
+    rng: random.Random = random.Random(42)
+    results: list[dict] = []
+
+    for grants in scales:
+        user_id: uuid.UUID = await seed(engine, grants, seen_ratio, rng)
+        plans: dict[str, Select] = {
+            "legacy": legacy_matches_query(user_id),
+            "anti_join": unseen_grants_query(user_id),
+        }
+
+        async with engine.connect() as conn:
+            for plan, query in plans.items():
+                page_query: Select = query.limit(page_size)
+                count_query: Select = select(func.count()).select_from(
+                    query.order_by(None).subquery()
+                )
+
+                results.append(
+                    {
+                        "plan": plan,
+                        "grants": grants,
+                        "feedbacks": int(
+                            grants * (seen_ratio + OTHER_USERS * OTHER_USERS_SEEN_RATIO)
+                        ),
+                        "first_page": summarize(
+                            await measure(partial(conn.execute, page_query), repeat)
+                        ),
+                        "count": summarize(
+                            await measure(partial(conn.execute, count_query), repeat)
+                        ),
+                    }
+                )
+
+    await engine.dispose()
+    return {"benchmark": "grant_matches", "page_size": page_size, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", default="1000,10000,100000")
+    parser.add_argument("--seen-ratio", type=float, default=0.5)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report: dict = asyncio.run(
+        run(
+            scales=[int(scale) for scale in args.scales.split(",")],
+            seen_ratio=args.seen_ratio,
+            page_size=args.page_size,
+            repeat=args.repeat,
+        )
+    )
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
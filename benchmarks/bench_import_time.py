@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Import time of `app.main`, what every worker pays before it can serve a request,
+as reported by `python -X importtime` in a fresh interpreter.
+
+    python -m benchmarks.bench_import_time --repeat 5
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+from benchmarks.utils import summarize, write_report
+
+MODULE: str = "app.main"
+# Packages owned by this repository, the rest is third party.
+OWN_PACKAGES: tuple[str, ...] = ("app", "lib")
+
+
+def import_times(module: str = MODULE) -> dict[str, tuple[int, int]]:
+    """(self, cumulative) microseconds of every module the import loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return times
+
+
+def own_ms(times: dict[str, tuple[int, int]]) -> float:
+    return (
+        sum(
+            self_us
+            for name, (self_us, _) in times.items()
+            if name.split(".")[0] in OWN_PACKAGES
+        )
+        / 1000
+    )
+
+
+def run(repeat: int, top: int) -> dict:
+    runs: list[dict[str, tuple[int, int]]] = [import_times() for _ in range(repeat)]
+
+    packages: dict[str, list[float]] = defaultdict(list)
+    for times in runs:
+        totals: dict[str, int] = defaultdict(int)
+        for name, (self_us, _) in times.items():
+            totals[name.split(".")[0]] += self_us
+        for package, total in totals.items():
+            packages[package].append(total / 1000)
+
+    return {
+        "benchmark": "import_time",
+        "module": MODULE,
+        "total": summarize([times[MODULE][1] / 1000 for times in runs]),
+        "own": summarize([own_ms(times) for times in runs]),
+        "packages_ms": dict(
+            sorted(
+                ((package, round(min(ms), 1)) for package, ms in packages.items()),
+                key=lambda item: -item[1],
+            )[:top]
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    write_report(run(repeat=args.repeat, top=args.top), args.output)
+
+
+if __name__ == "__main__":
+    main()
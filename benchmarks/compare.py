@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compares two benchmark reports scenario by scenario.
+
+Exits with 1 when a p95 latency grew by more than `--threshold` (a ratio), so it
+can gate a commit against the report of its parent.
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+
+
+def index(report: dict) -> dict[str, dict]:
+    return {
+        result.get("scenario") or result.get("plan"): result
+        for result in report["results"]
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    rows: list[dict] = []
+    baseline_results: dict[str, dict] = index(baseline)
+    for name, result in index(current).items():
+        previous: dict | None = baseline_results.get(name)
+        if previous is None or "latency" not in result:
+            continue
+
+        before: float = previous["latency"]["p95_ms"]
+        after: float = result["latency"]["p95_ms"]
+        change: float = (after - before) / before if before else 0.0
+        rows.append(
+            {
+                "scenario": name,
+                "p95_before_ms": before,
+                "p95_after_ms": after,
+                "change": round(change, 3),
+                "regression": change > threshold,
+            }
+        )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        rows: list[dict] = compare(
+            json.load(baseline), json.load(current), args.threshold
+        )
+
+    print(json.dumps(rows, indent=2))
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.exceptions import GraphQLError
+
+from app.config import MAX_BATCH_SIZE
+from lib.graphql import BulkErrorType, BulkResultType
+from lib.sqlalchemy import any_of
+
+
+def check_batch_size(size: int) -> None:
+    if size > int(MAX_BATCH_SIZE):
+        raise GraphQLError(f"Batch size exceeds the maximum of {MAX_BATCH_SIZE}!")
+
+
+async def existing_ids(
+    db: AsyncSession, column: ColumnElement, ids: Sequence[UUID]
+) -> set[UUID]:
+    if not ids:
+        return set()
+
+    query: Select = select(column).where(any_of(column, set(ids)))
+    return set((await db.scalars(query)).all())
+
+
+def duplicate_indexes(keys: Sequence[Any]) -> set[int]:
+    """Indexes of keys already seen earlier in the batch."""
+    seen: set[Any] = set()
+    duplicates: set[int] = set()
+    for index, key in enumerate(keys):
+        if key in seen:
+            duplicates.add(index)
+        seen.add(key)
+
+    return duplicates
+
+
+def bulk_result(items: list[Any], errors: dict[int, str]) -> BulkResultType:
+    return BulkResultType(
+        items=items,
+        errors=[
+            BulkErrorType(index=index, message=message)
+            for index, message in sorted(errors.items())
+        ],
+    )
@@ -0,0 +1,195 @@
+from typing import Any, AsyncIterator
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+)
+from graphql.execution.values import get_argument_values
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+from app.config import GRAPHQL_MAX_COST, GRAPHQL_MAX_DEPTH, MAX_PAGE_SIZE
+from lib.graphql import PaginationInput
+
+
+class QueryCost(SchemaExtension):
+    """
+    Rejects operations whose estimated cost or depth is over the limits.
+
+    An object field costs 1 plus its children, multiplied by the number of rows it
+    can return: `queryInput` page/cursor size for the `items` of a page, `first`
+    or MAX_PAGE_SIZE for nested lists, which their resolvers cap at the same
+    size. Scalars are free. Requests sent with `extensions: {"cost": true}`
+    get the estimate back under `extensions.cost`.
+    """
+
+    def __init__(self, *, execution_context: Any = None) -> None:
+        super().__init__(execution_context=execution_context)
+        self.cost: int | None = None
+        self.depth: int | None = None
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = self.execution_context
+        operation: OperationDefinitionNode | None = get_operation_ast(
+            execution_context.graphql_document, execution_context.operation_name
+        )
+        if operation is not None:
+            analysis = _Analysis(
+                schema=execution_context.schema._schema,
+                fragments={
+                    definition.name.value: definition
+                    for definition in execution_context.graphql_document.definitions
+                    if isinstance(definition, FragmentDefinitionNode)
+                },
+                variables=execution_context.variables or {},
+            )
+            root: GraphQLObjectType | None = (
+                execution_context.schema._schema.get_root_type(operation.operation)
+            )
+            try:
+                self.cost, self.depth = analysis.measure(root, operation.selection_set)
+            except GraphQLError:
+                # Bad variables are reported by execution itself.
+                pass
+
+        error: GraphQLError | None = None
+        if self.depth is not None and self.depth > int(GRAPHQL_MAX_DEPTH):
+            error = GraphQLError(
+                f"Query depth {self.depth} exceeds the maximum of {GRAPHQL_MAX_DEPTH}!"
+            )
+        elif self.cost is not None and self.cost > int(GRAPHQL_MAX_COST):
+            error = GraphQLError(
+                f"Query cost {self.cost} exceeds the maximum of {GRAPHQL_MAX_COST}!"
+            )
+        if error is not None:
+            execution_context.result = ExecutionResult(data=None, errors=[error])
+
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        operation_extensions: dict = self.execution_context.operation_extensions or {}
+        if self.cost is None or not operation_extensions.get("cost"):
+            return {}
+
+        return {
+            "cost": {
+                "requested": self.cost,
+                "maximum": int(GRAPHQL_MAX_COST),
+                "depth": self.depth,
+                "maxDepth": int(GRAPHQL_MAX_DEPTH),
+            }
+        }
+
+
+class _Analysis:
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        variables: dict[str, Any],
+    ) -> None:
+        self.schema: GraphQLSchema = schema
+        self.fragments: dict[str, FragmentDefinitionNode] = fragments
+        self.variables: dict[str, Any] = variables
+
+    def measure(
+        self,
+        parent: GraphQLObjectType | None,
+        selection_set: SelectionSetNode | None,
+        page_size: int | None = None,
+    ) -> tuple[int, int]:
+        """(cost, depth) of a selection set, `page_size` sizes the next list field."""
+        if parent is None or selection_set is None:
+            return 0, 0
+
+        cost: int = 0
+        depth: int = 0
+        for field, field_parent in self._fields(parent, selection_set):
+            field_definition = field_parent.fields.get(field.name.value)
+            if field_definition is None:
+                continue
+
+            named_type = get_named_type(field_definition.type)
+            if not isinstance(named_type, GraphQLObjectType):
+                depth = max(depth, 1)
+                continue
+
+            arguments: dict = get_argument_values(
+                field_definition, field, self.variables
+            )
+            child_page_size: int | None = _page_size(arguments.get("queryInput"))
+            rows: int = 1
+            if _is_list(field_definition.type):
+                # Sizes below 1 are rejected by the resolvers, they must not
+                # cancel out the cost of sibling fields here.
+                rows = max(
+                    1,
+                    arguments.get("first") or page_size or int(MAX_PAGE_SIZE),
+                )
+
+            child_cost, child_depth = self.measure(
+                named_type, field.selection_set, child_page_size
+            )
+            cost += rows * (1 + child_cost)
+            depth = max(depth, child_depth + 1)
+
+        return cost, depth
+
+    def _fields(
+        self, parent: GraphQLObjectType, selection_set: SelectionSetNode
+    ) -> list[tuple[FieldNode, GraphQLObjectType]]:
+        fields: list[tuple[FieldNode, GraphQLObjectType]] = []
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields.append((selection, parent))
+            elif isinstance(selection, InlineFragmentNode):
+                fields += self._fields(
+                    self._condition(parent, selection), selection.selection_set
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is not None:
+                    fields += self._fields(
+                        self._condition(parent, fragment), fragment.selection_set
+                    )
+
+        return fields
+
+    def _condition(
+        self,
+        parent: GraphQLObjectType,
+        fragment: InlineFragmentNode | FragmentDefinitionNode,
+    ) -> GraphQLObjectType:
+        if fragment.type_condition is None:
+            return parent
+
+        condition = self.schema.get_type(fragment.type_condition.name.value)
+        return condition if isinstance(condition, GraphQLObjectType) else parent
+
+
+def _page_size(query_input: dict | None) -> int | None:
+    if query_input is None:
+        return None
+
+    for key in ("cursor", "pagination"):
+        if query_input.get(key):
+            return query_input[key].get("size", PaginationInput().size)
+
+    return PaginationInput().size
+
+
+def _is_list(type_: Any) -> bool:
+    if isinstance(type_, GraphQLNonNull):
+        type_ = type_.of_type
+    return isinstance(type_, GraphQLList)
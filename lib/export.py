@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+
+class ExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES: dict[ExportFormatEnum, str] = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.name
+    return value
+
+
+def _encode(
+    rows: Sequence[Row], columns: list[str], export_format: ExportFormatEnum
+) -> str:
+    if export_format == ExportFormatEnum.CSV:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([[_value(value) for value in row] for row in rows])
+        return buffer.getvalue()
+
+    return "".join(
+        json.dumps(dict(zip(columns, [_value(value) for value in row]))) + "\n"
+        for row in rows
+    )
+
+
+async def stream_rows(
+    db: AsyncSession, query: Select, export_format: ExportFormatEnum, batch_size: int
+) -> AsyncIterator[str]:
+    """
+    Encodes the rows of a column query chunk by chunk from a server-side cursor.
+
+    Only one batch of rows is held at a time, selecting columns instead of
+    entities keeps them out of the identity map.
+    """
+    columns: list[str] = [column.key for column in query.selected_columns]
+    if export_format == ExportFormatEnum.CSV:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(columns)
+        yield buffer.getvalue()
+
+    result: AsyncResult = await db.stream(query.execution_options(yield_per=batch_size))
+    async for rows in result.partitions():
+        yield _encode(rows, columns, export_format)
@@ -1,3 +1,4 @@
+from enum import Enum, auto
 from typing import Generic, List, Optional, TypeVar
 
 import strawberry
@@ -5,22 +6,52 @@ import strawberry
 T = TypeVar("T")
 
 
+class SearchModeEnum(Enum):
+    CONTAINS = auto()
+    SIMILAR = auto()
+
+
 @strawberry.input
 class PaginationInput:
     page: int = 1
     size: int = 10
 
 
+@strawberry.input
+class CursorInput:
+    size: int = 10
+    after: Optional[str] = None
+    before: Optional[str] = None
+    include_total: bool = False
+
+
 @strawberry.input
 class QueryInput:
-    pagination: PaginationInput = strawberry.field(default_factory=PaginationInput)
+    pagination: Optional[PaginationInput] = None
+    cursor: Optional[CursorInput] = None
     search: Optional[str] = None
+    search_mode: SearchModeEnum = SearchModeEnum.CONTAINS
+    ignore_case: bool = False
 
 
 @strawberry.type
 class PageType(Generic[T]):
     items: List[T]
-    total: int
-    page: int
+    total: Optional[int]
+    page: Optional[int]
     size: int
-    pages: int
+    pages: Optional[int]
+    after: Optional[str] = None
+    before: Optional[str] = None
+
+
+@strawberry.type
+class BulkErrorType:
+    index: int
+    message: str
+
+
+@strawberry.type
+class BulkResultType(Generic[T]):
+    items: List[T]
+    errors: List[BulkErrorType]
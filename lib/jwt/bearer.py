@@ -1,6 +1,7 @@
 from typing import Any
 from uuid import UUID
 
+from fastapi import HTTPException, status
 from fastapi.requests import Request
 from strawberry.permission import BasePermission
 from strawberry.types import Info
@@ -8,16 +9,31 @@ from strawberry.types import Info
 from lib.jwt.manager import JWTManager
 
 
+def authenticate(request: Request) -> UUID | None:
+    authentication: str | None = request.headers.get("authorization")
+    if authentication:
+        token: str = authentication.split("Bearer ")[-1]
+        return JWTManager.verify_jwt(token)
+    return None
+
+
+def require_user(request: Request) -> UUID:
+    """FastAPI dependency guarding REST routes like Authenticate guards fields."""
+    user_id: UUID | None = authenticate(request)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=Authenticate.message,
+        )
+    return user_id
+
+
 class Authenticate(BasePermission):
     message: str = "User is not Authenticated"
 
     def has_permission(self, _source: Any, info: Info, **_kwargs) -> bool:
-        request: Request = info.context["request"]
-        authentication: str | None = request.headers.get("authorization")
-        if authentication:
-            token: str = authentication.split("Bearer ")[-1]
-            user_id: UUID | None = JWTManager.verify_jwt(token)
-            if user_id:
-                info.context["user_id"] = user_id
-                return True
-        return False
+        # Every protected field checks permission, verify the token once per request.
+        if "user_id" not in info.context:
+            info.context["user_id"] = authenticate(info.context["request"])
+
+        return info.context["user_id"] is not None
@@ -1,15 +1,29 @@
+import hashlib
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from jose import jwt
 from strawberry.exceptions import GraphQLError
 
-from app.config import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY
+from app.config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    SECRET_KEY,
+    TOKEN_CACHE_MAX_SIZE,
+    TOKEN_CACHE_TTL_SECONDS,
+)
+from lib.cache import LRUCache
+
+# sha256(token) -> (sub, exp) of tokens that already passed signature checks.
+TOKEN_CACHE: LRUCache[bytes, tuple[UUID, float]] = LRUCache(
+    maxsize=int(TOKEN_CACHE_MAX_SIZE), ttl=float(TOKEN_CACHE_TTL_SECONDS)
+)
 
 
 class JWTManager:
     @staticmethod
     def generate_token(data: dict) -> str:
+        from jose import jwt
+
         to_encode: dict = data.copy()
         expire: datetime = datetime.now() + timedelta(
             minutes=int(ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -21,13 +35,31 @@ class JWTManager:
 
     @staticmethod
     def verify_jwt(token: str) -> UUID | None:
+        digest: bytes = hashlib.sha256(token.encode()).digest()
+        current_timestamp: float = datetime.now().timestamp()
+        cached: tuple[UUID, float] | None = TOKEN_CACHE.get(digest)
+        if cached is not None:
+            user_id, expire = cached
+            if expire <= current_timestamp:
+                TOKEN_CACHE.delete(digest)
+                return None
+            return user_id
+
+        from jose import jwt
+
         try:
             decode_token: dict = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            current_timestamp: float = datetime.now().timestamp()
             if not decode_token:
                 raise GraphQLError("Invalid token!")
             elif decode_token["exp"] <= current_timestamp:
                 raise GraphQLError("Token expired!")
-            return UUID(decode_token["sub"])
+            user_id = UUID(decode_token["sub"])
         except Exception:
             return None
+
+        TOKEN_CACHE.set(digest, (user_id, decode_token["exp"]))
+        return user_id
+
+    @staticmethod
+    def cache_stats() -> dict:
+        return TOKEN_CACHE.stats()
@@ -0,0 +1,24 @@
+from typing import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LazyApp:
+    """
+    ASGI app built by `factory` on its first request.
+
+    Whatever the factory imports stays off the boot path, the first request
+    (or an explicit `load()`) pays for it instead.
+    """
+
+    def __init__(self, factory: Callable[[], ASGIApp]) -> None:
+        self.factory: Callable[[], ASGIApp] = factory
+        self._app: ASGIApp | None = None
+
+    def load(self) -> ASGIApp:
+        if self._app is None:
+            self._app = self.factory()
+        return self._app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.load()(scope, receive, send)
@@ -0,0 +1,130 @@
+import re
+import time
+from typing import Any, Iterator
+
+from graphql import OperationDefinitionNode
+from graphql.utilities import get_operation_ast
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from strawberry.extensions import SchemaExtension
+
+from app.config import METRICS_MAX_OPERATIONS, PROMETHEUS_MULTIPROC_DIR
+
+HTTP_REQUEST_DURATION: Histogram = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["route", "method", "status"],
+)
+GRAPHQL_OPERATION_DURATION: Histogram = Histogram(
+    "graphql_operation_duration_seconds",
+    "GraphQL operation latency by operation name.",
+    ["operation", "type"],
+)
+
+# labels() validates and locks on every call, the children are reused instead.
+_children: dict[tuple[Histogram, tuple[str, ...]], Any] = {}
+
+
+def observe(histogram: Histogram, labels: tuple[str, ...], value: float) -> None:
+    child: Any = _children.get((histogram, labels))
+    if child is None:
+        child = _children[(histogram, labels)] = histogram.labels(*labels)
+    child.observe(value)
+
+
+_OPERATION_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,63}")
+_operations: set[str] = set()
+
+
+def operation_label(name: str | None) -> str:
+    """Client-chosen names are capped to METRICS_MAX_OPERATIONS label values."""
+    if not name or not _OPERATION_NAME.fullmatch(name):
+        return "anonymous"
+    if name not in _operations:
+        if len(_operations) >= int(METRICS_MAX_OPERATIONS):
+            return "other"
+        _operations.add(name)
+    return name
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing every request that matched a route.
+
+    The label is the route template the router stored in the scope, so unmatched
+    paths never create label values.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started: float = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route: Any = scope.get("route")
+            if route is not None:
+                observe(
+                    HTTP_REQUEST_DURATION,
+                    (route.path, scope["method"], str(status)),
+                    time.perf_counter() - started,
+                )
+
+
+class OperationMetrics(SchemaExtension):
+    def on_operation(self) -> Iterator[None]:
+        started: float = time.perf_counter()
+        yield
+
+        execution_context = self.execution_context
+        operation: OperationDefinitionNode | None = (
+            get_operation_ast(
+                execution_context.graphql_document, execution_context.operation_name
+            )
+            if execution_context.graphql_document is not None
+            else None
+        )
+        observe(
+            GRAPHQL_OPERATION_DURATION,
+            (
+                operation_label(execution_context.operation_name),
+                operation.operation.value if operation is not None else "invalid",
+            ),
+            time.perf_counter() - started,
+        )
+
+
+def render() -> tuple[bytes, str]:
+    """Exposition of this worker, or of every worker in multiprocess mode."""
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    from prometheus_client.multiprocess import MultiProcessCollector
+
+    registry: CollectorRegistry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
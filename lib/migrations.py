@@ -0,0 +1,46 @@
+from typing import Any, Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+
+def create_index_concurrently(
+    index_name: str, table_name: str, columns: Sequence[str], **kwargs: Any
+) -> None:
+    """
+    CREATE INDEX CONCURRENTLY, which only blocks writes to the table for the
+    two short catalog updates instead of the whole build.
+
+    It cannot run inside a transaction, so it commits whatever the migration did
+    before it. A build that failed halfway leaves an INVALID index behind that
+    IF NOT EXISTS would skip, it is dropped and rebuilt instead.
+    """
+    with op.get_context().autocommit_block():
+        invalid: bool | None = (
+            op.get_bind()
+            .execute(
+                text(
+                    "SELECT NOT indisvalid FROM pg_index "
+                    "WHERE indexrelid = to_regclass(:index_name)"
+                ),
+                {"index_name": index_name},
+            )
+            .scalar()
+        )
+        if invalid:
+            op.drop_index(index_name, table_name, postgresql_concurrently=True)
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name, table_name, postgresql_concurrently=True, if_exists=True
+        )
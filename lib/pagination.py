@@ -0,0 +1,124 @@
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.exceptions import GraphQLError
+
+from app.config import MAX_PAGE_SIZE
+from lib.graphql import CursorInput, PageType, PaginationInput, QueryInput
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    payload: str = json.dumps([created_at.isoformat(), str(id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError, binascii.Error) as exc:
+        # JSONDecodeError and UnicodeDecodeError are ValueErrors.
+        raise GraphQLError("Invalid cursor!") from exc
+
+
+def check_page_size(size: int) -> None:
+    if size < 1:
+        raise GraphQLError("Page size must be at least 1!")
+    if size > int(MAX_PAGE_SIZE):
+        raise GraphQLError(f"Page size exceeds the maximum of {MAX_PAGE_SIZE}!")
+
+
+def check_page(page: int) -> None:
+    if page < 1:
+        raise GraphQLError("Page must be at least 1!")
+
+
+async def paginate(
+    db: AsyncSession, query: Select, query_input: QueryInput, model: Any
+) -> PageType:
+    if query_input.cursor is not None:
+        return await keyset_paginate(
+            db=db, query=query, cursor=query_input.cursor, model=model
+        )
+
+    from fastapi_pagination import Page, Params
+    from fastapi_pagination.ext.sqlalchemy import apaginate
+
+    pagination: PaginationInput = query_input.pagination or PaginationInput()
+    check_page_size(pagination.size)
+    check_page(pagination.page)
+    page: Page = await apaginate(
+        conn=db,
+        query=query,
+        params=Params(page=pagination.page, size=pagination.size),
+    )
+
+    return PageType(
+        items=page.items,
+        total=page.total,
+        page=page.page,
+        size=page.size,
+        pages=page.pages,
+    )
+
+
+async def keyset_paginate(
+    db: AsyncSession, query: Select, cursor: CursorInput, model: Any
+) -> PageType:
+    """Seek on (created_at, id) so every page costs the same as the first one."""
+    check_page_size(cursor.size)
+    if cursor.after and cursor.before:
+        raise GraphQLError("Only one of after/before can be set!")
+
+    key = tuple_(model.created_at, model.id)
+    # Replaces the query's own ordering, order_by() appends to it otherwise.
+    keyset_query: Select = query.order_by(None)
+    if cursor.before:
+        keyset_query = keyset_query.filter(key < decode_cursor(cursor.before))
+        keyset_query = keyset_query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        if cursor.after:
+            keyset_query = keyset_query.filter(key > decode_cursor(cursor.after))
+        keyset_query = keyset_query.order_by(model.created_at, model.id)
+
+    items: list = list(
+        (await db.execute(keyset_query.limit(cursor.size + 1))).unique().scalars()
+    )
+    has_more: bool = len(items) > cursor.size
+    items = items[: cursor.size]
+    if cursor.before:
+        items.reverse()
+
+    after: str | None = None
+    before: str | None = None
+    if items:
+        if has_more or cursor.before:
+            after = encode_cursor(items[-1].created_at, items[-1].id)
+        if (has_more and cursor.before) or cursor.after:
+            before = encode_cursor(items[0].created_at, items[0].id)
+
+    total: int | None = None
+    pages: int | None = None
+    if cursor.include_total:
+        count_query: Select = select(func.count()).select_from(
+            query.order_by(None).subquery()
+        )
+        total = (await db.execute(count_query)).scalar_one()
+        pages = math.ceil(total / cursor.size) if cursor.size else 0
+
+    return PageType(
+        items=items,
+        total=total,
+        page=None,
+        size=cursor.size,
+        pages=pages,
+        after=after,
+        before=before,
+    )
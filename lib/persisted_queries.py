@@ -0,0 +1,174 @@
+import hashlib
+from dataclasses import replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from graphql import GraphQLError, parse
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.schema import Schema
+from strawberry.schema.schema import validate_document
+from strawberry.types import ExecutionContext, ExecutionResult
+
+from app.config import GRAPHQL_DOCUMENT_CACHE_SIZE
+from lib.cache import LRUCache
+
+_parse_document = lru_cache(maxsize=int(GRAPHQL_DOCUMENT_CACHE_SIZE))(parse)
+_validate_document = lru_cache(maxsize=int(GRAPHQL_DOCUMENT_CACHE_SIZE))(
+    validate_document
+)
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Reuses parsed and validated documents across requests.
+
+    Persisted queries resolve to the same document string every time, so both
+    lookups hit on a cached hash instead of re-reading the whole document.
+    """
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        execution_context.graphql_document = _parse_document(
+            execution_context.query, **execution_context.parse_options
+        )
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        execution_context.pre_execution_errors = _validate_document(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.validation_rules,
+        )
+        yield
+
+
+def document_cache_stats() -> dict:
+    info = _parse_document.cache_info()
+    lookups: int = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def document_hash(document: str) -> str:
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+class PersistedQueryRegistry:
+    """Documents by sha256, allow-listed ones are pinned, APQ ones are an LRU."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._allowed: dict[str, str] = {}
+        self._registered: LRUCache[str, str] = LRUCache(maxsize=maxsize)
+
+    def load(self, directory: str) -> None:
+        for path in sorted(Path(directory).glob("**/*.graphql")):
+            document: str = path.read_text()
+            self._allowed[document_hash(document)] = document
+
+    def get(self, sha256: str) -> str | None:
+        return self._allowed.get(sha256) or self._registered.get(sha256)
+
+    def register(self, sha256: str, document: str) -> None:
+        if sha256 not in self._allowed:
+            self._registered.set(sha256, document)
+
+    def is_allowed(self, sha256: str) -> bool:
+        return sha256 in self._allowed
+
+    def precompile(self, schema: Schema) -> None:
+        """Parses and validates the allow-listed documents into the DocumentCache."""
+        for document in self._allowed.values():
+            execution_context = ExecutionContext(
+                query=document, schema=schema, allowed_operations=()
+            )
+            try:
+                graphql_document = _parse_document(
+                    document, **execution_context.parse_options
+                )
+            except GraphQLError:
+                # Reported to the client that sends it.
+                continue
+            _validate_document(
+                schema._schema, graphql_document, execution_context.validation_rules
+            )
+
+    def stats(self) -> dict:
+        return {"allowed": len(self._allowed), **self._registered.stats()}
+
+
+def _error(message: str, code: str) -> ExecutionResult:
+    return ExecutionResult(
+        data=None, errors=[GraphQLError(message, extensions={"code": code})]
+    )
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """
+    GraphQLRouter speaking the automatic persisted query protocol.
+
+    Clients send `extensions.persistedQuery.sha256Hash` alone and only upload the
+    document after a PersistedQueryNotFound. With `allow_list` set, only documents
+    loaded into the registry run and nothing can be registered at runtime.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        registry: PersistedQueryRegistry,
+        allow_list: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.registry: PersistedQueryRegistry = registry
+        self.allow_list: bool = allow_list
+
+    async def execute_single(
+        self,
+        request: Any,
+        request_adapter: Any,
+        sub_response: Any,
+        context: Any,
+        root_value: Any,
+        request_data: GraphQLRequestData,
+    ) -> ExecutionResult:
+        persisted_query: dict = (request_data.extensions or {}).get(
+            "persistedQuery"
+        ) or {}
+        sha256: str | None = persisted_query.get("sha256Hash")
+        query: str | None = request_data.query
+
+        if sha256 is None and query is not None:
+            if self.allow_list and not self.registry.is_allowed(document_hash(query)):
+                return _error(
+                    "Query is not allow-listed!", "PERSISTED_QUERY_NOT_ALLOWED"
+                )
+        elif sha256 is not None and query is None:
+            query = self.registry.get(sha256)
+            if query is None:
+                return _error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        elif sha256 is not None and query is not None:
+            if document_hash(query) != sha256:
+                return _error("provided sha does not match query", "INVALID_SHA256")
+            if self.allow_list and not self.registry.is_allowed(sha256):
+                return _error(
+                    "Query is not allow-listed!", "PERSISTED_QUERY_NOT_ALLOWED"
+                )
+            self.registry.register(sha256, query)
+
+        return await super().execute_single(
+            request=request,
+            request_adapter=request_adapter,
+            sub_response=sub_response,
+            context=context,
+            root_value=root_value,
+            request_data=replace(request_data, query=query),
+        )
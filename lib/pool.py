@@ -0,0 +1,46 @@
+import statistics
+import time
+from collections import deque
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout latency, timeouts and saturation."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts: int = 0
+        self.timeouts: int = 0
+        self.max_wait: float = 0.0
+        self._waits: deque[float] = deque(maxlen=1024)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait: float = time.perf_counter() - started
+            self.checkouts += 1
+            self.max_wait = max(self.max_wait, wait)
+            self._waits.append(wait)
+
+    def stats(self) -> dict:
+        capacity: int = self.size() + max(self._max_overflow, 0)
+        waits: list[float] = sorted(self._waits)
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "saturation": self.checkedout() / capacity if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_p50_ms": statistics.median(waits) * 1000 if waits else 0.0,
+            "wait_p95_ms": waits[int(len(waits) * 0.95)] * 1000 if waits else 0.0,
+            "wait_max_ms": self.max_wait * 1000,
+        }
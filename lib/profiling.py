@@ -0,0 +1,196 @@
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Iterator
+
+from graphql import GraphQLResolveInfo
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from strawberry.extensions import SchemaExtension
+from strawberry.extensions.tracing.utils import should_skip_tracing
+
+from app.config import GRAPHQL_PROFILE_HEADER, GRAPHQL_PROFILING, N_PLUS_ONE_THRESHOLD
+
+OPERATION: str = "(operation)"
+
+
+class _Timing:
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.duration: float = 0.0
+        self.queries: int = 0
+        self.rows: int = 0
+        self.db: float = 0.0
+
+
+class Profile:
+    """Resolver and SQL timings of one operation, keyed by field path."""
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        self.timings: defaultdict[str, _Timing] = defaultdict(_Timing)
+        self.statements: Counter[str] = Counter()
+        self.statement_paths: defaultdict[str, set[str]] = defaultdict(set)
+
+    def record_resolver(self, path: str, duration: float) -> None:
+        timing: _Timing = self.timings[path]
+        timing.calls += 1
+        timing.duration += duration
+
+    def record_statement(
+        self, path: str, statement: str, rows: int, duration: float
+    ) -> None:
+        timing: _Timing = self.timings[path]
+        timing.queries += 1
+        timing.rows += max(rows, 0)
+        timing.db += duration
+        self.statements[statement] += 1
+        self.statement_paths[statement].add(path)
+
+    def summary(self) -> dict[str, Any]:
+        timings: list[tuple[str, _Timing]] = sorted(
+            self.timings.items(), key=lambda item: item[1].duration, reverse=True
+        )
+        return {
+            "durationMs": _ms(time.perf_counter() - self.started),
+            "queries": sum(timing.queries for _, timing in timings),
+            "dbMs": _ms(sum(timing.db for _, timing in timings)),
+            "resolvers": [
+                {
+                    "path": path,
+                    "calls": timing.calls,
+                    "durationMs": _ms(timing.duration),
+                    "queries": timing.queries,
+                    "rows": timing.rows,
+                    "dbMs": _ms(timing.db),
+                }
+                for path, timing in timings
+            ],
+            "nPlusOne": [
+                {
+                    "statement": statement,
+                    "count": count,
+                    "paths": sorted(self.statement_paths[statement]),
+                }
+                for statement, count in self.statements.most_common()
+                if count > int(N_PLUS_ONE_THRESHOLD)
+            ],
+        }
+
+
+# (profile, field path) of the resolver running in the current task.
+_current: ContextVar[tuple[Profile, str] | None] = ContextVar(
+    "profiling_current", default=None
+)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _path(info: GraphQLResolveInfo) -> str:
+    """`grants.items.feedbacks`, list indexes are folded into one entry."""
+    return ".".join(str(key) for key in info.path.as_list() if isinstance(key, str))
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(connection: Connection, *_args: Any) -> None:
+    if _current.get() is not None:
+        connection.info.setdefault("profiling_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    connection: Connection, cursor: Any, statement: str, *_args: Any
+) -> None:
+    current: tuple[Profile, str] | None = _current.get()
+    started: list[float] = connection.info.get("profiling_started") or []
+    if current is None or not started:
+        return
+
+    profile, path = current
+    profile.record_statement(
+        path=path,
+        statement=statement,
+        rows=cursor.rowcount,
+        duration=time.perf_counter() - started.pop(),
+    )
+
+
+class QueryProfiler(SchemaExtension):
+    """
+    Attributes resolver time and SQL statements to the fields that ran them.
+
+    With GRAPHQL_PROFILING on, requests carrying GRAPHQL_PROFILE_HEADER get the
+    summary under `extensions.profile`, including the statements executed more
+    than N_PLUS_ONE_THRESHOLD times. Data loader batches count towards the field
+    that first scheduled them, statements outside resolvers towards
+    `(operation)`. Other requests only pay for one header lookup.
+    """
+
+    def __init__(self, *, execution_context: Any = None) -> None:
+        super().__init__(execution_context=execution_context)
+        self.profile: Profile | None = None
+
+    def on_operation(self) -> Iterator[None]:
+        request: Any = (self.execution_context.context or {}).get("request")
+        if (
+            GRAPHQL_PROFILING != "true"
+            or request is None
+            or not request.headers.get(GRAPHQL_PROFILE_HEADER)
+        ):
+            yield
+            return
+
+        self.profile = Profile()
+        token = _current.set((self.profile, OPERATION))
+        try:
+            yield
+        finally:
+            _current.reset(token)
+
+    def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        # Strawberry keeps the first request's instance as resolver middleware,
+        # the profile of the running request comes from the context instead.
+        current: tuple[Profile, str] | None = _current.get()
+        if current is None or should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
+
+        profile: Profile = current[0]
+        path: str = _path(info)
+        started: float = time.perf_counter()
+        token = _current.set((profile, path))
+        try:
+            result: Any = _next(root, info, *args, **kwargs)
+        finally:
+            _current.reset(token)
+
+        if isawaitable(result):
+            return self._resolve_async(result, profile, path, started)
+
+        profile.record_resolver(path, time.perf_counter() - started)
+        return result
+
+    async def _resolve_async(
+        self, result: Awaitable, profile: Profile, path: str, started: float
+    ) -> Any:
+        token = _current.set((profile, path))
+        try:
+            return await result
+        finally:
+            _current.reset(token)
+            profile.record_resolver(path, time.perf_counter() - started)
+
+    def get_results(self) -> dict[str, Any]:
+        if self.profile is None:
+            return {}
+
+        return {"profile": self.profile.summary()}
@@ -0,0 +1,61 @@
+from typing import Any, Iterable, Sequence
+
+import strawberry
+from sqlalchemy import inspect
+from sqlalchemy.orm import Mapper, load_only
+from sqlalchemy.orm.interfaces import ORMOption
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+from strawberry.utils.str_converters import to_snake_case
+
+Selection = SelectedField | FragmentSpread | InlineFragment
+
+
+def plan_columns(
+    info: strawberry.Info, model: Any, path: Sequence[str] = ()
+) -> tuple[str, ...]:
+    """
+    The column attributes of `model` the client selected.
+
+    `path` walks down wrapper types first, e.g. ["items"] for PageType results.
+    Relationships are left to their field resolvers, which batch them through
+    the loaders.
+    """
+    fields: list[SelectedField] = _flatten(info.selected_fields)
+    fields = _flatten(selection for field in fields for selection in field.selections)
+    for name in path:
+        fields = _flatten(
+            selection
+            for field in fields
+            if field.name == name
+            for selection in field.selections
+        )
+
+    mapper: Mapper = inspect(model)
+    # created_at and id back the keyset cursors, so they are always loaded.
+    columns: dict[str, None] = {"created_at": None, "id": None}
+    for field in fields:
+        key: str = to_snake_case(field.name)
+        if key in mapper.column_attrs:
+            columns[key] = None
+
+    return tuple(columns)
+
+
+def plan_options(
+    info: strawberry.Info, model: Any, path: Sequence[str] = ()
+) -> list[ORMOption]:
+    """Loader options for `model` out of the fields the client selected."""
+    return [
+        load_only(*(getattr(model, key) for key in plan_columns(info, model, path)))
+    ]
+
+
+def _flatten(selections: Iterable[Selection]) -> list[SelectedField]:
+    fields: list[SelectedField] = []
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            fields.append(selection)
+        else:
+            fields += _flatten(selection.selections)
+
+    return fields
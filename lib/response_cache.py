@@ -0,0 +1,169 @@
+import hashlib
+import json
+from typing import Any, Iterable, Protocol
+
+from app.config import (
+    REDIS_URL,
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_MAX_SIZE,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from lib.cache import LRUCache
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def versions(self, tags: list[str]) -> list[int]: ...
+
+    async def bump(self, tags: Iterable[str]) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int) -> None:
+        self._entries: LRUCache[str, bytes] = LRUCache(maxsize=maxsize)
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl=ttl)
+
+    async def versions(self, tags: list[str]) -> list[int]:
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    async def bump(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
+
+
+class RedisBackend:
+    """Shares entries and tag versions between workers, any Redis-compatible server."""
+
+    def __init__(self, url: str, prefix: str = "gql:") -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as error:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the `redis` extra"
+            ) from error
+
+        self._redis: Any = Redis.from_url(url)
+        self.prefix: str = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(f"{self.prefix}response:{key}")
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(f"{self.prefix}response:{key}", value, px=int(ttl * 1000))
+
+    async def versions(self, tags: list[str]) -> list[int]:
+        values: list = await self._redis.mget(
+            [f"{self.prefix}tag:{tag}" for tag in tags]
+        )
+        return [int(value or 0) for value in values]
+
+    async def bump(self, tags: Iterable[str]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for tag in tags:
+                pipeline.incr(f"{self.prefix}tag:{tag}")
+            await pipeline.execute()
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=f"{self.prefix}*"):
+            await self._redis.delete(key)
+
+
+class ResponseCache:
+    """
+    Caches execution results under the versions of the entity tags they expose.
+
+    Invalidating a tag bumps its version, so every key built from the old version
+    stops matching and ages out of the backend.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, enabled: bool = True) -> None:
+        self.backend: CacheBackend = backend
+        self.ttl: float = ttl
+        self.enabled: bool = enabled
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def key(
+        self,
+        document: str,
+        variables: dict | None,
+        operation_name: str | None,
+        tags: Iterable[str],
+        scope: str | None = None,
+    ) -> str:
+        sorted_tags: list[str] = sorted(tags)
+        versions: list[int] = await self.backend.versions(sorted_tags)
+        payload: str = json.dumps(
+            [
+                document,
+                variables or {},
+                operation_name,
+                scope,
+                list(zip(sorted_tags, versions)),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> dict | None:
+        value: bytes | None = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(value)
+
+    async def set(self, key: str, data: dict) -> None:
+        await self.backend.set(key, json.dumps(data).encode(), ttl=self.ttl)
+
+    async def invalidate(self, *tags: str) -> None:
+        await self.backend.bump(tags)
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups: int = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_cache_backend(maxsize: int, prefix: str = "gql:") -> CacheBackend:
+    """Redis when RESPONSE_CACHE_BACKEND is redis, under its own key prefix."""
+    if RESPONSE_CACHE_BACKEND == "redis":
+        return RedisBackend(url=REDIS_URL, prefix=prefix)
+    return MemoryBackend(maxsize=maxsize)
+
+
+def get_response_cache() -> ResponseCache:
+    return ResponseCache(
+        backend=get_cache_backend(maxsize=int(RESPONSE_CACHE_MAX_SIZE)),
+        ttl=float(RESPONSE_CACHE_TTL_SECONDS),
+        enabled=RESPONSE_CACHE_BACKEND != "none",
+    )
+
+
+RESPONSE_CACHE: ResponseCache = get_response_cache()
@@ -0,0 +1,31 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Select, func, or_
+from strawberry.exceptions import GraphQLError
+
+from lib.graphql import QueryInput, SearchModeEnum
+
+
+def search(query: Select, columns: Sequence[Any], query_input: QueryInput) -> Select:
+    """
+    CONTAINS keeps the substring semantics (LIKE/ILIKE '%term%'), SIMILAR matches
+    on pg_trgm similarity and ranks the best matches first. Both are served by
+    the gin_trgm_ops indexes declared on the models.
+    """
+    term: str | None = query_input.search
+    if not term:
+        return query
+
+    if query_input.search_mode == SearchModeEnum.SIMILAR:
+        if query_input.cursor is not None:
+            raise GraphQLError("Ranked search does not support cursor pagination!")
+
+        rank = func.greatest(*[func.similarity(column, term) for column in columns])
+        return query.filter(
+            or_(*[column.op("%")(term) for column in columns])
+        ).order_by(rank.desc(), columns[0].class_.id)
+
+    if query_input.ignore_case:
+        return query.filter(or_(*[column.icontains(term) for column in columns]))
+
+    return query.filter(or_(*[column.contains(term) for column in columns]))
@@ -1,9 +1,19 @@
 import uuid
 from datetime import datetime
+from typing import Any, Sequence
 
-from sqlalchemy import DateTime
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Index,
+    Select,
+    any_,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, aliased, load_only, mapped_column
 
 
 class BaseModel:
@@ -20,3 +30,55 @@ class BaseModel:
         index=True,
         nullable=False,
     )
+
+
+def any_of(column: ColumnElement, values: Sequence) -> ColumnElement[bool]:
+    """`column = ANY(:values)` binds a single array parameter for any batch size."""
+    return column == any_(literal(list(values), ARRAY(column.type)))
+
+
+def first_per(
+    model: Any,
+    column: ColumnElement,
+    values: Sequence,
+    first: int,
+    columns: Sequence[str] | None = None,
+) -> Select:
+    """
+    The first `first` rows of `model` by (created_at, id) for each of `values`.
+
+    `columns` loads only those attributes, and `column` to group the rows by.
+    """
+    ranked = (
+        select(
+            model,
+            func.row_number()
+            .over(partition_by=column, order_by=(model.created_at, model.id))
+            .label("position"),
+        )
+        .where(any_of(column, values))
+        .subquery()
+    )
+    ranked_model = aliased(model, ranked)
+
+    query: Select = (
+        select(ranked_model)
+        .where(ranked.c.position <= first)
+        .order_by(ranked_model.created_at, ranked_model.id)
+    )
+    if columns is not None:
+        query = query.options(
+            load_only(*(getattr(ranked_model, key) for key in {*columns, column.key}))
+        )
+
+    return query
+
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN index serving LIKE/ILIKE '%term%' and similarity (`%`) lookups."""
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
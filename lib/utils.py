@@ -1,3 +1,71 @@
-from passlib.context import CryptContext
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable
 
-PWD_CONTEXT: CryptContext = CryptContext(schemes=["bcrypt"])
+from app.config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@cache
+def password_context() -> CryptContext:
+    """Built on the first hash, passlib is not needed to boot."""
+    from passlib.context import CryptContext
+
+    # Pinning min/max to the configured cost flags hashes made with any other
+    # cost for an upgrade (or downgrade) on the next successful login.
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__default_rounds=int(BCRYPT_ROUNDS),
+        bcrypt__min_rounds=int(BCRYPT_ROUNDS),
+        bcrypt__max_rounds=int(BCRYPT_ROUNDS),
+    )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated thread pool so hashing never blocks the event loop.
+
+    bcrypt releases the GIL, so `workers` hashes run in parallel and bound how
+    much CPU a login burst can take. Calls beyond that wait in the pool queue.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers: int = workers
+        self.in_flight: int = 0
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hasher"
+        )
+
+    async def hash(self, secret: str) -> str:
+        return await self._run(password_context().hash, secret)
+
+    async def verify_and_update(
+        self, secret: str, hash: str
+    ) -> tuple[bool, str | None]:
+        return await self._run(password_context().verify_and_update, secret, hash)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+        }
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, function, *args
+            )
+        finally:
+            self.in_flight -= 1
+
+
+PASSWORD_HASHER: PasswordHasher = PasswordHasher(workers=int(PASSWORD_HASH_WORKERS))
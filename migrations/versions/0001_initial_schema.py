@@ -0,0 +1,121 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 11:23:58.171746
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "foundations",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("logo_url", sa.String(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        op.f("ix_foundations_created_at"), "foundations", ["created_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_foundations_updated_at"), "foundations", ["updated_at"], unique=False
+    )
+    op.create_table(
+        "users",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_index(op.f("ix_users_created_at"), "users", ["created_at"], unique=False)
+    op.create_index(op.f("ix_users_updated_at"), "users", ["updated_at"], unique=False)
+    op.create_table(
+        "grants",
+        sa.Column("foundation_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("deadline", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("location", sa.String(), nullable=False),
+        sa.Column("area", sa.String(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["foundation_id"], ["foundations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        op.f("ix_grants_created_at"), "grants", ["created_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_grants_foundation_id"), "grants", ["foundation_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_grants_updated_at"), "grants", ["updated_at"], unique=False
+    )
+    op.create_table(
+        "grant_feedbacks",
+        sa.Column("grant_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "reaction", sa.Enum("LIKE", "DISLIKE", name="reactionenum"), nullable=False
+        ),
+        sa.Column("comment", sa.String(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["grant_id"], ["grants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_grant_feedbacks_created_at"),
+        "grant_feedbacks",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_grant_feedbacks_grant_id"),
+        "grant_feedbacks",
+        ["grant_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_grant_feedbacks_updated_at"),
+        "grant_feedbacks",
+        ["updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_grant_feedbacks_user_id"),
+        "grant_feedbacks",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("grant_feedbacks")
+    op.drop_table("grants")
+    op.drop_table("users")
+    op.drop_table("foundations")
+    sa.Enum(name="reactionenum").drop(op.get_bind())
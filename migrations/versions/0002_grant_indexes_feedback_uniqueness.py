@@ -0,0 +1,96 @@
+"""grant indexes and feedback uniqueness
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 15:02:41.518230
+"""
+
+from typing import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+from lib.migrations import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRIGRAM_INDEXES: list[tuple[str, str]] = [
+    ("foundations", "name"),
+    ("grants", "name"),
+    ("grants", "location"),
+    ("grants", "area"),
+    ("grant_feedbacks", "comment"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Keep the latest reaction of each user to a grant, the unique index below
+    # cannot be built over duplicates.
+    op.execute("""
+        DELETE FROM grant_feedbacks
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, grant_id
+                ORDER BY updated_at DESC, created_at DESC, id DESC
+            ) AS position
+            FROM grant_feedbacks
+        ) AS ranked
+        WHERE grant_feedbacks.id = ranked.id AND ranked.position > 1
+        """)
+
+    for table, column in TRIGRAM_INDEXES:
+        create_index_concurrently(
+            f"ix_{table}_{column}_trgm",
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    create_index_concurrently(
+        "ix_grants_foundation_id_created_at_id",
+        "grants",
+        ["foundation_id", "created_at", "id"],
+    )
+    # Served by the leading column of the index above.
+    drop_index_concurrently("ix_grants_foundation_id", "grants")
+
+    # Built concurrently and then attached, only the ALTER TABLE takes a lock.
+    create_index_concurrently(
+        "uq_grant_feedbacks_user_id_grant_id",
+        "grant_feedbacks",
+        ["user_id", "grant_id"],
+        unique=True,
+    )
+    attached: bool = (
+        op.get_bind()
+        .execute(
+            text("SELECT EXISTS (SELECT FROM pg_constraint WHERE conname = :name)"),
+            {"name": "uq_grant_feedbacks_user_id_grant_id"},
+        )
+        .scalar_one()
+    )
+    if not attached:
+        op.execute(
+            "ALTER TABLE grant_feedbacks ADD CONSTRAINT "
+            "uq_grant_feedbacks_user_id_grant_id UNIQUE USING INDEX "
+            "uq_grant_feedbacks_user_id_grant_id"
+        )
+    # Served by the leading column of the unique constraint.
+    drop_index_concurrently("ix_grant_feedbacks_user_id", "grant_feedbacks")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_grant_feedbacks_user_id", "grant_feedbacks", ["user_id"]
+    )
+    op.drop_constraint(
+        "uq_grant_feedbacks_user_id_grant_id", "grant_feedbacks", type_="unique"
+    )
+    create_index_concurrently("ix_grants_foundation_id", "grants", ["foundation_id"])
+    drop_index_concurrently("ix_grants_foundation_id_created_at_id", "grants")
+    for table, column in TRIGRAM_INDEXES:
+        drop_index_concurrently(f"ix_{table}_{column}_trgm", table)
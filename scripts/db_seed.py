@@ -2,23 +2,41 @@
 """
 Database seeding script for development/testing purposes.
 Creates a user, foundation, grants, and grant feedback.
+
+`--scale N` instead generates N users with N // 20 foundations, N * 2 grants and
+about N * 20 feedback rows, loaded through COPY:
+
+    python -m scripts.db_seed --scale 100000
 """
 
+import argparse
 import asyncio
+import bisect
+import itertools
+import random
+import time
+import uuid
 from datetime import UTC, datetime, timedelta
+from typing import Any, Iterator
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Table, func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.config import DATABASE_URL
+from app.config import DATABASE_URL, DB_CREATE_ALL
 from app.database import Base
 from app.foundation.models import Foundation
 from app.grant.models import Grant
 from app.grant_feedback.enums import ReactionEnum
 from app.grant_feedback.models import GrantFeedback
 from app.user.models import User
-from lib.utils import PWD_CONTEXT
+from lib.utils import password_context
 
 # Create async engine
 engine = create_async_engine(DATABASE_URL, echo=True)
@@ -27,14 +45,19 @@ async_session_maker = async_sessionmaker(
 )
 
 
+async def create_tables(conn: AsyncConnection) -> None:
+    """Tables come from `alembic upgrade head` unless DB_CREATE_ALL is set."""
+    if DB_CREATE_ALL == "true":
+        await conn.run_sync(Base.metadata.create_all)
+        print("Database tables created")
+
+
 async def seed_database():
     """Seed the database with test data."""
     print("Starting database seeding...")
 
     async with engine.begin() as conn:
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
-        print("Database tables created")
+        await create_tables(conn)
 
     async with async_session_maker() as session:
         try:
@@ -53,7 +76,7 @@ async def seed_database():
                 id=UUID("00000000-0000-0000-0000-000000000001"),
                 name="Demo User",
                 email="demo@example.com",
-                password=PWD_CONTEXT.hash("demo123"),
+                password=password_context().hash("demo123"),
                 created_at=datetime.now(UTC),
                 updated_at=datetime.now(UTC),
             )
@@ -187,20 +210,237 @@ async def seed_database():
             raise
 
 
+AREAS: list[str] = [
+    "Artificial Intelligence",
+    "Environmental Technology",
+    "Education Technology",
+    "Healthcare",
+    "Blockchain & Cryptocurrency",
+    "Arts & Culture",
+    "Social Impact",
+    "Agriculture",
+]
+LOCATIONS: list[str] = [
+    "San Francisco, CA",
+    "Seattle, WA",
+    "Austin, TX",
+    "Boston, MA",
+    "New York, NY",
+    "Chicago, IL",
+    "Denver, CO",
+    "Remote",
+]
+COMMENTS: list[str] = [
+    "Perfect fit for our project!",
+    "The amount seems too low for our project scope.",
+    "Deadline is too tight.",
+    "Will definitely apply!",
+]
+FOUNDATIONS_PER_USER: float = 1 / 20
+GRANTS_PER_USER: int = 2
+FEEDBACKS_PER_USER: int = 20
+MAX_FEEDBACKS_PER_USER: int = 1000
+COMMENT_RATIO: float = 0.1
+
+
+def zipf_cum_weights(size: int, exponent: float = 1.1) -> list[float]:
+    """Cumulative weights of a Zipf distribution, a few items get most picks."""
+    return list(
+        itertools.accumulate(1 / (rank**exponent) for rank in range(1, size + 1))
+    )
+
+
+def pick(rng: random.Random, cum_weights: list[float]) -> int:
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+
+
+async def copy_rows(
+    conn: Any, table: Table, columns: list[str], records: Iterator[tuple]
+) -> None:
+    started: float = time.perf_counter()
+    raw_connection = await conn.get_raw_connection()
+    count: int = 0
+
+    def counted() -> Iterator[tuple]:
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=counted(), columns=columns
+    )
+    print(f"Copied {count:,} {table.name} in {time.perf_counter() - started:.1f}s")
+
+
+async def seed_scale(scale: int, seed: int, engine: AsyncEngine = engine) -> None:
+    """Seed `scale` users and proportional synthetic data with a fixed seed."""
+    engine.echo = False
+    rng: random.Random = random.Random(seed)
+    now: datetime = datetime.now(UTC)
+    year: float = timedelta(days=365).total_seconds()
+
+    def created_at() -> datetime:
+        return now - timedelta(seconds=rng.random() * year)
+
+    async with engine.begin() as conn:
+        await create_tables(conn)
+        if (await conn.execute(select(func.count()).select_from(User))).scalar():
+            print("Database already has users. Run --clear first. Skipping seed...")
+            return
+
+    # bcrypt once, every synthetic user logs in with the same password.
+    password: str = password_context().hash("demo123")
+    user_ids: list[UUID] = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(scale)]
+    foundation_ids: list[UUID] = [
+        uuid.UUID(int=rng.getrandbits(128))
+        for _ in range(max(1, int(scale * FOUNDATIONS_PER_USER)))
+    ]
+    grant_ids: list[UUID] = [
+        uuid.UUID(int=rng.getrandbits(128)) for _ in range(scale * GRANTS_PER_USER)
+    ]
+    # Long-tail foundations, and a few popular grants collect most reactions.
+    foundation_weights: list[float] = zipf_cum_weights(len(foundation_ids))
+    grant_weights: list[float] = zipf_cum_weights(len(grant_ids), exponent=0.8)
+
+    def users() -> Iterator[tuple]:
+        for index, id in enumerate(user_ids):
+            timestamp: datetime = created_at()
+            yield (
+                id,
+                f"User {index}",
+                f"user{index}@example.com",
+                password,
+                timestamp,
+                timestamp,
+            )
+
+    def foundations() -> Iterator[tuple]:
+        for index, id in enumerate(foundation_ids):
+            timestamp: datetime = created_at()
+            yield (
+                id,
+                f"Foundation {index}",
+                f"https://example.com/logos/{index}.png",
+                timestamp,
+                timestamp,
+            )
+
+    def grants() -> Iterator[tuple]:
+        for index, id in enumerate(grant_ids):
+            timestamp: datetime = created_at()
+            area: str = rng.choice(AREAS)
+            yield (
+                id,
+                foundation_ids[pick(rng, foundation_weights)],
+                f"{area} Grant #{index}",
+                max(1000, int(round(rng.lognormvariate(10.5, 0.8), -3))),
+                now + timedelta(days=rng.randint(7, 365)),
+                rng.choice(LOCATIONS),
+                area,
+                timestamp,
+                timestamp,
+            )
+
+    def feedbacks() -> Iterator[tuple]:
+        for user_id in user_ids:
+            # Pareto reactions per user: most swipe a little, a few swipe a lot.
+            count: int = min(
+                len(grant_ids) // 2,
+                MAX_FEEDBACKS_PER_USER,
+                int(rng.paretovariate(1.5) * FEEDBACKS_PER_USER / 3),
+            )
+            like_ratio: float = rng.betavariate(2, 3)
+            seen: set[int] = set()
+            while len(seen) < count:
+                seen.add(pick(rng, grant_weights))
+            for grant_index in seen:
+                timestamp: datetime = created_at()
+                yield (
+                    uuid.UUID(int=rng.getrandbits(128)),
+                    grant_ids[grant_index],
+                    user_id,
+                    (
+                        ReactionEnum.LIKE.name
+                        if rng.random() < like_ratio
+                        else ReactionEnum.DISLIKE.name
+                    ),
+                    rng.choice(COMMENTS) if rng.random() < COMMENT_RATIO else None,
+                    timestamp,
+                    timestamp,
+                )
+
+    started: float = time.perf_counter()
+    async with engine.begin() as conn:
+        await copy_rows(
+            conn,
+            User.__table__,
+            ["id", "name", "email", "password", "created_at", "updated_at"],
+            users(),
+        )
+        await copy_rows(
+            conn,
+            Foundation.__table__,
+            ["id", "name", "logo_url", "created_at", "updated_at"],
+            foundations(),
+        )
+        await copy_rows(
+            conn,
+            Grant.__table__,
+            [
+                "id",
+                "foundation_id",
+                "name",
+                "amount",
+                "deadline",
+                "location",
+                "area",
+                "created_at",
+                "updated_at",
+            ],
+            grants(),
+        )
+        await copy_rows(
+            conn,
+            GrantFeedback.__table__,
+            [
+                "id",
+                "grant_id",
+                "user_id",
+                "reaction",
+                "comment",
+                "created_at",
+                "updated_at",
+            ],
+            feedbacks(),
+        )
+        await conn.exec_driver_sql("ANALYZE")
+    print(f"\nScale seeding completed in {time.perf_counter() - started:.1f}s")
+    print("   Login as any userN@example.com with password: demo123")
+
+
 async def clear_database():
     """Clear all data from the database."""
     print("Clearing database...")
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        # Truncate rather than drop, the schema stays at the migrated revision.
+        tables: str = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        await conn.exec_driver_sql(f"TRUNCATE {tables} CASCADE")
         print("Database cleared")
 
 
 async def main():
     """Main entry point for the seeding script."""
-    import sys
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clear", action="store_true")
+    parser.add_argument("--scale", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+    if args.clear:
         await clear_database()
+    elif args.scale:
+        await seed_scale(scale=args.scale, seed=args.seed)
     else:
         await seed_database()
 
@@ -0,0 +1,3 @@
+#!/bin/sh
+# Runs once on a fresh primary volume, lets db_replica stream WAL with pg_basebackup.
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -5,6 +5,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.user.models import User
+from lib.utils import password_context
 
 pytestmark = pytest.mark.asyncio
 
@@ -59,6 +60,28 @@ async def test_user_login_exists_correct_creds(
     }
 
 
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_user_login_rehashes_outdated_password(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_login_request: dict,
+    user_model: User,
+    bearer_token: str,
+) -> None:
+    user_model.password = password_context().handler().using(rounds=4).hash("test")
+    async_db.add(user_model)
+    await async_db.commit()
+
+    response = await async_client.post("/auth/login", json=user_login_request)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "access_token": bearer_token,
+    }
+    assert not password_context().needs_update(user_model.password)
+    assert password_context().verify("test", user_model.password)
+
+
 async def test_user_register(
     async_client: AsyncClient,
     user_register_request: dict,
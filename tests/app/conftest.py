@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import pytest
@@ -8,14 +8,16 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 
 from app.config import DATABASE_URL
-from app.database import Base, get_db
+from app.database import RECENT_WRITERS, Base, get_db, get_read_db
 from app.foundation.models import Foundation
+from app.grant.feed import GRANT_MATCH_FEED
 from app.grant.models import Grant
 from app.grant_feedback.enums import ReactionEnum
 from app.grant_feedback.models import GrantFeedback
 from app.main import app
 from app.user.models import User
-from lib.utils import PWD_CONTEXT
+from lib.response_cache import RESPONSE_CACHE
+from lib.utils import password_context
 
 async_engine = create_async_engine(
     url=DATABASE_URL,
@@ -59,6 +61,10 @@ async def async_client(async_db):
         yield async_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    GRANT_MATCH_FEED.clear()
+    await RESPONSE_CACHE.clear()
+    await RECENT_WRITERS.clear()
     return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
 
@@ -108,7 +114,7 @@ def user_model(user_id: UUID, datetime_stamp: datetime) -> User:
         id=user_id,
         name="TestName",
         email="test@test.com",
-        password=PWD_CONTEXT.hash("test"),
+        password=password_context().hash("test"),
         created_at=datetime_stamp,
         updated_at=datetime_stamp,
     )
@@ -150,6 +156,28 @@ def grant_model(grant_id: UUID, foundation_id: UUID, datetime_stamp: datetime) -
     )
 
 
+@pytest.fixture
+def second_grant_id() -> UUID:
+    return UUID("8cd56e9c-6869-474f-8ee8-ba43efdfa264")
+
+
+@pytest.fixture
+def second_grant_model(
+    second_grant_id: UUID, foundation_id: UUID, datetime_stamp: datetime
+) -> Grant:
+    return Grant(
+        id=second_grant_id,
+        foundation_id=foundation_id,
+        name="SecondTestGrant",
+        amount=20000,
+        deadline=datetime(year=2025, month=1, day=31, tzinfo=UTC),
+        location="TestLocation",
+        area="TestArea",
+        created_at=datetime_stamp + timedelta(days=1),
+        updated_at=datetime_stamp + timedelta(days=1),
+    )
+
+
 @pytest.fixture
 def grant_feedback_id() -> UUID:
     return UUID("8cd56e9c-6869-474f-8ee8-ba43efdfa263")
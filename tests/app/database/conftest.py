@@ -0,0 +1,54 @@
+from itertools import cycle
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import DATABASE_URL
+from app.grant.models import Grant
+
+
+@pytest.fixture
+def replica_engine(monkeypatch: pytest.MonkeyPatch) -> AsyncEngine:
+    replica: AsyncEngine = create_async_engine(url=DATABASE_URL, poolclass=NullPool)
+    monkeypatch.setattr("app.database.replica_engines", [replica])
+    monkeypatch.setattr("app.database._replica_cycle", cycle([replica]))
+    return replica
+
+
+@pytest.fixture
+def delete_grant_mutation() -> str:
+    return """mutation DeleteGrant {
+    deleteGrant(grantId: "0d6d3b4e-2a3c-4c36-9d5e-0c4f3f3f8a11")
+}
+"""
+
+
+@pytest_asyncio.fixture
+async def lagging_read_db(async_db_engine: AsyncEngine):
+    """A replica frozen at the snapshot its first statement takes."""
+    async with AsyncSession(bind=async_db_engine) as session:
+        await session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
+        yield session
+
+
+@pytest.fixture
+def update_grant_feedbacks_mutation(grant_model: Grant) -> str:
+    return f"""mutation UpdateGrant {{
+    updateGrant(grantId: "{grant_model.id}", grantInput: {{
+        foundationId: "{grant_model.foundation_id}",
+        name: "{grant_model.name}",
+        amount: {grant_model.amount},
+        deadline: "{grant_model.deadline.isoformat()}",
+        location: "{grant_model.location}",
+        area: "{grant_model.area}"
+    }}) {{
+        feedbacks {{
+            id
+        }}
+    }}
+}}
+"""
@@ -0,0 +1,112 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+from freezegun import freeze_time
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database import choose_read_engine, engine, get_read_db, mark_write
+from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from app.main import app
+from app.user.models import User
+from lib.response_cache import RESPONSE_CACHE
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_choose_read_engine_without_replicas(user_id: UUID) -> None:
+    await mark_write(user_id)
+
+    assert await choose_read_engine(user_id) is engine
+    assert await choose_read_engine(None) is engine
+
+
+async def test_choose_read_engine_replica(
+    replica_engine: AsyncEngine, user_id: UUID
+) -> None:
+    assert await choose_read_engine(user_id) is replica_engine
+    assert await choose_read_engine(None) is replica_engine
+
+
+async def test_choose_read_engine_after_write(
+    replica_engine: AsyncEngine, user_id: UUID
+) -> None:
+    await mark_write(user_id)
+
+    assert await choose_read_engine(user_id) is engine
+    assert await choose_read_engine(None) is replica_engine
+
+
+async def test_choose_read_engine_after_response_cache_clear(
+    replica_engine: AsyncEngine, user_id: UUID
+) -> None:
+    await mark_write(user_id)
+    await RESPONSE_CACHE.clear()
+
+    assert await choose_read_engine(user_id) is engine
+
+
+async def test_choose_read_engine_write_window_expires(
+    monkeypatch: pytest.MonkeyPatch, replica_engine: AsyncEngine, user_id: UUID
+) -> None:
+    monkeypatch.setattr("app.database.READ_YOUR_WRITES_SECONDS", "0.05")
+    await mark_write(user_id)
+    assert await choose_read_engine(user_id) is engine
+
+    await asyncio.sleep(0.1)
+
+    assert await choose_read_engine(user_id) is replica_engine
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_mutation_marks_write(
+    async_client: AsyncClient,
+    replica_engine: AsyncEngine,
+    user_id: UUID,
+    auth_bearer_header: dict,
+    delete_grant_mutation: str,
+) -> None:
+    assert await choose_read_engine(user_id) is replica_engine
+
+    await async_client.post(
+        "/graphql", json={"query": delete_grant_mutation}, headers=auth_bearer_header
+    )
+
+    assert await choose_read_engine(user_id) is engine
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_mutation_reads_nested_fields_from_primary(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    lagging_read_db: AsyncSession,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    update_grant_feedbacks_mutation: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+    await lagging_read_db.execute(text("SELECT 1"))
+    async_db.add(grant_feedback_model)
+    await async_db.commit()
+
+    async def override_get_read_db():
+        yield lagging_read_db
+
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    response = await async_client.post(
+        "/graphql",
+        json={"query": update_grant_feedbacks_mutation},
+        headers=auth_bearer_header,
+    )
+
+    assert response.json() == {
+        "data": {"updateGrant": {"feedbacks": [{"id": str(grant_feedback_model.id)}]}}
+    }
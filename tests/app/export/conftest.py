@@ -0,0 +1,36 @@
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from app.grant.models import Grant
+
+
+@pytest.fixture
+def export_grants_ndjson_result(
+    second_grant_id: UUID, foundation_id: UUID, second_grant_model: Grant
+) -> list[dict]:
+    return [
+        {
+            "foundation_id": str(foundation_id),
+            "name": second_grant_model.name,
+            "amount": second_grant_model.amount,
+            "deadline": second_grant_model.deadline.isoformat(),
+            "location": second_grant_model.location,
+            "area": second_grant_model.area,
+            "id": str(second_grant_id),
+            "created_at": second_grant_model.created_at.isoformat(),
+            "updated_at": second_grant_model.updated_at.isoformat(),
+        }
+    ]
+
+
+@pytest.fixture
+def export_grant_feedbacks_csv_result(
+    grant_feedback_id: UUID, grant_id: UUID, user_id: UUID, datetime_stamp: datetime
+) -> str:
+    return (
+        "grant_id,user_id,reaction,comment,id,created_at,updated_at\r\n"
+        f"{grant_id},{user_id},LIKE,Test comment,{grant_feedback_id},"
+        f"{datetime_stamp.isoformat()},{datetime_stamp.isoformat()}\r\n"
+    )
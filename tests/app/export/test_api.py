@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from fastapi import status
+from freezegun import freeze_time
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from app.user.models import User
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_export_grants_not_authenticated(async_client: AsyncClient) -> None:
+    response = await async_client.get("/export/grants")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {"detail": "User is not Authenticated"}
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_export_grants_ndjson(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    export_grants_ndjson_result: list[dict],
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.get(
+        "/export/grants",
+        params={"search": "secondtest", "ignore_case": True},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [
+        json.loads(line) for line in response.text.splitlines()
+    ] == export_grants_ndjson_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_export_grant_feedbacks_csv(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    export_grant_feedbacks_csv_result: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, grant_feedback_model])
+    await async_db.commit()
+
+    response = await async_client.get(
+        "/export/grant_feedbacks",
+        params={"format": "csv"},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text == export_grant_feedbacks_csv_result
@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
 import pytest
 
 from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
 
 
 @pytest.fixture
@@ -26,6 +28,160 @@ def foundation_query() -> str:
 """
 
 
+@pytest.fixture
+def foundation_with_grants_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 10 } }) {
+        items {
+            id
+            grants(first: 10) {
+                id
+                name
+                feedbacks(first: 10) {
+                    id
+                    reaction
+                    comment
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_first_grants_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 10 } }) {
+        items {
+            id
+            grants(first: 1) {
+                id
+                name
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_all_grants_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 10 } }) {
+        items {
+            grants {
+                name
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_grant_models(grant_model: Grant) -> list[Grant]:
+    return [
+        Grant(
+            foundation_id=grant_model.foundation_id,
+            name=f"TestGrant{index}",
+            amount=grant_model.amount,
+            deadline=grant_model.deadline,
+            location=grant_model.location,
+            area=grant_model.area,
+            created_at=grant_model.created_at + timedelta(minutes=index),
+            updated_at=grant_model.updated_at,
+        )
+        for index in range(11)
+    ]
+
+
+@pytest.fixture
+def foundation_grant_matches_query() -> str:
+    return """query GrantMatches {
+    grantMatches(queryInput: { pagination: { page: 1, size: 10 } }) {
+        total
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_expensive_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 100 } }) {
+        items {
+            grants {
+                feedbacks {
+                    id
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_negative_first_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 100 } }) {
+        items {
+            cheap: grants(first: -1000) {
+                id
+            }
+            grants {
+                feedbacks {
+                    id
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_variables_query() -> str:
+    return """query Foundations($queryInput: QueryInput!) {
+    foundations(queryInput: $queryInput) {
+        total
+        size
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_large_page_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 1, size: 101 } }) {
+        total
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_empty_page_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { cursor: { size: 0 } }) {
+        total
+    }
+}
+"""
+
+
+@pytest.fixture
+def foundation_zero_page_query() -> str:
+    return """query Foundations {
+    foundations(queryInput: { pagination: { page: 0, size: 10 } }) {
+        total
+    }
+}
+"""
+
+
 @pytest.fixture
 def foundation_by_id_query(foundation_id: UUID) -> str:
     return f"""query FoundationById {{
@@ -103,6 +259,123 @@ def foundation_query_result(foundation_json: dict) -> dict:
     }
 
 
+@pytest.fixture
+def foundation_with_grants_query_result(
+    foundation_id: UUID, grant_model: Grant, grant_feedback_model: GrantFeedback
+) -> dict:
+    return {
+        "data": {
+            "foundations": {
+                "items": [
+                    {
+                        "id": str(foundation_id),
+                        "grants": [
+                            {
+                                "id": str(grant_model.id),
+                                "name": grant_model.name,
+                                "feedbacks": [
+                                    {
+                                        "id": str(grant_feedback_model.id),
+                                        "reaction": grant_feedback_model.reaction.name,
+                                        "comment": grant_feedback_model.comment,
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        },
+    }
+
+
+@pytest.fixture
+def foundation_first_grants_query_result(
+    foundation_id: UUID, grant_model: Grant
+) -> dict:
+    return {
+        "data": {
+            "foundations": {
+                "items": [
+                    {
+                        "id": str(foundation_id),
+                        "grants": [
+                            {"id": str(grant_model.id), "name": grant_model.name}
+                        ],
+                    }
+                ],
+            },
+        },
+    }
+
+
+@pytest.fixture
+def foundation_expensive_query_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {"message": "Query cost 1010101 exceeds the maximum of 10000!"},
+        ],
+    }
+
+
+@pytest.fixture
+def foundation_negative_first_query_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {"message": "Query cost 1010201 exceeds the maximum of 10000!"},
+        ],
+    }
+
+
+@pytest.fixture
+def foundation_variables_query_result() -> dict:
+    return {"data": {"foundations": {"total": 1, "size": 10}}}
+
+
+@pytest.fixture
+def foundation_large_page_query_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": "Page size exceeds the maximum of 100!",
+                "locations": [{"line": 2, "column": 5}],
+                "path": ["foundations"],
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def foundation_empty_page_query_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": "Page size must be at least 1!",
+                "locations": [{"line": 2, "column": 5}],
+                "path": ["foundations"],
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def foundation_zero_page_query_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": "Page must be at least 1!",
+                "locations": [{"line": 2, "column": 5}],
+                "path": ["foundations"],
+            },
+        ],
+    }
+
+
 @pytest.fixture
 def foundation_by_id_query_result(foundation_json: dict) -> dict:
     return {"data": {"foundationById": foundation_json}}
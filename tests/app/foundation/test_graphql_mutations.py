@@ -2,9 +2,12 @@ import pytest
 from fastapi import status
 from freezegun import freeze_time
 from httpx import AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
 from app.user.models import User
 
 pytestmark = pytest.mark.asyncio
@@ -76,3 +79,54 @@ async def test_delete_foundation(
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == delete_foundation_mutation_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_delete_foundation_with_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    foundation_grant_models: list[Grant],
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    foundation_grant_matches_query: str,
+    delete_foundation_mutation: str,
+    delete_foundation_mutation_result: dict,
+) -> None:
+    async_db.add_all(
+        [
+            user_model,
+            foundation_model,
+            grant_model,
+            *foundation_grant_models,
+            grant_feedback_model,
+        ]
+    )
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_grant_matches_query},
+        headers=auth_bearer_header,
+    )
+    assert response.json() == {"data": {"grantMatches": {"total": 11}}}
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": delete_foundation_mutation},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == delete_foundation_mutation_result
+    assert await async_db.scalar(select(func.count()).select_from(Grant)) == 0
+    assert await async_db.scalar(select(func.count()).select_from(GrantFeedback)) == 0
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_grant_matches_query},
+        headers=auth_bearer_header,
+    )
+    assert response.json() == {"data": {"grantMatches": {"total": 0}}}
@@ -5,6 +5,8 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.foundation.models import Foundation
+from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
 from app.user.models import User
 
 pytestmark = pytest.mark.asyncio
@@ -31,6 +33,192 @@ async def test_get_foundations(
     assert response.json() == foundation_query_result
 
 
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_with_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    foundation_with_grants_query: str,
+    foundation_with_grants_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, grant_feedback_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_with_grants_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_with_grants_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_first_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    foundation_first_grants_query: str,
+    foundation_first_grants_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_first_grants_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_first_grants_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_all_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    foundation_grant_models: list[Grant],
+    auth_bearer_header: dict,
+    foundation_all_grants_query: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, *foundation_grant_models])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_all_grants_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["foundations"]["items"] == [
+        {"grants": [{"name": grant.name} for grant in foundation_grant_models]}
+    ]
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_cost_exceeded(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    foundation_expensive_query: str,
+    foundation_expensive_query_result: dict,
+) -> None:
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_expensive_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_expensive_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_negative_first_cost(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    foundation_negative_first_query: str,
+    foundation_negative_first_query_result: dict,
+) -> None:
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_negative_first_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_negative_first_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_variables_default_size(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    auth_bearer_header: dict,
+    foundation_variables_query: str,
+    foundation_variables_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={
+            "query": foundation_variables_query,
+            "variables": {"queryInput": {"pagination": {"page": 1}}},
+        },
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_variables_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_page_size_exceeded(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    foundation_large_page_query: str,
+    foundation_large_page_query_result: dict,
+) -> None:
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_large_page_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_large_page_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_empty_page(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    foundation_empty_page_query: str,
+    foundation_empty_page_query_result: dict,
+) -> None:
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_empty_page_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_empty_page_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_foundations_zero_page(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    foundation_zero_page_query: str,
+    foundation_zero_page_query_result: dict,
+) -> None:
+    response = await async_client.post(
+        "/graphql",
+        json={"query": foundation_zero_page_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == foundation_zero_page_query_result
+
+
 @freeze_time("2024-11-05T12:00:00+00:00")
 async def test_get_foundation_by_id(
     async_db: AsyncSession,
@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
 import pytest
 
 from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
+from lib.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -30,6 +32,102 @@ def grant_query() -> str:
 """
 
 
+@pytest.fixture
+def grant_ignore_case_search_query() -> str:
+    return """query Grants {
+    grants(queryInput: { search: "testgrant", ignoreCase: true }) {
+        total
+        page
+        size
+        pages
+        items {
+            id
+            createdAt
+            updatedAt
+            foundationId
+            name
+            amount
+            deadline
+            location
+            area
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def grant_similar_search_query() -> str:
+    return """query Grants {
+    grants(queryInput: { search: "TestGrnt", searchMode: SIMILAR }) {
+        total
+        page
+        size
+        pages
+        items {
+            id
+            createdAt
+            updatedAt
+            foundationId
+            name
+            amount
+            deadline
+            location
+            area
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def grant_cursor(grant_model: Grant) -> str:
+    return encode_cursor(grant_model.created_at, grant_model.id)
+
+
+@pytest.fixture
+def second_grant_cursor(second_grant_model: Grant) -> str:
+    return encode_cursor(second_grant_model.created_at, second_grant_model.id)
+
+
+@pytest.fixture
+def grant_cursor_query() -> str:
+    return """query Grants {
+    grants(queryInput: { cursor: { size: 1, includeTotal: true } }) {
+        total
+        page
+        size
+        pages
+        after
+        before
+        items {
+            id
+            name
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def grant_after_cursor_query(grant_cursor: str) -> str:
+    return f"""query Grants {{
+    grants(queryInput: {{ cursor: {{ size: 1, after: "{grant_cursor}" }} }}) {{
+        total
+        page
+        size
+        pages
+        after
+        before
+        items {{
+            id
+            name
+        }}
+    }}
+}}
+"""
+
+
 @pytest.fixture
 def grant_by_id_query(grant_id: UUID) -> str:
     return f"""query GrantById {{
@@ -48,6 +146,22 @@ def grant_by_id_query(grant_id: UUID) -> str:
 """
 
 
+@pytest.fixture
+def grant_feedbacks_nested_query() -> str:
+    return """query GrantsWithFeedbacks {
+    grants(queryInput: { pagination: { page: 1, size: 10 } }) {
+        total
+        items {
+            name
+            feedbacks {
+                reaction
+            }
+        }
+    }
+}
+"""
+
+
 @pytest.fixture
 def grant_matches_query() -> str:
     return """query GrantMatches {
@@ -72,6 +186,66 @@ def grant_matches_query() -> str:
 """
 
 
+@pytest.fixture
+def third_grant_model(
+    second_grant_model: Grant, foundation_id: UUID, datetime_stamp: datetime
+) -> Grant:
+    return Grant(
+        id=UUID("2f1c8e0b-6a55-4d0e-9a43-7b3b2a1d9c11"),
+        foundation_id=foundation_id,
+        name="ThirdTestGrant",
+        amount=30000,
+        deadline=second_grant_model.deadline,
+        location="TestLocation",
+        area="TestArea",
+        created_at=datetime_stamp + timedelta(days=2),
+        updated_at=datetime_stamp + timedelta(days=2),
+    )
+
+
+@pytest.fixture
+def grant_matches_before_cursor_query(third_grant_model: Grant) -> str:
+    cursor: str = encode_cursor(third_grant_model.created_at, third_grant_model.id)
+    return f"""query GrantMatches {{
+    grantMatches(queryInput: {{ cursor: {{ size: 1, before: "{cursor}" }} }}) {{
+        after
+        before
+        items {{
+            name
+        }}
+    }}
+}}
+"""
+
+
+@pytest.fixture
+def grant_matches_single_query() -> str:
+    return """query GrantMatches {
+    grantMatches(queryInput: { pagination: { page: 1, size: 1 } }) {
+        total
+        items {
+            name
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def grant_feedback_mutation(grant_feedback_model: GrantFeedback) -> str:
+    return f"""mutation CreateGrantFeedback {{
+    createGrantFeedback(grantFeedbackInput: {{
+        grantId: "{grant_feedback_model.grant_id}",
+        userId: "{grant_feedback_model.user_id}",
+        reaction: {grant_feedback_model.reaction.name},
+        comment: "{grant_feedback_model.comment}"
+    }}) {{
+        grantId
+    }}
+}}
+"""
+
+
 @pytest.fixture
 def grant_opportunities_query() -> str:
     return """query GrantOpportunities {
@@ -153,6 +327,99 @@ def delete_grant_mutation(grant_id: UUID) -> str:
 """
 
 
+@pytest.fixture
+def create_grants_mutation(grant_model: Grant, grant_id: UUID) -> str:
+    return f"""mutation CreateGrants {{
+    createGrants(grantInputs: [
+        {{
+            foundationId: "{grant_model.foundation_id}",
+            name: "{grant_model.name}",
+            amount: {grant_model.amount},
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "{grant_model.location}"
+        }},
+        {{
+            foundationId: "{grant_model.foundation_id}",
+            name: "NewGrant",
+            amount: 30000,
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "{grant_model.location}"
+        }},
+        {{
+            foundationId: "{grant_id}",
+            name: "OrphanGrant",
+            amount: 30000,
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "{grant_model.location}"
+        }},
+        {{
+            foundationId: "{grant_model.foundation_id}",
+            name: "NewGrant",
+            amount: 40000,
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "{grant_model.location}"
+        }}
+    ]) {{
+        items {{
+            name
+            amount
+        }}
+        errors {{
+            index
+            message
+        }}
+    }}
+}}
+"""
+
+
+@pytest.fixture
+def upsert_grants_mutation(grant_model: Grant) -> str:
+    return f"""mutation UpsertGrants {{
+    upsertGrants(grantInputs: [
+        {{
+            foundationId: "{grant_model.foundation_id}",
+            name: "{grant_model.name}",
+            amount: 20000,
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "UpdatedLocation"
+        }},
+        {{
+            foundationId: "{grant_model.foundation_id}",
+            name: "NewGrant",
+            amount: 30000,
+            deadline: "{grant_model.deadline.isoformat()}",
+            location: "{grant_model.location}"
+        }}
+    ]) {{
+        items {{
+            name
+            amount
+            location
+        }}
+        errors {{
+            index
+            message
+        }}
+    }}
+}}
+"""
+
+
+@pytest.fixture
+def delete_grants_mutation(grant_id: UUID, second_grant_id: UUID) -> str:
+    return f"""mutation DeleteGrants {{
+    deleteGrants(grantIds: ["{grant_id}", "{second_grant_id}"]) {{
+        items
+        errors {{
+            index
+            message
+        }}
+    }}
+}}
+"""
+
+
 @pytest.fixture
 def grant_json(
     grant_id: UUID, foundation_id: UUID, datetime_stamp: datetime, grant_model: Grant
@@ -185,6 +452,44 @@ def grant_query_result(grant_json: dict) -> dict:
     }
 
 
+@pytest.fixture
+def grant_cursor_query_result(grant_model: Grant, grant_cursor: str) -> dict:
+    return {
+        "data": {
+            "grants": {
+                "items": [{"id": str(grant_model.id), "name": grant_model.name}],
+                "total": 2,
+                "page": None,
+                "size": 1,
+                "pages": 2,
+                "after": grant_cursor,
+                "before": None,
+            },
+        },
+    }
+
+
+@pytest.fixture
+def grant_after_cursor_query_result(
+    second_grant_model: Grant, second_grant_cursor: str
+) -> dict:
+    return {
+        "data": {
+            "grants": {
+                "items": [
+                    {"id": str(second_grant_model.id), "name": second_grant_model.name}
+                ],
+                "total": None,
+                "page": None,
+                "size": 1,
+                "pages": None,
+                "after": None,
+                "before": second_grant_cursor,
+            },
+        },
+    }
+
+
 @pytest.fixture
 def grant_matches_query_result(grant_json: dict) -> dict:
     return {
@@ -200,6 +505,35 @@ def grant_matches_query_result(grant_json: dict) -> dict:
     }
 
 
+@pytest.fixture
+def grant_matches_excludes_seen_query_result(
+    second_grant_model: Grant, foundation_id: UUID
+) -> dict:
+    return {
+        "data": {
+            "grantMatches": {
+                "items": [
+                    {
+                        "id": str(second_grant_model.id),
+                        "createdAt": second_grant_model.created_at.isoformat(),
+                        "updatedAt": second_grant_model.updated_at.isoformat(),
+                        "foundationId": str(foundation_id),
+                        "name": second_grant_model.name,
+                        "amount": second_grant_model.amount,
+                        "deadline": second_grant_model.deadline.isoformat(),
+                        "location": second_grant_model.location,
+                        "area": second_grant_model.area,
+                    }
+                ],
+                "page": 1,
+                "pages": 1,
+                "size": 10,
+                "total": 1,
+            },
+        },
+    }
+
+
 @pytest.fixture
 def grant_opportunities_query_result(grant_json: dict) -> dict:
     return {
@@ -255,3 +589,54 @@ def update_grant_mutation_result(foundation_id: UUID) -> dict:
 @pytest.fixture
 def delete_grant_mutation_result() -> dict:
     return {"data": {"deleteGrant": None}}
+
+
+@pytest.fixture
+def create_grants_mutation_result() -> dict:
+    return {
+        "data": {
+            "createGrants": {
+                "items": [{"name": "NewGrant", "amount": 30000}],
+                "errors": [
+                    {"index": 0, "message": "Grant name already exists!"},
+                    {"index": 2, "message": "Foundation ID Not found!"},
+                    {"index": 3, "message": "Grant name is repeated in the batch!"},
+                ],
+            }
+        }
+    }
+
+
+@pytest.fixture
+def upsert_grants_mutation_result(grant_model: Grant) -> dict:
+    return {
+        "data": {
+            "upsertGrants": {
+                "items": [
+                    {
+                        "name": grant_model.name,
+                        "amount": 20000,
+                        "location": "UpdatedLocation",
+                    },
+                    {
+                        "name": "NewGrant",
+                        "amount": 30000,
+                        "location": grant_model.location,
+                    },
+                ],
+                "errors": [],
+            }
+        }
+    }
+
+
+@pytest.fixture
+def delete_grants_mutation_result(grant_id: UUID) -> dict:
+    return {
+        "data": {
+            "deleteGrants": {
+                "items": [str(grant_id)],
+                "errors": [{"index": 1, "message": "Grant Not found!"}],
+            }
+        }
+    }
@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.foundation.models import Foundation
 from app.grant.models import Grant
+from app.grant_feedback.models import GrantFeedback
 from app.user.models import User
+from lib.response_cache import RESPONSE_CACHE
 
 pytestmark = pytest.mark.asyncio
 
@@ -54,6 +56,39 @@ async def test_update_grant(
     assert response.json() == update_grant_mutation_result
 
 
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_update_grant_invalidates_cached_query(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_by_id_query: str,
+    grant_by_id_query_result: dict,
+    update_grant_mutation: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    for _ in range(2):
+        response = await async_client.post(
+            "/graphql", json={"query": grant_by_id_query}, headers=auth_bearer_header
+        )
+        assert response.json() == grant_by_id_query_result
+    assert RESPONSE_CACHE.hits == 1
+
+    await async_client.post(
+        "/graphql", json={"query": update_grant_mutation}, headers=auth_bearer_header
+    )
+    response = await async_client.post(
+        "/graphql", json={"query": grant_by_id_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["grantById"]["name"] == "UpdatedGrant"
+
+
 @freeze_time("2024-11-05T12:00:00+00:00")
 async def test_delete_grant(
     async_db: AsyncSession,
@@ -74,3 +109,173 @@ async def test_delete_grant(
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == delete_grant_mutation_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_create_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    create_grants_mutation: str,
+    create_grants_mutation_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": create_grants_mutation}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == create_grants_mutation_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_upsert_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    upsert_grants_mutation: str,
+    upsert_grants_mutation_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": upsert_grants_mutation}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == upsert_grants_mutation_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_upsert_grants_keeps_seen_grants_out_of_matches(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    grant_matches_single_query: str,
+    upsert_grants_mutation: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, grant_feedback_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_matches_single_query},
+        headers=auth_bearer_header,
+    )
+    assert response.json()["data"]["grantMatches"]["total"] == 0
+
+    await async_client.post(
+        "/graphql", json={"query": upsert_grants_mutation}, headers=auth_bearer_header
+    )
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_matches_single_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    grant_matches: dict = response.json()["data"]["grantMatches"]
+    assert grant_matches["total"] == 1
+    assert [item["name"] for item in grant_matches["items"]] == ["NewGrant"]
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_delete_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    delete_grants_mutation: str,
+    delete_grants_mutation_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": delete_grants_mutation}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == delete_grants_mutation_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_grant_feedback_invalidates_cached_feedbacks(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_feedbacks_nested_query: str,
+    grant_feedback_mutation: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_feedbacks_nested_query},
+        headers=auth_bearer_header,
+    )
+    assert response.json()["data"]["grants"]["items"][0]["feedbacks"] == []
+
+    await async_client.post(
+        "/graphql", json={"query": grant_feedback_mutation}, headers=auth_bearer_header
+    )
+    # Requests share the test session, drop the feedbacks it already loaded.
+    async_db.expire_all()
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_feedbacks_nested_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["grants"]["items"][0]["feedbacks"] == [
+        {"reaction": "LIKE"}
+    ]
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_grant_feedback_keeps_cached_grants(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_by_id_query: str,
+    grant_by_id_query_result: dict,
+    grant_feedback_mutation: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    await async_client.post(
+        "/graphql", json={"query": grant_by_id_query}, headers=auth_bearer_header
+    )
+    await async_client.post(
+        "/graphql", json={"query": grant_feedback_mutation}, headers=auth_bearer_header
+    )
+    response = await async_client.post(
+        "/graphql", json={"query": grant_by_id_query}, headers=auth_bearer_header
+    )
+
+    assert response.json() == grant_by_id_query_result
+    assert RESPONSE_CACHE.hits == 1
@@ -1,13 +1,17 @@
+import hashlib
+
 import pytest
 from fastapi import status
 from freezegun import freeze_time
 from httpx import AsyncClient
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.foundation.models import Foundation
 from app.grant.models import Grant
 from app.grant_feedback.models import GrantFeedback
 from app.user.models import User
+from lib.response_cache import RESPONSE_CACHE
 
 pytestmark = pytest.mark.asyncio
 
@@ -34,6 +38,162 @@ async def test_get_grants(
     assert response.json() == grant_query_result
 
 
+async def test_get_grants_token_expired(
+    async_client: AsyncClient,
+    auth_bearer_header: dict,
+    grant_query: str,
+) -> None:
+    with freeze_time("2024-11-05T12:00:00+00:00"):
+        response = await async_client.post(
+            "/graphql", json={"query": grant_query}, headers=auth_bearer_header
+        )
+        assert "errors" not in response.json()
+
+    with freeze_time("2024-11-05T13:00:00+00:00"):
+        response = await async_client.post(
+            "/graphql", json={"query": grant_query}, headers=auth_bearer_header
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["errors"][0]["message"] == "User is not Authenticated"
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_persisted_query(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_query: str,
+    grant_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+    extensions: dict = {
+        "persistedQuery": {
+            "version": 1,
+            "sha256Hash": hashlib.sha256(grant_query.encode()).hexdigest(),
+        }
+    }
+
+    response = await async_client.post(
+        "/graphql", json={"extensions": extensions}, headers=auth_bearer_header
+    )
+    assert response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_query, "extensions": extensions},
+        headers=auth_bearer_header,
+    )
+    assert response.json() == grant_query_result
+
+    response = await async_client.post(
+        "/graphql", json={"extensions": extensions}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_search_ignore_case(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_ignore_case_search_query: str,
+    grant_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_ignore_case_search_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_search_similar(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_similar_search_query: str,
+    grant_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_similar_search_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_cursor(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_cursor_query: str,
+    grant_cursor_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": grant_cursor_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_cursor_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_after_cursor(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_after_cursor_query: str,
+    grant_after_cursor_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_after_cursor_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_after_cursor_query_result
+
+
 @freeze_time("2024-11-05T12:00:00+00:00")
 async def test_get_grant_by_id(
     async_db: AsyncSession,
@@ -78,6 +238,206 @@ async def test_get_grant_matches(
     assert response.json() == grant_matches_query_result
 
 
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grant_matches_excludes_seen(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    grant_matches_query: str,
+    grant_matches_excludes_seen_query_result: dict,
+) -> None:
+    async_db.add_all(
+        [
+            user_model,
+            foundation_model,
+            grant_model,
+            second_grant_model,
+            grant_feedback_model,
+        ]
+    )
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_matches_excludes_seen_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grant_matches_after_feedback(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_matches_query: str,
+    grant_feedback_mutation: str,
+    grant_matches_excludes_seen_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+    assert response.json()["data"]["grantMatches"]["total"] == 2
+
+    await async_client.post(
+        "/graphql", json={"query": grant_feedback_mutation}, headers=auth_bearer_header
+    )
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_matches_excludes_seen_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grant_matches_feedback_from_another_worker(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    grant_matches_query: str,
+    grant_matches_excludes_seen_query_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+    assert response.json()["data"]["grantMatches"]["total"] == 2
+
+    async_db.add(grant_feedback_model)
+    await async_db.commit()
+    # The other worker invalidates the shared response cache, not this feed.
+    await RESPONSE_CACHE.invalidate("grant_feedback")
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == grant_matches_excludes_seen_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grant_matches_past_window(
+    monkeypatch: pytest.MonkeyPatch,
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    auth_bearer_header: dict,
+    grant_matches_query: str,
+) -> None:
+    monkeypatch.setattr("app.grant.feed.GRANT_MATCH_FEED.window", 1)
+    async_db.add_all([user_model, foundation_model, grant_model, second_grant_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql", json={"query": grant_matches_query}, headers=auth_bearer_header
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    grant_matches: dict = response.json()["data"]["grantMatches"]
+    assert grant_matches["total"] == 2
+    assert [item["id"] for item in grant_matches["items"]] == [
+        str(grant_model.id),
+        str(second_grant_model.id),
+    ]
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grant_matches_before_cursor(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    third_grant_model: Grant,
+    auth_bearer_header: dict,
+    second_grant_cursor: str,
+    grant_matches_before_cursor_query: str,
+) -> None:
+    async_db.add_all(
+        [
+            user_model,
+            foundation_model,
+            grant_model,
+            second_grant_model,
+            third_grant_model,
+        ]
+    )
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_matches_before_cursor_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    grant_matches: dict = response.json()["data"]["grantMatches"]
+    assert grant_matches == {
+        "after": second_grant_cursor,
+        "before": second_grant_cursor,
+        "items": [{"name": "SecondTestGrant"}],
+    }
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_nested_feedbacks_selected_columns(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    grant_feedbacks_nested_query: str,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, grant_feedback_model])
+    await async_db.commit()
+    # Requests share the test session, forget what it already loaded.
+    async_db.expunge_all()
+    # The identity map is weak, hold on to what the request loads.
+    loaded: list = []
+    event.listen(
+        async_db.sync_session,
+        "loaded_as_persistent",
+        lambda _, instance: loaded.append(instance),
+    )
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_feedbacks_nested_query},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    [feedback] = [item for item in loaded if isinstance(item, GrantFeedback)]
+    assert {"comment", "user_id"} <= inspect(feedback).unloaded
+    assert "reaction" not in inspect(feedback).unloaded
+
+
 @freeze_time("2024-11-05T12:00:00+00:00")
 async def test_get_grant_opportunities(
     async_db: AsyncSession,
@@ -101,3 +461,44 @@ async def test_get_grant_opportunities(
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == grant_opportunities_query_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_get_grants_profile(
+    monkeypatch: pytest.MonkeyPatch,
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    grant_feedbacks_nested_query: str,
+) -> None:
+    monkeypatch.setattr("lib.profiling.GRAPHQL_PROFILING", "true")
+    async_db.add_all(
+        [
+            user_model,
+            foundation_model,
+            grant_model,
+            second_grant_model,
+            grant_feedback_model,
+        ]
+    )
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": grant_feedbacks_nested_query},
+        headers={**auth_bearer_header, "X-Debug-Profile": "1"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    profile: dict = response.json()["extensions"]["profile"]
+    assert profile["queries"] == 3
+    assert [
+        (resolver["path"], resolver["calls"], resolver["queries"], resolver["rows"])
+        for resolver in profile["resolvers"]
+    ] == [("grants", 1, 2, 3), ("grants.items.feedbacks", 2, 1, 1)]
+    assert profile["nPlusOne"] == []
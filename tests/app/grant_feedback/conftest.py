@@ -62,6 +62,31 @@ def create_grant_feedback_mutation(grant_feedback_model: GrantFeedback) -> str:
 """
 
 
+@pytest.fixture
+def create_grant_feedbacks_mutation(
+    grant_id: UUID, second_grant_id: UUID, foundation_id: UUID, user_id: UUID
+) -> str:
+    return f"""mutation CreateGrantFeedbacks {{
+    createGrantFeedbacks(grantFeedbackInputs: [
+        {{ grantId: "{grant_id}", userId: "{user_id}", reaction: LIKE }},
+        {{ grantId: "{second_grant_id}", userId: "{user_id}", reaction: DISLIKE }},
+        {{ grantId: "{second_grant_id}", userId: "{user_id}", reaction: LIKE }},
+        {{ grantId: "{foundation_id}", userId: "{user_id}", reaction: LIKE }}
+    ]) {{
+        items {{
+            grantId
+            userId
+            reaction
+        }}
+        errors {{
+            index
+            message
+        }}
+    }}
+}}
+"""
+
+
 @pytest.fixture
 def update_grant_feedback_mutation(
     grant_feedback_id: UUID, grant_id: UUID, user_id: UUID
@@ -150,6 +175,47 @@ def create_grant_feedback_mutation_result(
     }
 
 
+@pytest.fixture
+def create_grant_feedback_exists_error_result() -> dict:
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": "Grant feedback already exists!",
+                "locations": [{"line": 2, "column": 5}],
+                "path": ["createGrantFeedback"],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def create_grant_feedbacks_mutation_result(
+    second_grant_id: UUID, user_id: UUID
+) -> dict:
+    return {
+        "data": {
+            "createGrantFeedbacks": {
+                "items": [
+                    {
+                        "grantId": str(second_grant_id),
+                        "userId": str(user_id),
+                        "reaction": "DISLIKE",
+                    }
+                ],
+                "errors": [
+                    {"index": 0, "message": "Grant feedback already exists!"},
+                    {
+                        "index": 2,
+                        "message": "Grant feedback is repeated in the batch!",
+                    },
+                    {"index": 3, "message": "Grant ID Not found!"},
+                ],
+            }
+        }
+    }
+
+
 @pytest.fixture
 def update_grant_feedback_mutation_result(grant_id: UUID, user_id: UUID) -> dict:
     return {
@@ -36,6 +36,65 @@ async def test_create_grant_feedback(
     assert response.json() == create_grant_feedback_mutation_result
 
 
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_create_grant_feedback_exists_error(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    create_grant_feedback_mutation: str,
+    create_grant_feedback_exists_error_result: dict,
+) -> None:
+    async_db.add_all([user_model, foundation_model, grant_model, grant_feedback_model])
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": create_grant_feedback_mutation},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == create_grant_feedback_exists_error_result
+
+
+@freeze_time("2024-11-05T12:00:00+00:00")
+async def test_create_grant_feedbacks(
+    async_db: AsyncSession,
+    async_client: AsyncClient,
+    user_model: User,
+    foundation_model: Foundation,
+    grant_model: Grant,
+    second_grant_model: Grant,
+    grant_feedback_model: GrantFeedback,
+    auth_bearer_header: dict,
+    create_grant_feedbacks_mutation: str,
+    create_grant_feedbacks_mutation_result: dict,
+) -> None:
+    async_db.add_all(
+        [
+            user_model,
+            foundation_model,
+            grant_model,
+            second_grant_model,
+            grant_feedback_model,
+        ]
+    )
+    await async_db.commit()
+
+    response = await async_client.post(
+        "/graphql",
+        json={"query": create_grant_feedbacks_mutation},
+        headers=auth_bearer_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == create_grant_feedbacks_mutation_result
+
+
 @freeze_time("2024-11-05T12:00:00+00:00")
 async def test_update_grant_feedback(
     async_db: AsyncSession,
@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.fixture
+def metrics_operation_query() -> str:
+    return """query MetricsFoundations {
+    foundations(queryInput: { pagination: { page: 1, size: 10 } }) {
+        total
+    }
+}"""
+
+
+@pytest.fixture
+def metrics_samples() -> list[str]:
+    return [
+        'http_request_duration_seconds_count{method="POST",route="/auth/login",status="400"}',
+        'http_request_duration_seconds_count{method="POST",route="/graphql",status="200"}',
+        'graphql_operation_duration_seconds_count{operation="MetricsFoundations",type="query"}',
+        'db_pool_checked_out{pool="primary"}',
+        'db_pool_checkout_wait_seconds{pool="primary",quantile="0.95"}',
+        "password_hasher_queue_depth",
+        'cache_hit_ratio{cache="token"}',
+        'cache_hit_ratio{cache="persisted_queries"}',
+    ]
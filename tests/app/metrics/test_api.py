@@ -0,0 +1,26 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_metrics(
+    async_client: AsyncClient,
+    user_login_request: dict,
+    metrics_operation_query: str,
+    metrics_samples: list[str],
+) -> None:
+    await async_client.post("/auth/login", json=user_login_request)
+    await async_client.post("/graphql", json={"query": metrics_operation_query})
+
+    response = await async_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    samples: set[str] = {
+        line.rsplit(" ", 1)[0]
+        for line in response.text.splitlines()
+        if not line.startswith("#")
+    }
+    assert set(metrics_samples) <= samples
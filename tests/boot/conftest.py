@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from benchmarks.bench_import_time import import_times
+
+
+@pytest.fixture(scope="module")
+def app_import_times() -> dict[str, tuple[int, int]]:
+    return import_times()
+
+
+@pytest.fixture(scope="module")
+def app_import_time_runs(
+    app_import_times: dict[str, tuple[int, int]],
+) -> list[dict[str, tuple[int, int]]]:
+    return [app_import_times, import_times(), import_times()]
+
+
+@pytest.fixture
+def import_time_budget_ms() -> float:
+    return float(os.getenv("IMPORT_TIME_BUDGET_MS", "800"))
+
+
+@pytest.fixture
+def own_import_time_budget_ms() -> float:
+    return float(os.getenv("OWN_IMPORT_TIME_BUDGET_MS", "250"))
+
+
+@pytest.fixture
+def deferred_modules() -> list[str]:
+    return [
+        "alembic",
+        "app.graphql",
+        "fastapi_pagination",
+        "jose",
+        "lib.migrations",
+        "passlib",
+        "prometheus_client.multiprocess",
+        "redis",
+        "strawberry.fastapi",
+        "watchfiles",
+    ]
@@ -0,0 +1,29 @@
+import pytest
+import pytest_asyncio
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import DATABASE_URL
+from app.database import Base
+
+
+@pytest_asyncio.fixture(scope="function")
+async def migrations_engine():
+    engine = create_async_engine(url=DATABASE_URL, echo=False, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.exec_driver_sql("DROP TABLE IF EXISTS alembic_version")
+    await engine.dispose()
+
+
+@pytest.fixture
+def alembic_config() -> Config:
+    config = Config("alembic.ini")
+    config.attributes["configure_logger"] = False
+    return config
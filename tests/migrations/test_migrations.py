@@ -0,0 +1,158 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.database import Base
+from lib.migrations import create_index_concurrently, drop_index_concurrently
+
+pytestmark = pytest.mark.asyncio
+
+USER_ID: str = "8cd56e9c-6869-474f-8ee8-ba43efdfa260"
+FOUNDATION_ID: str = "3f0c5a4e-4b7d-4b8e-9a43-2a3c1f7e6d10"
+GRANT_ID: str = "6b1e2d3c-9f8a-4c7b-8e6d-5a4b3c2d1e0f"
+
+
+def run(connection: Connection, config: Config, *commands: tuple) -> None:
+    config.attributes["connection"] = connection
+    for name, revision in commands:
+        getattr(command, name)(config, revision)
+
+
+async def test_migrations_match_models(
+    migrations_engine: AsyncEngine, alembic_config: Config
+) -> None:
+    async with migrations_engine.connect() as conn:
+        await conn.run_sync(run, alembic_config, ("upgrade", "head"))
+
+        diff: list = await conn.run_sync(
+            lambda sync_conn: compare_metadata(
+                MigrationContext.configure(sync_conn), Base.metadata
+            )
+        )
+
+        assert diff == []
+
+        await conn.commit()
+        await conn.run_sync(run, alembic_config, ("downgrade", "base"))
+        tables: list[str] = (
+            (
+                await conn.execute(
+                    text(
+                        "SELECT tablename FROM pg_tables "
+                        "WHERE schemaname = 'public' AND tablename != 'alembic_version'"
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        assert tables == []
+
+
+async def test_migrations_deduplicate_grant_feedbacks(
+    migrations_engine: AsyncEngine, alembic_config: Config
+) -> None:
+    async with migrations_engine.connect() as conn:
+        await conn.run_sync(run, alembic_config, ("upgrade", "0001"))
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, name, email, password, created_at, updated_at) "
+                "VALUES (:user_id, 'Name', 'test@test.com', 'password', now(), now())"
+            ),
+            {"user_id": USER_ID},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO foundations (id, name, created_at, updated_at) "
+                "VALUES (:foundation_id, 'Foundation', now(), now())"
+            ),
+            {"foundation_id": FOUNDATION_ID},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO grants (id, foundation_id, name, amount, deadline, "
+                "location, created_at, updated_at) VALUES (:grant_id, "
+                ":foundation_id, 'Grant', 1, now(), 'Location', now(), now())"
+            ),
+            {"grant_id": GRANT_ID, "foundation_id": FOUNDATION_ID},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO grant_feedbacks (id, grant_id, user_id, reaction, "
+                "created_at, updated_at) VALUES (gen_random_uuid(), :grant_id, "
+                ":user_id, :reaction, now(), now() + :offset * interval '1 minute')"
+            ),
+            [
+                {
+                    "grant_id": GRANT_ID,
+                    "user_id": USER_ID,
+                    "reaction": reaction,
+                    "offset": offset,
+                }
+                for offset, reaction in enumerate(["LIKE", "DISLIKE", "LIKE"])
+            ],
+        )
+        await conn.commit()
+
+        await conn.run_sync(run, alembic_config, ("upgrade", "head"))
+        reactions: list[str] = (
+            (await conn.execute(text("SELECT reaction FROM grant_feedbacks")))
+            .scalars()
+            .all()
+        )
+
+        assert reactions == ["LIKE"]
+
+        await conn.commit()
+        await conn.run_sync(run, alembic_config, ("downgrade", "base"))
+        await conn.commit()
+
+
+async def test_create_index_concurrently(
+    migrations_engine: AsyncEngine, alembic_config: Config
+) -> None:
+    def create_index(sync_conn: Connection) -> None:
+        context = MigrationContext.configure(sync_conn)
+        with context.begin_transaction(), Operations.context(context):
+            create_index_concurrently("ix_grants_amount", "grants", ["amount"])
+
+    def drop_index(sync_conn: Connection) -> None:
+        context = MigrationContext.configure(sync_conn)
+        with context.begin_transaction(), Operations.context(context):
+            drop_index_concurrently("ix_grants_amount", "grants")
+
+    async with migrations_engine.connect() as conn:
+        await conn.run_sync(run, alembic_config, ("upgrade", "head"))
+        # What a concurrent build that failed halfway leaves behind.
+        await conn.exec_driver_sql("CREATE INDEX ix_grants_amount ON grants (amount)")
+        await conn.exec_driver_sql(
+            "UPDATE pg_index SET indisvalid = false "
+            "WHERE indexrelid = 'ix_grants_amount'::regclass"
+        )
+        await conn.commit()
+
+        await conn.run_sync(create_index)
+
+        assert await index_is_valid(conn, "ix_grants_amount") is True
+
+        await conn.commit()
+        await conn.run_sync(drop_index)
+
+        assert await index_is_valid(conn, "ix_grants_amount") is None
+
+        await conn.commit()
+        await conn.run_sync(run, alembic_config, ("downgrade", "base"))
+        await conn.commit()
+
+
+async def index_is_valid(conn: AsyncConnection, index_name: str) -> bool | None:
+    query: str = (
+        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index_name)"
+    )
+    return (await conn.execute(text(query), {"index_name": index_name})).scalar()